@@ -0,0 +1,116 @@
+"""
+Composición del fondo de la ventana principal
+
+BackgroundCompositor guarda el fondo (imagen, frame de GIF o de video) ya
+escalado al tamaño físico de la ventana y con la opacidad aplicada, en un
+único QPixmap. Solo se recompone si cambia la fuente, el tamaño, el
+devicePixelRatio o la opacidad; cada paintEvent copia sin escalar ni mezclar
+la parte expuesta, así las animaciones de hover y los timers no vuelven a
+escalar el fondo completo.
+
+Para fondos GIF cada frame se compone una sola vez: las composiciones se
+guardan por número de frame (hasta FRAME_CACHE_MB) y las vueltas siguientes
+del GIF solo eligen el pixmap ya listo.
+"""
+from typing import Dict, Optional, Union
+
+from PyQt5.QtCore import Qt, QRect, QRectF, QSize
+from PyQt5.QtGui import QImage, QPainter, QPixmap
+
+
+# Memoria para frames de GIF ya compuestos al tamaño de la ventana
+FRAME_CACHE_MB = 96
+
+
+class BackgroundCompositor:
+    """Fondo pre-escalado y con opacidad, cacheado por tamaño y DPR"""
+
+    def __init__(self, frame_cache_bytes: int = FRAME_CACHE_MB * 1024 * 1024):
+        self._source: Optional[Union[QPixmap, QImage]] = None
+        self._frame: Optional[int] = None
+        self._cache: Optional[QPixmap] = None
+        self._cache_key = None
+        self.rebuilds = 0
+        # Frames compuestos para la clave actual (tamaño, DPR, opacidad)
+        self.frame_cache_bytes = frame_cache_bytes
+        self._frames: Dict[int, QPixmap] = {}
+        self._frames_key = None
+        self._frames_used = 0
+
+    def has_source(self) -> bool:
+        return self._source is not None
+
+    def set_source(self, source: Optional[Union[QPixmap, QImage]], frame: Optional[int] = None) -> None:
+        """
+        Nueva imagen de fondo; la composición se rehace en el próximo pintado
+
+        Args:
+            frame: Número de frame de un GIF; su composición se reutiliza en las siguientes vueltas
+        """
+        self._source = source if source is not None and not source.isNull() else None
+        self._frame = frame
+        self._cache_key = None
+
+    def clear(self) -> None:
+        """Quita el fondo y libera la composición (y los frames guardados)"""
+        self._source = None
+        self._frame = None
+        self._cache = None
+        self._cache_key = None
+        self._drop_frames()
+
+    def _drop_frames(self) -> None:
+        self._frames = {}
+        self._frames_key = None
+        self._frames_used = 0
+
+    def pixmap(self, size: QSize, dpr: float, opacity: float) -> Optional[QPixmap]:
+        """Fondo compuesto para una ventana de `size` lógico (None si no hay fuente)"""
+        key = (size.width(), size.height(), round(dpr, 2), round(opacity, 3))
+        if self._cache is not None and key == self._cache_key:
+            return self._cache
+        if key != self._frames_key:
+            # Otro tamaño u opacidad: los frames guardados ya no sirven
+            self._drop_frames()
+            self._frames_key = key
+        composed = self._frames.get(self._frame) if self._frame is not None else None
+        if composed is None:
+            if self._source is None:
+                return None
+            composed = self._compose(size, dpr, opacity)
+            self.rebuilds += 1
+            if self._frame is not None:
+                cost = composed.width() * composed.height() * composed.depth() // 8
+                if self._frames_used + cost <= self.frame_cache_bytes:
+                    self._frames[self._frame] = composed
+                    self._frames_used += cost
+        self._cache = composed
+        self._cache_key = key
+        return composed
+
+    def paint(self, painter: QPainter, rect: QRect, size: QSize, dpr: float, opacity: float) -> None:
+        """Dibuja solo la región `rect` (coordenadas lógicas) del fondo compuesto"""
+        composed = self.pixmap(size, dpr, opacity)
+        if composed is None:
+            return
+        source = QRectF(rect.x() * dpr, rect.y() * dpr, rect.width() * dpr, rect.height() * dpr)
+        painter.drawPixmap(QRectF(rect), composed, source)
+
+    def _compose(self, size: QSize, dpr: float, opacity: float) -> QPixmap:
+        width = max(1, round(size.width() * dpr))
+        height = max(1, round(size.height() * dpr))
+        source = self._source
+        if source.width() != width or source.height() != height:
+            source = source.scaled(width, height, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+        composed = QPixmap(width, height)
+        composed.fill(Qt.transparent)
+        painter = QPainter(composed)
+        painter.setOpacity(opacity)
+        # Anclado arriba a la izquierda, como el fondo se dibujó siempre
+        if isinstance(source, QImage):
+            painter.drawImage(0, 0, source)
+        else:
+            painter.drawPixmap(0, 0, source)
+        painter.end()
+        composed.setDevicePixelRatio(dpr)
+        return composed
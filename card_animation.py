@@ -0,0 +1,102 @@
+"""
+Animaciones de entrada de las tarjetas
+
+CardAnimator da el fade-in solo a las tarjetas nuevas que se ven en el
+viewport, con un escalonado total acotado y un máximo de efectos de opacidad
+simultáneos. Las tarjetas fuera de pantalla se muestran sin efecto (un
+QGraphicsOpacityEffect obliga a pintar en un buffer aparte), y cada
+animación pertenece a su tarjeta, así que muere con ella; además se borra sola
+al terminar y una tarjeta reciclada nunca tiene dos fades a la vez.
+"""
+from typing import Dict, Iterable
+
+from PyQt5.QtCore import QObject, QAbstractAnimation, QPropertyAnimation, QSequentialAnimationGroup, QEasingCurve
+from PyQt5.QtWidgets import QGraphicsOpacityEffect, QWidget
+
+
+FADE_DURATION_MS = 500
+# Retraso entre tarjetas consecutivas y tope del escalonado completo
+STAGGER_MS = 50
+MAX_STAGGER_MS = 400
+# Efectos de opacidad vivos a la vez
+MAX_CONCURRENT = 12
+
+
+class CardAnimator(QObject):
+    """Planificador de fade-in de tarjetas con presupuesto"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._running: Dict[int, tuple] = {}  # id(tarjeta) -> (grupo, tarjeta)
+        self._watched = set()  # Tarjetas con destroyed ya conectado
+
+    def running(self) -> int:
+        return len(self._running)
+
+    def animate(self, cards: Iterable[QWidget]) -> int:
+        """
+        Anima las tarjetas indicadas (ya filtradas por visibilidad) en orden
+
+        Las que exceden el cupo de efectos simultáneos se muestran directamente.
+
+        Returns:
+            Cantidad de tarjetas animadas
+        """
+        slots = MAX_CONCURRENT - len(self._running)
+        started = 0
+        for card in cards:
+            if started >= slots:
+                break
+            self._fade_in(card, min(started * STAGGER_MS, MAX_STAGGER_MS))
+            started += 1
+        return started
+
+    def cancel_all(self) -> None:
+        """Detiene todas las animaciones (p. ej. al vaciar el grid); las tarjetas quedan opacas"""
+        running, self._running = self._running, {}
+        for group, card in running.values():
+            try:
+                group.stop()
+                card.setGraphicsEffect(None)
+            except RuntimeError:
+                pass  # La tarjeta (y su animación) ya fue eliminada
+
+    def _fade_in(self, card: QWidget, delay: int) -> None:
+        key = id(card)
+        previous = self._running.pop(key, None)
+        if previous is not None:
+            # Tarjeta reciclada que vuelve a entrar: el fade anterior no debe terminar sobre el nuevo
+            previous[0].stop()
+        effect = QGraphicsOpacityEffect(card)
+        effect.setOpacity(0.0)
+        card.setGraphicsEffect(effect)
+        fade = QPropertyAnimation(effect, b"opacity")
+        fade.setDuration(FADE_DURATION_MS)
+        fade.setStartValue(0.0)
+        fade.setEndValue(1.0)
+        fade.setEasingCurve(QEasingCurve.OutCubic)
+        # El grupo es hijo de la tarjeta: si se destruye la tarjeta, se destruye la animación
+        group = QSequentialAnimationGroup(card)
+        if delay:
+            group.addPause(delay)
+        group.addAnimation(fade)
+        self._running[key] = (group, card)
+
+        def finished():
+            if self._running.get(key, (None,))[0] is group:
+                del self._running[key]
+            try:
+                # Quitar el efecto para no pintar en buffer aparte (ni interferir con el hover)
+                if card.graphicsEffect() is effect:
+                    card.setGraphicsEffect(None)
+            except RuntimeError:
+                pass  # La tarjeta ya fue eliminada
+        group.finished.connect(finished)
+        if key not in self._watched:
+            self._watched.add(key)
+            card.destroyed.connect(lambda *_: self._forget(key))
+        group.start(QAbstractAnimation.DeleteWhenStopped)
+
+    def _forget(self, key: int) -> None:
+        self._watched.discard(key)
+        self._running.pop(key, None)
@@ -0,0 +1,197 @@
+"""
+Layout de flujo de las tarjetas
+
+CardFlowLayout coloca cada tarjeta en una posición lógica (slot) y calcula
+las columnas a partir del ancho disponible, así la ventana puede cambiar de
+tamaño y las tarjetas ya creadas solo se mueven, sin recrearse ni pasar por
+el render. Todas las celdas miden lo mismo, de modo que la geometría de cada
+slot sale de una división; las posiciones se cachean por (columnas, origen)
+y un resize que no cambia el número de columnas no toca ningún widget.
+"""
+from typing import Dict, List, Optional
+
+from PyQt5.QtCore import QPoint, QRect, QSize, Qt
+from PyQt5.QtWidgets import QLayout, QLayoutItem, QWidget, QWidgetItem
+
+
+class _Entry:
+    __slots__ = ('item', 'slot', 'full_row', 'rect')
+
+    def __init__(self, item: QLayoutItem, slot: int, full_row: bool):
+        self.item = item
+        self.slot = slot
+        self.full_row = full_row
+        self.rect: Optional[QRect] = None  # Última geometría aplicada
+
+
+class CardFlowLayout(QLayout):
+    """Grid de celdas iguales cuyo número de columnas depende del ancho"""
+
+    def __init__(self, parent: Optional[QWidget] = None,
+                 cell: QSize = QSize(320, 300), max_columns: int = 0):
+        super().__init__(parent)
+        self._entries: List[_Entry] = []
+        self._by_widget: Dict[int, _Entry] = {}
+        self._cell = QSize(cell)
+        self._max_columns = max_columns
+        self._slot_count = 0
+        self._full_rows: List[_Entry] = []
+        self._hfw: Dict[int, int] = {}
+        self._placed = None  # (columnas, origen) de la última colocación
+
+    # --- Configuración ---
+
+    def set_cell(self, cell: QSize, max_columns: int = 0) -> None:
+        """Tamaño de celda y tope de columnas (0 = las que quepan; 1 = lista)"""
+        if cell == self._cell and max_columns == self._max_columns:
+            return
+        self._cell = QSize(cell)
+        self._max_columns = max_columns
+        self._changed()
+
+    def cell(self) -> QSize:
+        return QSize(self._cell)
+
+    def columns_for(self, width: int) -> int:
+        """Columnas que caben en `width` (ancho total, márgenes incluidos)"""
+        m = self.contentsMargins()
+        space = self.spacing()
+        available = width - m.left() - m.right()
+        columns = max(1, (available + space) // (self._cell.width() + space))
+        if self._max_columns:
+            columns = min(columns, self._max_columns)
+        return columns
+
+    def columns(self) -> int:
+        """Columnas con el ancho actual del layout"""
+        return self.columns_for(self.geometry().width())
+
+    # --- Tarjetas ---
+
+    def add_widget(self, widget: QWidget, slot: int, full_row: bool = False) -> None:
+        """
+        Agrega un widget en la posición lógica `slot`
+
+        Args:
+            full_row: ocupa toda la fila del slot (p. ej. el mensaje de biblioteca vacía)
+        """
+        self.addChildWidget(widget)
+        entry = _Entry(QWidgetItem(widget), slot, full_row)
+        self._entries.append(entry)
+        self._by_widget[id(widget)] = entry
+        self._changed()
+
+    def move_widget(self, widget: QWidget, slot: int) -> None:
+        """Cambia la posición lógica de un widget ya agregado"""
+        entry = self._by_widget.get(id(widget))
+        if entry is not None and entry.slot != slot:
+            entry.slot = slot
+            self._changed()
+
+    def slot_rect(self, slot: int, columns: Optional[int] = None) -> QRect:
+        """Geometría de la celda de un slot con la geometría actual"""
+        rect = self.contentsRect()
+        columns = columns or self.columns_for(self.geometry().width())
+        row, column = divmod(slot, columns)
+        space = self.spacing()
+        return QRect(rect.x() + column * (self._cell.width() + space),
+                     rect.y() + row * (self._cell.height() + space),
+                     self._cell.width(), self._cell.height())
+
+    def _changed(self) -> None:
+        self._slot_count = max((e.slot for e in self._entries), default=-1) + 1
+        self._full_rows = [e for e in self._entries if e.full_row]
+        self._hfw.clear()
+        self.invalidate()
+
+    # --- API de QLayout ---
+
+    def addItem(self, item: QLayoutItem) -> None:
+        # addWidget() sin slot: al final
+        entry = _Entry(item, self._slot_count, False)
+        self._entries.append(entry)
+        if item.widget() is not None:
+            self._by_widget[id(item.widget())] = entry
+        self._changed()
+
+    def count(self) -> int:
+        return len(self._entries)
+
+    def itemAt(self, index: int) -> Optional[QLayoutItem]:
+        if 0 <= index < len(self._entries):
+            return self._entries[index].item
+        return None
+
+    def takeAt(self, index: int) -> Optional[QLayoutItem]:
+        if not 0 <= index < len(self._entries):
+            return None
+        entry = self._entries.pop(index)
+        if entry.item.widget() is not None:
+            self._by_widget.pop(id(entry.item.widget()), None)
+        self._changed()
+        return entry.item
+
+    def invalidate(self) -> None:
+        self._placed = None
+        super().invalidate()
+
+    def expandingDirections(self):
+        return Qt.Orientations(0)
+
+    def hasHeightForWidth(self) -> bool:
+        return True
+
+    def heightForWidth(self, width: int) -> int:
+        height = self._hfw.get(width)
+        if height is None:
+            height = self._content_height(self.columns_for(width), width)
+            self._hfw[width] = height
+        return height
+
+    def minimumSize(self) -> QSize:
+        m = self.contentsMargins()
+        return QSize(self._cell.width() + m.left() + m.right(),
+                     self._cell.height() + m.top() + m.bottom())
+
+    def sizeHint(self) -> QSize:
+        return self.minimumSize()
+
+    def setGeometry(self, rect: QRect) -> None:
+        super().setGeometry(rect)
+        columns = self.columns_for(rect.width())
+        placed = (columns, rect.topLeft())
+        # Mismas columnas y origen: las celdas no se movieron, solo las filas completas cambian de ancho
+        entries = self._full_rows if placed == self._placed else self._entries
+        self._placed = placed
+        for entry in entries:
+            if entry.item.isEmpty():
+                # Widget oculto: Qt ignora la geometría, se aplica cuando vuelva a mostrarse
+                entry.rect = None
+                continue
+            target = self._entry_rect(entry, columns)
+            if target != entry.rect:
+                entry.item.setGeometry(target)
+                entry.rect = target
+
+    # --- Cálculo de geometría ---
+
+    def _entry_rect(self, entry: _Entry, columns: int) -> QRect:
+        cell = self.slot_rect(entry.slot, columns)
+        if not entry.full_row:
+            return cell
+        width = self.contentsRect().width()
+        height = entry.item.heightForWidth(width) if entry.item.hasHeightForWidth() else -1
+        height = max(height, entry.item.sizeHint().height())
+        return QRect(QPoint(self.contentsRect().x(), cell.y()), QSize(width, height))
+
+    def _content_height(self, columns: int, width: int) -> int:
+        m = self.contentsMargins()
+        rows = -(-self._slot_count // columns)
+        height = max(0, rows * (self._cell.height() + self.spacing()) - self.spacing())
+        inner = width - m.left() - m.right()
+        for entry in self._full_rows:
+            item_h = entry.item.heightForWidth(inner) if entry.item.hasHeightForWidth() else -1
+            item_h = max(item_h, entry.item.sizeHint().height())
+            top = (entry.slot // columns) * (self._cell.height() + self.spacing())
+            height = max(height, top + item_h)
+        return height + m.top() + m.bottom()
@@ -0,0 +1,73 @@
+"""
+Pool de tarjetas reutilizables
+
+Al cambiar de carpeta, orden o búsqueda, las tarjetas que salen del grid se
+guardan ocultas (con su contenedor) en lugar de destruirse, y las que entran
+se toman del pool y se re-enlazan al juego nuevo con GameCard.bind. El pool
+se dimensiona al área visible más un margen y se vacía solo tras un rato sin
+uso, para no retener memoria de más.
+"""
+from typing import Dict, List, Optional, Tuple
+
+from PyQt5.QtCore import QObject, QTimer
+from PyQt5.QtWidgets import QWidget
+
+
+# Tras cuánto tiempo sin uso se liberan las tarjetas guardadas
+POOL_IDLE_MS = 30000
+
+
+class CardPool(QObject):
+    """Tarjetas ocultas (contenedor, tarjeta) separadas por modo grid/lista"""
+
+    def __init__(self, parent=None, idle_ms: int = POOL_IDLE_MS):
+        super().__init__(parent)
+        self.capacity = 0
+        self._free: Dict[bool, List[Tuple[QWidget, QWidget]]] = {False: [], True: []}
+        self.hits = 0
+        self.misses = 0
+        self._idle_timer = QTimer(self)
+        self._idle_timer.setSingleShot(True)
+        self._idle_timer.setInterval(idle_ms)
+        self._idle_timer.timeout.connect(self.clear)
+
+    def __len__(self) -> int:
+        return len(self._free[False]) + len(self._free[True])
+
+    def set_capacity(self, capacity: int) -> None:
+        """Máximo de tarjetas guardadas por modo (las que sobran se destruyen)"""
+        self.capacity = max(0, capacity)
+        for free in self._free.values():
+            while len(free) > self.capacity:
+                widget, _ = free.pop()
+                widget.deleteLater()
+
+    def acquire(self, list_mode: bool) -> Optional[Tuple[QWidget, QWidget]]:
+        """Una tarjeta guardada del modo pedido, o None si no hay"""
+        free = self._free[list_mode]
+        if not free:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._idle_timer.start()
+        return free.pop()
+
+    def release(self, list_mode: bool, widget: QWidget, card: QWidget) -> None:
+        """Guarda una tarjeta que salió del grid (ya quitada del layout) o la destruye si el pool está lleno"""
+        free = self._free[list_mode]
+        if len(free) >= self.capacity:
+            widget.deleteLater()
+            return
+        # Sin cargas de imagen pendientes mientras espera en el pool
+        card.unbind()
+        widget.hide()
+        free.append((widget, card))
+        self._idle_timer.start()
+
+    def clear(self) -> None:
+        """Destruye todas las tarjetas guardadas (pool inactivo o cambio de tema)"""
+        self._idle_timer.stop()
+        for free in self._free.values():
+            for widget, _ in free:
+                widget.deleteLater()
+            free.clear()
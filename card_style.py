@@ -0,0 +1,138 @@
+"""
+Estilo compartido de las tarjetas de juego
+
+CardTheme compila una sola vez por tema la hoja de estilo de todas las
+tarjetas (se aplica al contenedor del grid, no a cada GameCard) y guarda las
+fuentes ya creadas. Las tarjetas solo fijan objectName y propiedades
+dinámicas (p. ej. platform="steam" en las insignias), así Qt parsea el QSS
+una vez y cada tarjeta nueva solo se pule contra reglas ya compiladas.
+"""
+from typing import Dict, Optional
+
+from PyQt5.QtGui import QFont
+
+
+# Valores por defecto de GameCard._custom_colors
+CARD_DEFAULTS = {
+    'card_bg': '#1a1f2e',
+    'card_border': 'transparent',
+    'card_hover_border': '#667eea',
+    'card_hover_bg': '#252d3d',
+    'text_primary': '#e8eaed',
+    'text_secondary': '#9aa0a6',
+    'accent_start': '#667eea',
+    'accent_end': '#764ba2',
+    'card_radius': 12,
+    'border_width': 2,
+    'button_radius': 8,
+    'font_family': 'Segoe UI',
+    'card_title_size': 15,
+    'secondary_size': 12,
+}
+
+
+class CardTheme:
+    """Hoja de estilo y fuentes de las tarjetas para un conjunto de colores del tema"""
+    _current: Optional['CardTheme'] = None
+
+    def __init__(self, colors: Dict):
+        self.source = dict(colors or {})
+        self.colors = dict(CARD_DEFAULTS)
+        self.colors.update({k: v for k, v in (colors or {}).items() if v is not None})
+        self.stylesheet = self._build_stylesheet()
+        self._fonts: Dict[tuple, QFont] = {}
+
+    @classmethod
+    def for_colors(cls, colors: Dict) -> 'CardTheme':
+        """Tema compartido; solo se recompila si los colores cambiaron"""
+        current = cls._current
+        if current is None or current.source != (colors or {}):
+            current = cls(colors)
+            cls._current = current
+        return current
+
+    def font(self, role: str, list_mode: bool = False) -> QFont:
+        """
+        Fuente cacheada de un elemento de la tarjeta
+
+        Args:
+            role: 'title', 'path' o 'playtime'
+        """
+        key = (role, list_mode)
+        font = self._fonts.get(key)
+        if font is None:
+            c = self.colors
+            if role == 'title':
+                font = QFont(c['font_family'], c['card_title_size'] + (6 if list_mode else 0), QFont.Bold)
+            else:
+                font = QFont(c['font_family'], c['secondary_size'] - (0 if list_mode else 1))
+            self._fonts[key] = font
+        return font
+
+    def _build_stylesheet(self) -> str:
+        c = self.colors
+        return f"""
+            GameCard {{
+                background-color: {c['card_bg']};
+                border-radius: {c['card_radius']}px;
+                border: {c['border_width']}px solid {c['card_border']};
+                font-family: {c['font_family']};
+            }}
+            GameCard:hover {{
+                border: {c['border_width']}px solid {c['card_hover_border']};
+                background-color: {c['card_hover_bg']};
+            }}
+            QLabel#cardCover {{
+                background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
+                    stop:0 {c['accent_start']}, stop:1 {c['accent_end']});
+                font-size: 48px;
+            }}
+            QPushButton#cardFavorite {{
+                background-color: rgba(0, 0, 0, 200);
+                border: none;
+                border-radius: 20px;
+                font-size: 20px;
+                color: #FFD700;
+                font-weight: bold;
+            }}
+            QPushButton#cardFavorite:hover {{
+                background-color: rgba(0, 0, 0, 240);
+            }}
+            QPushButton#cardFavorite:pressed {{
+                background-color: rgba(0, 0, 0, 180);
+            }}
+            QWidget#cardContent {{
+                background-color: {c['card_bg']};
+            }}
+            QLabel#cardIcon {{
+                background-color: {c['card_hover_bg']};
+                border-radius: {c['button_radius']}px;
+                font-size: 24px;
+            }}
+            QLabel#cardTitle {{
+                color: {c['text_primary']};
+            }}
+            QLabel#cardPath, QLabel#cardPlaytime {{
+                color: {c['text_secondary']};
+            }}
+            QLabel#cardBadge {{
+                border-radius: 6px;
+                padding: 3px 6px;
+                font-weight: 700;
+                font-size: 11px;
+            }}
+            GameCard[listMode="true"] QLabel#cardBadge {{
+                padding: 4px 8px;
+                font-size: 12px;
+            }}
+            QLabel#cardBadge[platform="steam"] {{
+                color: #cfe6ff;
+                background-color: #1b2838;
+                border: 1px solid #2a475e;
+            }}
+            QLabel#cardBadge[platform="epic"] {{
+                color: #ffffff;
+                background-color: #1a1a1a;
+                border: 1px solid #2d2d2d;
+            }}
+        """
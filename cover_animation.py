@@ -0,0 +1,318 @@
+"""
+Portadas GIF animadas de las tarjetas
+
+AnimatedCovers reemplaza el QMovie por tarjeta: cada GIF se decodifica una
+sola vez en un hilo, con todos sus frames ya escalados (y recortados) al
+tamaño de la portada, y los comparten todas las tarjetas que muestran el
+mismo archivo. Un único timer avanza los clips que tienen alguna portada
+realmente visible en el viewport; el resto queda quieto. Los frames de todos
+los clips respetan un presupuesto global de memoria: si un GIF no entra, se
+muestra solo su primer frame. Con la aplicación inactiva todas las portadas
+vuelven al primer frame y el timer se detiene.
+"""
+import bisect
+import itertools
+import os
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from PyQt5.QtCore import Qt, QObject, QRunnable, QThreadPool, QSize, QTimer, pyqtSignal
+from PyQt5.QtGui import QImageReader, QPixmap
+from PyQt5.QtWidgets import QApplication, QLabel
+
+
+# Memoria total de frames decodificados de todos los GIF
+GIF_FRAME_BUDGET_MB = 96
+# Delay usado para frames sin delay o con delays absurdamente cortos (como los navegadores)
+DEFAULT_FRAME_DELAY_MS = 100
+MIN_FRAME_DELAY_MS = 20
+
+
+class _Clip:
+    """Frames de un GIF a un tamaño, compartidos por todas sus portadas"""
+    __slots__ = ('key', 'frames', 'ends', 'cost', 'labels', 'visible', 'started', 'shown')
+
+    def __init__(self, key):
+        self.key = key
+        self.frames: Optional[List[QPixmap]] = None  # None mientras se decodifica
+        self.ends: List[int] = []  # Fin acumulado (ms) de cada frame
+        self.cost = 0
+        self.labels: Dict[int, QLabel] = {}
+        self.visible = set()
+        self.started = 0.0
+        self.shown = 0
+
+    def frame_at(self, now: float) -> int:
+        if len(self.frames) < 2:
+            return 0
+        elapsed = int((now - self.started) * 1000) % self.ends[-1]
+        return bisect.bisect_right(self.ends, elapsed)
+
+    def next_change_ms(self, now: float) -> int:
+        elapsed = int((now - self.started) * 1000) % self.ends[-1]
+        return self.ends[bisect.bisect_right(self.ends, elapsed)] - elapsed
+
+
+class _FramesSignals(QObject):
+    finished = pyqtSignal(object, object, object)  # clave, [QImage], [delay ms]
+
+
+class _FramesTask(QRunnable):
+    def __init__(self, key, path, size, max_bytes, signals):
+        super().__init__()
+        self.key = key
+        self.path = path
+        self.size = size
+        self.max_bytes = max_bytes
+        self.signals = signals
+
+    def run(self):
+        images, delays = [], []
+        try:
+            reader = QImageReader(self.path)
+            source = reader.size()
+            width, height = self.size.width(), self.size.height()
+            if source.isValid():
+                reader.setScaledSize(source.scaled(width, height, Qt.KeepAspectRatioByExpanding))
+            used = 0
+            while True:
+                image = reader.read()
+                if image.isNull():
+                    break
+                if image.width() > width or image.height() > height:
+                    # Recorte centrado, igual que las portadas estáticas
+                    x = max(0, (image.width() - width) // 2)
+                    y = max(0, (image.height() - height) // 2)
+                    image = image.copy(x, y, min(width, image.width()), min(height, image.height()))
+                used += image.sizeInBytes()
+                if images and used > self.max_bytes:
+                    # No entra en el presupuesto: quedarse solo con el primer frame
+                    del images[1:], delays[1:]
+                    break
+                images.append(image)
+                delay = reader.nextImageDelay()
+                delays.append(delay if delay >= MIN_FRAME_DELAY_MS else DEFAULT_FRAME_DELAY_MS)
+                if not reader.canRead():
+                    break
+        except Exception as e:
+            print(f'Error decodificando GIF {self.path}: {e}')
+        self.signals.finished.emit(self.key, images, delays)
+
+
+class AnimatedCovers(QObject):
+    """Reproductor compartido de portadas GIF"""
+    _instance = None
+
+    def __init__(self, parent=None, budget_bytes: int = GIF_FRAME_BUDGET_MB * 1024 * 1024):
+        super().__init__(parent)
+        self.budget = budget_bytes
+        self.used = 0
+        self._clips: 'OrderedDict[tuple, _Clip]' = OrderedDict()
+        self._labels: Dict[int, _Clip] = {}
+        self._watched = set()  # Labels con destroyed ya conectado
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self._signals = _FramesSignals()
+        self._signals.finished.connect(self._on_decoded)
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._tick)
+        # Revisión de visibilidad agrupada (scroll, resize, tarjetas nuevas)
+        self._visibility_timer = QTimer(self)
+        self._visibility_timer.setSingleShot(True)
+        self._visibility_timer.setInterval(0)
+        self._visibility_timer.timeout.connect(self.update_visibility)
+        app = QApplication.instance()
+        self.active = app is None or app.applicationState() == Qt.ApplicationActive
+        if app is not None:
+            app.applicationStateChanged.connect(
+                lambda state: self.set_active(state == Qt.ApplicationActive))
+
+    @classmethod
+    def instance(cls) -> 'AnimatedCovers':
+        """Servicio compartido por toda la aplicación (requiere QApplication)"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    # --- Portadas ---
+
+    def attach(self, label: QLabel, path: str, size: QSize, dpr: float = 1.0) -> None:
+        """Muestra el GIF `path` en `label` (tamaño lógico `size`); reemplaza lo que tuviera"""
+        self.detach(label)
+        try:
+            mtime = os.path.getmtime(path)
+        except OSError:
+            return
+        physical = QSize(max(1, round(size.width() * dpr)), max(1, round(size.height() * dpr)))
+        key = (path, mtime, physical.width(), physical.height(), round(dpr, 2))
+        clip = self._clips.get(key)
+        if clip is None:
+            clip = _Clip(key)
+            self._clips[key] = clip
+            self.pool.start(_FramesTask(key, path, physical, self.budget // 2, self._signals))
+        else:
+            self._clips.move_to_end(key)
+        label_id = id(label)
+        clip.labels[label_id] = label
+        self._labels[label_id] = clip
+        if label_id not in self._watched:
+            self._watched.add(label_id)
+            label.destroyed.connect(lambda *_, i=label_id: self._destroyed(i))
+        if clip.frames:
+            if not clip.visible:
+                clip.shown = 0
+            self._show(label, clip, clip.shown)
+        self.schedule_visibility()
+
+    def detach(self, label: QLabel) -> None:
+        """Deja de animar `label` (p. ej. al re-enlazar la tarjeta a otro juego)"""
+        self._forget(id(label))
+
+    def _destroyed(self, label_id: int) -> None:
+        self._watched.discard(label_id)
+        self._forget(label_id)
+
+    def _forget(self, label_id: int) -> None:
+        clip = self._labels.pop(label_id, None)
+        if clip is None:
+            return
+        clip.labels.pop(label_id, None)
+        clip.visible.discard(label_id)
+
+    # --- Reproducción ---
+
+    def schedule_visibility(self) -> None:
+        """Pide revisar qué portadas se ven (se agrupa en una sola pasada)"""
+        if self._labels:
+            self._visibility_timer.start()
+
+    def update_visibility(self) -> None:
+        """Recalcula qué portadas intersectan de verdad el viewport y arranca o detiene el timer"""
+        for clip in self._clips.values():
+            visible = set()
+            for label_id, label in clip.labels.items():
+                try:
+                    if label.isVisible() and not label.visibleRegion().isEmpty():
+                        visible.add(label_id)
+                except RuntimeError:
+                    pass  # Destruido; destroyed limpia la entrada
+            if not clip.frames:
+                # Aún decodificando: se muestra al terminar
+                clip.visible = visible
+                continue
+            if visible and not clip.visible and len(clip.frames) > 1:
+                # Vuelve a verse: retoma desde el frame en que quedó
+                clip.started = time.perf_counter() - (clip.ends[clip.shown - 1] if clip.shown else 0) / 1000
+            for label_id in visible - clip.visible:
+                # Las que se pausaron fuera de pantalla pueden tener otro frame
+                self._show(clip.labels[label_id], clip, clip.shown)
+            clip.visible = visible
+        self._schedule()
+
+    def set_active(self, active: bool) -> None:
+        """Con la aplicación inactiva, todas las portadas quedan en su primer frame"""
+        if active == self.active:
+            return
+        self.active = active
+        now = time.perf_counter()
+        for clip in self._clips.values():
+            if not clip.frames:
+                continue
+            clip.started = now
+            if clip.shown != 0:
+                clip.shown = 0
+                for label in clip.labels.values():
+                    self._show(label, clip, 0)
+        self._schedule()
+
+    def _schedule(self) -> None:
+        if not self.active:
+            self._timer.stop()
+            return
+        now = time.perf_counter()
+        waits = [clip.next_change_ms(now) for clip in self._clips.values()
+                 if clip.visible and clip.frames and len(clip.frames) > 1]
+        if waits:
+            self._timer.start(max(1, min(waits)))
+        else:
+            self._timer.stop()
+
+    def _tick(self) -> None:
+        now = time.perf_counter()
+        for clip in self._clips.values():
+            if not clip.visible or not clip.frames or len(clip.frames) < 2:
+                continue
+            index = clip.frame_at(now)
+            if index != clip.shown:
+                clip.shown = index
+                for label_id in clip.visible:
+                    self._show(clip.labels[label_id], clip, index)
+        self._schedule()
+
+    @staticmethod
+    def _show(label: QLabel, clip: _Clip, index: int) -> None:
+        try:
+            label.setPixmap(clip.frames[index])
+        except RuntimeError:
+            pass
+
+    # --- Memoria ---
+
+    def _on_decoded(self, key, images, delays):
+        clip = self._clips.get(key)
+        if clip is None:
+            return
+        if not images:
+            # GIF ilegible: la tarjeta queda con su placeholder y sus labels dejan de apuntar al clip
+            self._clips.pop(key, None)
+            for label_id in clip.labels:
+                self._labels.pop(label_id, None)
+            return
+        dpr = key[4]
+        frames = []
+        for image in images:
+            pixmap = QPixmap.fromImage(image)
+            pixmap.setDevicePixelRatio(dpr)
+            frames.append(pixmap)
+        cost = sum(image.sizeInBytes() for image in images)
+        self._evict(cost)
+        if self.used + cost > self.budget:
+            # Sin lugar para la animación completa: solo el primer frame
+            frames, delays = frames[:1], delays[:1]
+            cost = images[0].sizeInBytes()
+        clip.frames = frames
+        clip.ends = list(itertools.accumulate(delays))
+        clip.cost = cost
+        clip.started = time.perf_counter()
+        clip.shown = 0
+        self.used += cost
+        for label in clip.labels.values():
+            self._show(label, clip, 0)
+        self.update_visibility()
+
+    def _evict(self, needed: int) -> None:
+        """Libera clips sin portadas (los menos usados primero) hasta que entren `needed` bytes"""
+        for key in list(self._clips):
+            if self.used + needed <= self.budget:
+                break
+            clip = self._clips[key]
+            if clip.labels or clip.frames is None:
+                continue
+            self.used -= clip.cost
+            del self._clips[key]
+
+    def clear(self) -> None:
+        """Libera los clips que ninguna portada está usando"""
+        self._evict(self.budget + 1)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'clips': len(self._clips),
+            'frames': sum(len(c.frames or ()) for c in self._clips.values()),
+            'playing': sum(1 for c in self._clips.values() if c.visible and c.frames and len(c.frames) > 1),
+            'bytes': self.used,
+            'budget': self.budget,
+        }
+
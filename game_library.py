@@ -1,16 +1,33 @@
 import sys
-import json
 import os
 import subprocess
 from pathlib import Path
 import tempfile
+import time
 import ctypes
 import uuid
-from datetime import datetime, timedelta
+import weakref
+from datetime import datetime
 from steam_scanner import SteamScanner
 from epic_scanner import EpicScanner
 from i18n import I18n, t
 from font_installer import ensure_fonts_installed
+from library_store import LibraryStore, dedupe_games
+from library_view import GameListModel, GameCardDelegate, GameGridView, format_playtime
+from search_index import SearchIndex
+from background_compositor import BackgroundCompositor
+from card_animation import CardAnimator
+from card_layout import CardFlowLayout
+from card_pool import CardPool
+from card_style import CardTheme
+from cover_animation import AnimatedCovers
+from video_background import VideoBackgroundDecoder, HAVE_CV2
+from image_service import ImageCache, ImageDecoder, ImageFetcher, REMOTE_CACHE_DIR, THUMBNAIL_DIR
+from library_query import LibraryQuery
+from playtime_journal import PlaytimeJournal, CHECKPOINT_INTERVAL_SECONDS
+from settings_store import (SettingsStore, invalidations_for, theme_invalidations,
+                            INVALIDATE_BACKGROUND, INVALIDATE_REPAINT, INVALIDATE_STYLESHEET,
+                            INVALIDATE_CARDS, INVALIDATE_FILTER, INVALIDATE_SIDEBAR)
 
 # Version and application info
 __version__ = "1.1.5"
@@ -19,14 +36,14 @@ from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QHBoxLayout, QGridLayout, QPushButton, QLabel, 
                              QLineEdit, QDialog, QScrollArea, QFrame, QComboBox,
                              QMessageBox, QFileDialog, QMenu, QSlider, QToolButton, 
-                             QProgressDialog, QCheckBox, QGraphicsOpacityEffect, QInputDialog,
-                             QActionGroup)
+                             QProgressDialog, QCheckBox, QInputDialog,
+                             QActionGroup, QStackedWidget, QSizeGrip)
 from PyQt5.QtCore import Qt, QSize, QThread, pyqtSignal, QFileInfo, QPropertyAnimation, QEasingCurve, QPoint, QEvent, QRect, QTimer
 try:
     from PyQt5.QtWinExtras import QtWin
 except Exception:
     QtWin = None
-from PyQt5.QtGui import QPixmap, QIcon, QPalette, QColor, QFont, QPainter, QBrush, QMovie, QImage
+from PyQt5.QtGui import QPixmap, QIcon, QPalette, QColor, QFont, QPainter, QBrush, QMovie, QImage, QImageReader
 
 
 class SingleInstanceLock:
@@ -72,26 +89,51 @@ class SingleInstanceLock:
             pass
 
 
-class ImageLoader(QThread):
-    """Thread para cargar imágenes desde URLs sin bloquear la UI"""
-    image_loaded = pyqtSignal(str, QPixmap)
-    
-    def __init__(self, url, game_id):
+class LibraryLoader(QThread):
+    """
+    Thread que carga la biblioteca completa sin bloquear la UI
+
+    Parsea games.json de una sola vez y deja construidos el índice de búsqueda
+    y las claves de orden. Los registros de la cabecera se sustituyen por los
+    dicts que ya usa la UI para conservar sus cambios locales.
+    """
+
+    def __init__(self, library, head):
         super().__init__()
-        self.url = url
-        self.game_id = game_id
-    
+        self.library = library
+        self.head = {g['id']: g for g in head}
+        self.games = []
+        self.search_index = None
+        self.library_query = None
+
     def run(self):
-        import urllib.request
         try:
-            # Descargar la imagen usando urllib
-            with urllib.request.urlopen(self.url, timeout=10) as response:
-                data = response.read()
-                pixmap = QPixmap()
-                if pixmap.loadFromData(data):
-                    self.image_loaded.emit(self.game_id, pixmap)
+            games = [self.head.get(g['id'], g) for g in self.library.load()]
+            search_index = SearchIndex(games)
+            library_query = LibraryQuery(search_index)
+            library_query.rebuild(games)
+            self.games, self.search_index, self.library_query = games, search_index, library_query
         except Exception as e:
-            print(f"Error al cargar imagen {self.url}: {e}")
+            print(f"Error al cargar biblioteca: {e}")
+
+
+class ThinProgressBar(QWidget):
+    """Barra de progreso de 3px; a diferencia de QProgressBar no repinta sincrónicamente en cada valor"""
+
+    def __init__(self, parent=None, color='#667eea'):
+        super().__init__(parent)
+        self.setFixedHeight(3)
+        self.color = QColor(color)
+        self._fraction = 0.0
+
+    def set_progress(self, value, total):
+        self._fraction = value / total if total else 0.0
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.fillRect(0, 0, round(self.width() * self._fraction), self.height(), self.color)
+        painter.end()
 
 
 class SplashScreen(QWidget):
@@ -162,57 +204,51 @@ class SplashScreen(QWidget):
         """)
 
 
+def _cancel_image_tickets(tickets):
+    """Cancela los pedidos (servicio, ticket) de una tarjeta y vacía la lista"""
+    for service, ticket in tickets:
+        service.cancel(ticket)
+    tickets.clear()
+
+
 class GameCard(QFrame):
     """Widget personalizado para mostrar cada juego"""
     _custom_colors = {}
     
-    def __init__(self, game, parent=None, list_mode=False, animation_delay=0):
+    def __init__(self, game, parent=None, list_mode=False):
         super().__init__(parent)
         self.game = game
         self.parent_window = parent
         self.list_mode = list_mode
-        self.animation_delay = animation_delay
-        self.cover_movie = None  # QMovie para GIF animado en cover
-        self._is_visible = False  # Track visibility para pausar GIF
+        self._playtime_minutes = None  # Minutos mostrados en playtime_label
+        # Pedidos de portada/icono en curso: (servicio, ticket); se cancelan al re-enlazar o destruir
+        self._image_tickets = []
+        self.destroyed.connect(lambda *_, tickets=self._image_tickets: _cancel_image_tickets(tickets))
         self.setup_ui()
 
     def _format_playtime(self, seconds):
-        seconds = int(seconds or 0)
-        minutes = seconds // 60
-        hours = minutes // 60
-        minutes = minutes % 60
-        if hours:
-            return f"{hours}h {minutes}m"
-        return f"{minutes}m"
+        return format_playtime(seconds)
+
+    def set_favorite(self, is_favorite):
+        """Actualiza la estrella sin reconstruir la tarjeta"""
+        self.is_favorite = bool(is_favorite)
+        self.favorite_btn.setText('⭐' if self.is_favorite else '☆')
+
+    def set_playtime(self, seconds):
+        """Actualiza el tiempo jugado mostrado sin reconstruir la tarjeta (solo si cambia el minuto)"""
+        minutes = int(seconds or 0) // 60
+        if minutes == self._playtime_minutes or not hasattr(self, 'playtime_label'):
+            return
+        self._playtime_minutes = minutes
+        self.playtime_label.setText(t('label_playtime', value=self._format_playtime(seconds)))
         
     def setup_ui(self):
         self.setFrameStyle(QFrame.StyledPanel | QFrame.Raised)
         
-        # Usar colores personalizados si existen
-        c = GameCard._custom_colors
-        card_bg = c.get('card_bg', '#1a1f2e')
-        card_border = c.get('card_border', 'transparent')
-        card_hover_border = c.get('card_hover_border', '#667eea')
-        card_hover_bg = c.get('card_hover_bg', '#252d3d')
-        card_radius = c.get('card_radius', 12)
-        border_width = c.get('border_width', 2)
-        font_family = c.get('font_family', 'Segoe UI')
-        card_title_size = c.get('card_title_size', 15)
-        secondary_size = c.get('secondary_size', 12)
-        button_radius = c.get('button_radius', 8)
-        
-        self.setStyleSheet(f"""
-            GameCard {{
-                background-color: {card_bg};
-                border-radius: {card_radius}px;
-                border: {border_width}px solid {card_border};
-                font-family: {font_family};
-            }}
-            GameCard:hover {{
-                border: {border_width}px solid {card_hover_border};
-                background-color: {card_hover_bg};
-            }}
-        """)
+        # El estilo sale de la hoja compartida del tema (aplicada al contenedor del grid):
+        # aquí solo se fijan objectName y propiedades dinámicas
+        theme = CardTheme.for_colors(GameCard._custom_colors)
+        self.setProperty('listMode', self.list_mode)
         if self.list_mode:
             self.setFixedSize(900, 180)
         else:
@@ -220,7 +256,9 @@ class GameCard(QFrame):
         self.setCursor(Qt.PointingHandCursor)
         self._orig_rect = None
         self._anim = None
-        self.is_favorite = self.game.get('is_favorite', False)
+        self.is_favorite = False
+        self.icon_label = None
+        self.path_label = None
         
         # Layout raíz: en lista usamos horizontal (imagen a la izquierda)
         if self.list_mode:
@@ -234,45 +272,18 @@ class GameCard(QFrame):
         
         # Imagen del juego
         self.image_label = QLabel()
+        self.image_label.setObjectName('cardCover')
         if self.list_mode:
             self.image_label.setFixedSize(316, 176)
         else:
             self.image_label.setFixedSize(296, 176)
         self.image_label.setAlignment(Qt.AlignCenter)
-        accent_start = c.get('accent_start', '#667eea')
-        accent_end = c.get('accent_end', '#764ba2')
-        self.image_label.setStyleSheet(f"""
-            background: qlineargradient(x1:0, y1:0, x2:1, y2:1,
-                stop:0 {accent_start}, stop:1 {accent_end});
-            font-size: 48px;
-        """)
-        
-        # Cargar imagen si existe
-        if self.game.get('image'):
-            self.load_image(self.game['image'])
-        else:
-            self.image_label.setText("🎮")
         
         # Botón de favorito (aparece solo en hover)
-        self.favorite_btn = QPushButton('⭐' if self.is_favorite else '☆')
+        self.favorite_btn = QPushButton('☆')
+        self.favorite_btn.setObjectName('cardFavorite')
         self.favorite_btn.setFixedSize(40, 40)
         self.favorite_btn.setVisible(False)  # Oculto por defecto
-        self.favorite_btn.setStyleSheet(f"""
-            QPushButton {{
-                background-color: rgba(0, 0, 0, 200);
-                border: none;
-                border-radius: 20px;
-                font-size: 20px;
-                color: #FFD700;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: rgba(0, 0, 0, 240);
-            }}
-            QPushButton:pressed {{
-                background-color: rgba(0, 0, 0, 180);
-            }}
-        """)
         def toggle_favorite():
             self.is_favorite = not self.is_favorite
             self.favorite_btn.setText('⭐' if self.is_favorite else '☆')
@@ -287,38 +298,19 @@ class GameCard(QFrame):
             right_layout = QVBoxLayout(right)
             right_layout.setContentsMargins(10, 10, 10, 10)
             right_layout.setSpacing(8)
-            name_label = QLabel(self.game['name'])
-            text_color = c.get('text_primary', '#e8eaed')
-            text_secondary = c.get('text_secondary', '#9aa0a6')
-            name_font = QFont(font_family, card_title_size + 6, QFont.Bold)
-            name_label.setFont(name_font)
-            name_label.setStyleSheet(f"color:{text_color};")
+            name_label = QLabel()
+            name_label.setObjectName('cardTitle')
+            name_label.setFont(theme.font('title', True))
             name_label.setWordWrap(True)
+            self.name_label = name_label
             right_layout.addWidget(name_label)
 
-            playtime_seconds = int(self.game.get('total_play_time', 0) or 0)
-            playtime_label = QLabel(t('label_playtime', value=self._format_playtime(playtime_seconds)))
-            playtime_font = QFont(font_family, secondary_size)
-            playtime_label.setFont(playtime_font)
-            playtime_label.setStyleSheet(f"color:{text_secondary};")
+            playtime_label = QLabel()
+            playtime_label.setObjectName('cardPlaytime')
+            playtime_label.setFont(theme.font('playtime', True))
             self.playtime_label = playtime_label
             right_layout.addWidget(playtime_label)
-            # Badge Steam si aplica
-            if self.game.get('is_steam_game'):
-                steam_badge = QLabel("Steam")
-                steam_badge.setStyleSheet("""
-                    QLabel { color: #cfe6ff; background-color:#1b2838; border:1px solid #2a475e; border-radius:6px; padding:4px 8px; font-weight:700; font-size:12px;}
-                """)
-                steam_badge.setFixedHeight(24)
-                right_layout.addWidget(steam_badge)
-            # Badge Epic si aplica
-            if self.game.get('is_epic_game'):
-                epic_badge = QLabel("Epic")
-                epic_badge.setStyleSheet("""
-                    QLabel { color: #ffffff; background-color:#1a1a1a; border:1px solid #2d2d2d; border-radius:6px; padding:4px 8px; font-weight:700; font-size:12px;}
-                """)
-                epic_badge.setFixedHeight(24)
-                right_layout.addWidget(epic_badge)
+            self._add_platform_badges(right_layout, 24)
             right_layout.addStretch()
             # Agregar botón favorito en lista
             right_layout.addWidget(self.favorite_btn, alignment=Qt.AlignTop | Qt.AlignRight)
@@ -335,73 +327,42 @@ class GameCard(QFrame):
             layout.addWidget(image_container)
             
             content_widget = QWidget()
-            content_widget.setStyleSheet(f"background-color: {card_bg};")
+            content_widget.setObjectName('cardContent')
             content_layout = QHBoxLayout()
             content_layout.setContentsMargins(15, 15, 15, 15)
 
             # Icono
             icon_label = QLabel()
+            icon_label.setObjectName('cardIcon')
             icon_label.setFixedSize(50, 50)
-            from PyQt5 import QtCore
-            icon_label.setAlignment(QtCore.Qt.AlignCenter)
-            icon_label.setStyleSheet(f"""
-                background-color: {card_hover_bg};
-                border-radius: {button_radius}px;
-                font-size: 24px;
-            """)
+            icon_label.setAlignment(Qt.AlignCenter)
             self.icon_label = icon_label
-            if self.game.get('icon'):
-                self.load_icon(self.game['icon'], icon_label)
-            else:
-                if self.game.get('path') and os.path.exists(self.game['path']):
-                    self.extract_exe_icon(self.game['path'], icon_label)
-                else:
-                    icon_label.setText("🎮")
             # Añadir icono e info (nombre y ruta) en la parte inferior (grid)
             content_layout.addWidget(icon_label)
 
             info_layout = QVBoxLayout()
             info_layout.setSpacing(5)
 
-            name_label = QLabel(self.game['name'])
-            text_color = c.get('text_primary', '#e8eaed')
-            name_font = QFont(font_family, card_title_size, QFont.Bold)
-            name_label.setFont(name_font)
-            name_label.setStyleSheet(f"color: {text_color};")
+            name_label = QLabel()
+            name_label.setObjectName('cardTitle')
+            name_label.setFont(theme.font('title'))
             name_label.setWordWrap(False)
+            self.name_label = name_label
 
-            path_label = QLabel(self.game['path'])
-            text_secondary = c.get('text_secondary', '#9aa0a6')
-            path_font = QFont(font_family, secondary_size - 1)
-            path_label.setFont(path_font)
-            path_label.setStyleSheet(f"color: {text_secondary};")
+            path_label = QLabel()
+            path_label.setObjectName('cardPath')
+            path_label.setFont(theme.font('path'))
             path_label.setWordWrap(False)
+            self.path_label = path_label
 
             info_layout.addWidget(name_label)
             info_layout.addWidget(path_label)
-            playtime_seconds = int(self.game.get('total_play_time', 0) or 0)
-            playtime_label = QLabel(t('label_playtime', value=self._format_playtime(playtime_seconds)))
-            playtime_font = QFont(font_family, secondary_size - 1)
-            playtime_label.setFont(playtime_font)
-            playtime_label.setStyleSheet(f"color: {text_secondary};")
+            playtime_label = QLabel()
+            playtime_label.setObjectName('cardPlaytime')
+            playtime_label.setFont(theme.font('playtime'))
             self.playtime_label = playtime_label
             info_layout.addWidget(playtime_label)
-            # Badge Steam si aplica
-            if self.game.get('is_steam_game'):
-                steam_badge = QLabel("Steam")
-                steam_badge.setStyleSheet("""
-                    QLabel { color: #cfe6ff; background-color:#1b2838; border:1px solid #2a475e; border-radius:6px; padding:3px 6px; font-weight:700; font-size:11px;}
-                """)
-                steam_badge.setFixedHeight(20)
-                info_layout.addWidget(steam_badge)
-            # Badge Epic si aplica
-            if self.game.get('is_epic_game'):
-                epic_badge = QLabel("Epic")
-                epic_badge.setStyleSheet("""
-                    QLabel { color: #ffffff; background-color:#1a1a1a; border:1px solid #2d2d2d; border-radius:6px; padding:3px 6px; font-weight:700; font-size:11px;}
-                """)
-                epic_badge.setFixedHeight(20)
-                info_layout.addWidget(epic_badge)
+            self._add_platform_badges(info_layout, 20)
             info_layout.addStretch()
 
             content_layout.addLayout(info_layout, 1)
@@ -409,29 +370,54 @@ class GameCard(QFrame):
             layout.addWidget(content_widget)
 
         self.setLayout(layout)
-        
-        # Aplicar fade-in después de que el widget esté construido
-        self.setWindowOpacity(1.0)  # Asegurar opacidad normal
-        opacity_effect = QGraphicsOpacityEffect(self)
-        self.setGraphicsEffect(opacity_effect)
-        opacity_effect.setOpacity(0.0)  # Empezar invisible
-        self.fade_animation = QPropertyAnimation(opacity_effect, b"opacity")
-        self.fade_animation.setDuration(500)  # 500ms - más lento
-        self.fade_animation.setStartValue(0.0)
-        self.fade_animation.setEndValue(1.0)
-        self.fade_animation.setEasingCurve(QEasingCurve.OutCubic)
-        # Remover el efecto cuando termine para no interferir con hover
-        # Verificar si el widget aún existe antes de remover el efecto
-        def remove_effect():
-            try:
-                if self and self.isValid() if hasattr(self, 'isValid') else True:
-                    self.setGraphicsEffect(None)
-            except RuntimeError:
-                pass  # Widget fue eliminado
-        self.fade_animation.finished.connect(remove_effect)
-        # Iniciar con delay para efecto secuencial
-        from PyQt5.QtCore import QTimer
-        QTimer.singleShot(self.animation_delay, self.fade_animation.start)
+        self._apply_game()
+
+    def _add_platform_badges(self, layout, height):
+        """Insignias Steam/Epic (el estilo lo da la propiedad dinámica 'platform'); se muestran según el juego"""
+        self.platform_badges = {}
+        for key, platform, text in (('is_steam_game', 'steam', 'Steam'), ('is_epic_game', 'epic', 'Epic')):
+            badge = QLabel(text)
+            badge.setObjectName('cardBadge')
+            badge.setProperty('platform', platform)
+            badge.setFixedHeight(height)
+            layout.addWidget(badge)
+            self.platform_badges[key] = badge
+
+    def bind(self, game):
+        """Reutiliza la tarjeta (pool de tarjetas) para otro juego sin reconstruir sus widgets"""
+        self.game = game
+        self._orig_rect = None
+        self.favorite_btn.setVisible(False)
+        self._apply_game()
+
+    def _apply_game(self):
+        """Vuelca los datos de self.game en los widgets: textos, insignias, portada e icono"""
+        game = self.game
+        self.set_favorite(game.get('is_favorite', False))
+        self.name_label.setText(game['name'])
+        if self.path_label is not None:
+            self.path_label.setText(game['path'])
+        self.set_playtime(int(game.get('total_play_time', 0) or 0))
+        for key, badge in self.platform_badges.items():
+            badge.setVisible(bool(game.get(key)))
+
+        # Portada: las cargas pendientes del juego anterior se cancelan
+        self.unbind()
+        self.image_label.clear()
+        if game.get('image'):
+            self.load_image(game['image'])
+        else:
+            self.image_label.setText("🎮")
+
+        # Icono (solo grid)
+        if self.icon_label is not None:
+            self.icon_label.clear()
+            if game.get('icon'):
+                self.load_icon(game['icon'], self.icon_label)
+            elif game.get('path') and os.path.exists(game['path']):
+                self.extract_exe_icon(game['path'], self.icon_label)
+            else:
+                self.icon_label.setText("🎮")
 
     def load_image(self, url_or_path):
         """Cargar imagen desde URL o ruta local (soporta GIF animados)"""
@@ -440,83 +426,89 @@ class GameCard(QFrame):
             if url_or_path.lower().endswith('.gif'):
                 self._load_gif_cover(url_or_path)
                 return
-            pixmap = QPixmap(url_or_path)
-            if not pixmap.isNull():
-                self.set_image(self.game['id'], pixmap)
-                return
+            # Decodificar en segundo plano directamente al tamaño de la portada
+            self._track_image(ImageDecoder.instance(), ImageDecoder.instance().request(
+                url_or_path, self.image_label.size(),
+                lambda pm, gid=self.game['id']: self.set_image(gid, pm),
+                dpr=self.devicePixelRatioF()))
+            return
         if url_or_path.startswith(('http://', 'https://')):
-            loader = ImageLoader(url_or_path, self.game['id'])
-            loader.image_loaded.connect(self.set_image)
-            loader.start()
-            self.image_loader = loader
+            # Descarga compartida (caché en disco) y decodificación al tamaño de la portada
+            self._track_image(ImageFetcher.instance(), ImageFetcher.instance().request(
+                url_or_path, self.image_label.size(),
+                lambda pm, gid=self.game['id']: self.set_image(gid, pm),
+                dpr=self.devicePixelRatioF()))
+
+    def _track_image(self, service, ticket):
+        if ticket:
+            self._image_tickets.append((service, ticket))
+
+    def unbind(self):
+        """Cancela las cargas de portada/icono y suelta el GIF (al re-enlazar o volver al pool)"""
+        _cancel_image_tickets(self._image_tickets)
+        AnimatedCovers.instance().detach(self.image_label)
 
     def set_image(self, game_id, pixmap):
         """Establecer la imagen cargada en el label de portada"""
         if game_id == self.game['id']:
             target_size = self.image_label.size()
-            w = max(1, target_size.width())
-            h = max(1, target_size.height())
-            scaled_pixmap = pixmap.scaled(w, h, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-            self.image_label.setPixmap(scaled_pixmap)
+            dpr = pixmap.devicePixelRatio()
+            w = max(1, round(target_size.width() * dpr))
+            h = max(1, round(target_size.height() * dpr))
+            if pixmap.width() != w or pixmap.height() != h:
+                # Ya viene al tamaño justo si la decodificó ImageDecoder
+                pixmap = pixmap.scaled(w, h, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
+                pixmap.setDevicePixelRatio(dpr)
+            self.image_label.setPixmap(pixmap)
             self.image_label.setText("")
 
     def _load_gif_cover(self, gif_path):
-        """Cargar GIF animado en el cover de la card"""
+        """Cargar GIF animado en el cover de la card (frames compartidos y ya escalados)"""
         try:
-            if self.cover_movie:
-                self.cover_movie.stop()
-            self.cover_movie = QMovie(gif_path)
-            self.cover_movie.setCacheMode(QMovie.CacheAll)
-            # Conectar señal para actualizar label con cada frame
-            self.cover_movie.frameChanged.connect(self._update_gif_frame)
-            self.image_label.setMovie(self.cover_movie)
             self.image_label.setText("")
-            # Solo iniciar si la card es visible
-            if self._is_visible:
-                self.cover_movie.start()
+            AnimatedCovers.instance().attach(self.image_label, gif_path, self.image_label.size(),
+                                             self.devicePixelRatioF())
         except Exception as e:
             print(f'Error cargando GIF cover: {e}')
 
-    def _update_gif_frame(self):
-        """Actualiza el frame del GIF en el label (escalado)"""
-        if not self.cover_movie:
-            return
-        current = self.cover_movie.currentPixmap()
-        if not current.isNull():
-            target_size = self.image_label.size()
-            w = max(1, target_size.width())
-            h = max(1, target_size.height())
-            scaled = current.scaled(w, h, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-            self.image_label.setPixmap(scaled)
-            
     def load_icon(self, url_or_path, label):
         """Cargar icono desde URL o ruta local"""
-        # Si es una ruta local, cargar directamente
+        # Si es una ruta local, decodificar en segundo plano
         if os.path.exists(url_or_path):
-            pixmap = QPixmap(url_or_path)
-            if not pixmap.isNull():
-                self.set_icon(label, pixmap)
-                return
+            self._track_image(ImageDecoder.instance(), ImageDecoder.instance().request(
+                url_or_path, QSize(42, 42), lambda pm, gid=self.game['id']: self._set_icon_for(gid, label, pm),
+                mode=Qt.KeepAspectRatio, dpr=self.devicePixelRatioF()))
+            return
         
-        # Si es una URL, cargar en thread separado
+        # Si es una URL, descargar con el fetcher compartido
         if url_or_path.startswith(('http://', 'https://')):
-            loader = ImageLoader(url_or_path, self.game['id'] + '_icon')
-            loader.image_loaded.connect(lambda gid, pm: self.set_icon(label, pm))
-            loader.start()
-            self.icon_loader = loader
+            self._track_image(ImageFetcher.instance(), ImageFetcher.instance().request(
+                url_or_path, QSize(42, 42), lambda pm, gid=self.game['id']: self._set_icon_for(gid, label, pm),
+                mode=Qt.KeepAspectRatio, dpr=self.devicePixelRatioF()))
+
+    def _set_icon_for(self, game_id, label, pixmap):
+        """Aplica un icono cargado en segundo plano si la tarjeta sigue mostrando ese juego"""
+        if game_id == self.game['id']:
+            self.set_icon(label, pixmap)
         
     def set_icon(self, label, pixmap):
         """Establecer el icono cargado"""
         from PyQt5 import QtCore
         from PyQt5.QtGui import QPixmap as _QPixmap, QPainter
         # Render consistente dentro de un lienzo 50x50 para evitar problemas de DPI
-        canvas = _QPixmap(50, 50)
+        dpr = pixmap.devicePixelRatio()
+        canvas = _QPixmap(round(50 * dpr), round(50 * dpr))
+        canvas.setDevicePixelRatio(dpr)
         canvas.fill(Qt.transparent)
-        # Escalar icono con margen 4px por lado
-        icon_pm = pixmap.scaled(42, 42, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
+        # Escalar icono con margen 4px por lado (salvo que ya venga a 42px)
+        icon_pm = pixmap
+        side = round(42 * dpr)
+        if max(pixmap.width(), pixmap.height()) != side:
+            icon_pm = pixmap.scaled(side, side, QtCore.Qt.KeepAspectRatio, QtCore.Qt.SmoothTransformation)
+            icon_pm.setDevicePixelRatio(dpr)
         painter = QPainter(canvas)
-        x = (50 - icon_pm.width()) // 2
-        y = (50 - icon_pm.height()) // 2
+        x = (50 - round(icon_pm.width() / dpr)) // 2
+        y = (50 - round(icon_pm.height() / dpr)) // 2
         painter.drawPixmap(x, y, icon_pm)
         painter.end()
         label.setPixmap(canvas)
@@ -530,12 +522,16 @@ class GameCard(QFrame):
         saved_icon = icon_dir / (Path(exe_path).stem + '_icon.png')
         
         if saved_icon.exists():
-            pm = QPixmap(str(saved_icon))
-            if not pm.isNull():
+            # Solo se lee la cabecera para validar; el icono escalado sale de ImageCache
+            source_size = QImageReader(str(saved_icon)).size()
+            if source_size.isValid():
                 # Validar que el caché no esté corrupto (muy pequeño)
-                if pm.width() >= 16 and pm.height() >= 16:
-                    self.set_icon(label, pm)
-                    return
+                if source_size.width() >= 16 and source_size.height() >= 16:
+                    pm = ImageCache.instance().pixmap(str(saved_icon), QSize(42, 42),
+                                                      self.devicePixelRatioF(), Qt.KeepAspectRatio)
+                    if pm is not None:
+                        self.set_icon(label, pm)
+                        return
                 else:
                     # Caché corrupto, borrarlo y re-extraer
                     saved_icon.unlink()
@@ -597,67 +593,8 @@ class GameCard(QFrame):
             
     def contextMenuEvent(self, event):
         """Menú contextual con clic derecho"""
-        menu = QMenu(self)
-        menu.setStyleSheet("""
-            QMenu {
-                background-color: #1a1f2e;
-                border: 1px solid #2d3748;
-                border-radius: 8px;
-                padding: 5px;
-            }
-            QMenu::item {
-                color: #e8eaed;
-                padding: 10px 20px;
-                border-radius: 6px;
-            }
-            QMenu::item:selected {
-                background-color: #252d3d;
-            }
-        """)
-        
-        play_action = menu.addAction("▶ Jugar")
-        edit_action = menu.addAction("✎ Editar")
-        delete_action = menu.addAction("🗑 Eliminar")
-
-        folders_menu = menu.addMenu(t('menu_folders'))
-        folders_menu.setStyleSheet(menu.styleSheet())
-        new_folder_action = folders_menu.addAction(f"＋ {t('btn_new_folder')}")
-        folders_menu.addSeparator()
-        folders = []
         if self.parent_window:
-            folders = self.parent_window._collect_folders()
-        for fname in ['Steam', 'Epic']:
-            if fname not in folders:
-                folders.append(fname)
-        seen = set()
-        for fname in folders:
-            if fname in seen:
-                continue
-            seen.add(fname)
-            action = folders_menu.addAction(fname)
-            action.setCheckable(True)
-            if fname in (self.game.get('folders') or []):
-                action.setChecked(True)
-            is_auto_locked = (fname == 'Steam' and self.game.get('is_steam_game')) or (fname == 'Epic' and self.game.get('is_epic_game'))
-            if is_auto_locked:
-                action.setDisabled(True)
-            def make_handler(folder=fname, act=action, locked=is_auto_locked):
-                return lambda: self.parent_window and self.parent_window._update_game_folders(self.game['id'], folder, add=act.isChecked(), lock_auto=locked)
-            action.toggled.connect(make_handler())
-
-        def handle_new_folder():
-            if self.parent_window:
-                self.parent_window._show_new_folder_dialog()
-        new_folder_action.triggered.connect(handle_new_folder)
-        
-        action = menu.exec_(event.globalPos())
-        
-        if action == play_action:
-            self.parent_window.play_game(self.game)
-        elif action == edit_action:
-            self.parent_window.edit_game(self.game)
-        elif action == delete_action:
-            self.parent_window.delete_game(self.game)
+            self.parent_window._show_game_context_menu(self.game, event.globalPos(), self)
 
     def enterEvent(self, event):
         self.favorite_btn.setVisible(True)  # Mostrar botón de favorito
@@ -690,19 +627,6 @@ class GameCard(QFrame):
             anim.start()
         super().leaveEvent(event)
 
-    def showEvent(self, event):
-        """Cuando la card se hace visible, reanudar GIF si existe"""
-        super().showEvent(event)
-        self._is_visible = True
-        if self.cover_movie and not self.cover_movie.state() == QMovie.Running:
-            self.cover_movie.start()
-
-    def hideEvent(self, event):
-        """Cuando la card se oculta, pausar GIF para ahorrar recursos"""
-        super().hideEvent(event)
-        self._is_visible = False
-        if self.cover_movie and self.cover_movie.state() == QMovie.Running:
-            self.cover_movie.setPaused(True)
 
 
 class AddGameDialog(QDialog):
@@ -1529,15 +1453,10 @@ class ColorPickerDialog(QDialog):
             I18n.set_language(new_lang)
             # Emitir señal para que la ventana principal se recargue
             self.language_changed.emit(new_lang)
-            # Intentar guardar en theme.json si el parent es GameLibrary
-            try:
-                parent = self.parent()
-                if parent and hasattr(parent, 'theme_file'):
-                    data = json.load(open(parent.theme_file, 'r', encoding='utf-8'))
-                    data['language'] = new_lang
-                    json.dump(data, open(parent.theme_file, 'w', encoding='utf-8'), indent=2, ensure_ascii=False)
-            except Exception as e:
-                print(f'Error guardando idioma: {e}')
+            # Guardar en la configuración si el parent es GameLibrary
+            parent = self.parent()
+            if parent and hasattr(parent, 'settings'):
+                parent.settings.set('language', new_lang)
         self.lang_combo.currentIndexChanged.connect(on_lang_change)
         lang_layout.addWidget(self.lang_combo)
         lang_layout.addStretch()
@@ -1549,28 +1468,17 @@ class ColorPickerDialog(QDialog):
         startup_layout.setContentsMargins(0,0,0,0)
         startup_layout.setSpacing(10)
         startup_checkbox = QCheckBox(t('label_auto_start'))
-        # Estado actual desde theme.json
-        try:
-            parent = self.parent() if isinstance(self.parent(), GameLibrary) else None
-            current = False
-            if parent and parent.theme_file.exists():
-                data = json.load(open(parent.theme_file, 'r', encoding='utf-8'))
-                current = bool(data.get('startup_on_boot', False))
-            startup_checkbox.setChecked(current)
-        except Exception:
-            pass
+        # Estado actual desde la configuración
+        parent = self.parent() if isinstance(self.parent(), GameLibrary) else None
+        startup_checkbox.setChecked(parent.settings.get_bool('startup_on_boot') if parent else False)
         def on_toggle(state):
             parent = self.parent() if isinstance(self.parent(), GameLibrary) else None
             if parent:
-                want = state == Qt.Checked
-                parent._set_startup_on_boot(want)
-                try:
-                    data = json.load(open(parent.theme_file, 'r', encoding='utf-8'))
-                    data['startup_on_boot'] = want
-                    data['startup_on_boot_decided'] = True
-                    json.dump(data, open(parent.theme_file, 'w', encoding='utf-8'), indent=2, ensure_ascii=False)
-                except Exception:
-                    pass
+                # El listener de configuración crea/elimina el acceso directo
+                parent.settings.update({
+                    'startup_on_boot': state == Qt.Checked,
+                    'startup_on_boot_decided': True
+                })
         startup_checkbox.stateChanged.connect(on_toggle)
         startup_layout.addWidget(startup_checkbox)
         startup_layout.addStretch()
@@ -1591,28 +1499,15 @@ class ColorPickerDialog(QDialog):
         """)
         self.priority_combo.addItems([t('priority_high'), t('priority_normal'), t('priority_low')])
         # Cargar prioridad actual
-        try:
-            parent = self.parent() if isinstance(self.parent(), GameLibrary) else None
-            current_priority = 'normal'
-            if parent and parent.theme_file.exists():
-                data = json.load(open(parent.theme_file, 'r', encoding='utf-8'))
-                current_priority = data.get('process_priority', 'normal')
-            priority_index = {'high': 0, 'normal': 1, 'low': 2}.get(current_priority, 1)
-            self.priority_combo.setCurrentIndex(priority_index)
-        except Exception:
-            self.priority_combo.setCurrentIndex(1)
+        parent = self.parent() if isinstance(self.parent(), GameLibrary) else None
+        current_priority = parent.settings.get_str('process_priority') if parent else 'normal'
+        self.priority_combo.setCurrentIndex({'high': 0, 'normal': 1, 'low': 2}.get(current_priority, 1))
         def on_priority_change(idx):
             parent = self.parent() if isinstance(self.parent(), GameLibrary) else None
             if parent:
                 priority_map = {0: 'high', 1: 'normal', 2: 'low'}
-                new_priority = priority_map.get(idx, 'normal')
-                parent._set_process_priority(new_priority)
-                try:
-                    data = json.load(open(parent.theme_file, 'r', encoding='utf-8'))
-                    data['process_priority'] = new_priority
-                    json.dump(data, open(parent.theme_file, 'w', encoding='utf-8'), indent=2, ensure_ascii=False)
-                except Exception:
-                    pass
+                # El listener de configuración aplica la prioridad
+                parent.settings.set('process_priority', priority_map.get(idx, 'normal'))
         self.priority_combo.currentIndexChanged.connect(on_priority_change)
         priority_layout.addWidget(self.priority_combo)
         priority_layout.addStretch()
@@ -1635,14 +1530,8 @@ class ColorPickerDialog(QDialog):
         def on_playtime_toggle(state):
             parent = self.parent() if isinstance(self.parent(), GameLibrary) else None
             if parent:
-                enabled = state == Qt.Checked
-                parent.set_playtime_tracking(enabled)
-                try:
-                    data = json.load(open(parent.theme_file, 'r', encoding='utf-8'))
-                    data['playtime_tracking_enabled'] = enabled
-                    json.dump(data, open(parent.theme_file, 'w', encoding='utf-8'), indent=2, ensure_ascii=False)
-                except Exception:
-                    pass
+                # El listener de configuración activa/desactiva el seguimiento
+                parent.settings.set('playtime_tracking_enabled', state == Qt.Checked)
         self.playtime_checkbox.stateChanged.connect(on_playtime_toggle)
         playtime_layout.addWidget(self.playtime_checkbox)
 
@@ -1659,26 +1548,13 @@ class ColorPickerDialog(QDialog):
         auto_update_layout.setSpacing(10)
 
         self.auto_update_checkbox = QCheckBox(t('label_auto_update'))
-        try:
-            parent = self.parent() if isinstance(self.parent(), GameLibrary) else None
-            current = False
-            if parent and parent.theme_file.exists():
-                data = json.load(open(parent.theme_file, 'r', encoding='utf-8'))
-                current = data.get('auto_update_enabled', False)
-            self.auto_update_checkbox.setChecked(current)
-        except Exception:
-            self.auto_update_checkbox.setChecked(False)
+        parent = self.parent() if isinstance(self.parent(), GameLibrary) else None
+        self.auto_update_checkbox.setChecked(parent.settings.get_bool('auto_update_enabled') if parent else False)
 
         def on_auto_update_toggle(state):
             parent = self.parent() if isinstance(self.parent(), GameLibrary) else None
             if parent:
-                enabled = state == Qt.Checked
-                try:
-                    data = json.load(open(parent.theme_file, 'r', encoding='utf-8'))
-                    data['auto_update_enabled'] = enabled
-                    json.dump(data, open(parent.theme_file, 'w', encoding='utf-8'), indent=2, ensure_ascii=False)
-                except Exception:
-                    pass
+                parent.settings.set('auto_update_enabled', state == Qt.Checked)
         self.auto_update_checkbox.stateChanged.connect(on_auto_update_toggle)
         auto_update_layout.addWidget(self.auto_update_checkbox)
 
@@ -1687,6 +1563,73 @@ class ColorPickerDialog(QDialog):
         auto_update_layout.addWidget(hint_update)
         auto_update_layout.addStretch()
         layout.addWidget(auto_update_container)
+
+        # Toggle de vista virtualizada
+        virtual_container = QWidget()
+        virtual_layout = QHBoxLayout(virtual_container)
+        virtual_layout.setContentsMargins(0,0,0,0)
+        virtual_layout.setSpacing(10)
+
+        self.virtual_view_checkbox = QCheckBox(t('label_virtualized_view'))
+        self.virtual_view_checkbox.setChecked(parent.settings.get_bool('virtualized_view') if parent else False)
+
+        def on_virtual_view_toggle(state):
+            parent = self.parent() if isinstance(self.parent(), GameLibrary) else None
+            if parent:
+                # El listener de configuración vuelve a renderizar con la vista elegida
+                parent.settings.set('virtualized_view', state == Qt.Checked)
+        self.virtual_view_checkbox.stateChanged.connect(on_virtual_view_toggle)
+        virtual_layout.addWidget(self.virtual_view_checkbox)
+
+        hint_virtual = QLabel(t('hint_virtualized_view'))
+        hint_virtual.setStyleSheet('color:#9aa0a6;')
+        virtual_layout.addWidget(hint_virtual)
+        virtual_layout.addStretch()
+        layout.addWidget(virtual_container)
+
+        # Toggle de búsqueda aproximada
+        fuzzy_container = QWidget()
+        fuzzy_layout = QHBoxLayout(fuzzy_container)
+        fuzzy_layout.setContentsMargins(0,0,0,0)
+        fuzzy_layout.setSpacing(10)
+
+        self.search_fuzzy_checkbox = QCheckBox(t('label_search_fuzzy'))
+        self.search_fuzzy_checkbox.setChecked(parent.settings.get_bool('search_fuzzy') if parent else False)
+
+        def on_search_fuzzy_toggle(state):
+            parent = self.parent() if isinstance(self.parent(), GameLibrary) else None
+            if parent:
+                parent.settings.set('search_fuzzy', state == Qt.Checked)
+        self.search_fuzzy_checkbox.stateChanged.connect(on_search_fuzzy_toggle)
+        fuzzy_layout.addWidget(self.search_fuzzy_checkbox)
+
+        hint_fuzzy = QLabel(t('hint_search_fuzzy'))
+        hint_fuzzy.setStyleSheet('color:#9aa0a6;')
+        fuzzy_layout.addWidget(hint_fuzzy)
+        fuzzy_layout.addStretch()
+        layout.addWidget(fuzzy_container)
+
+        # Toggle de bajo consumo
+        low_power_container = QWidget()
+        low_power_layout = QHBoxLayout(low_power_container)
+        low_power_layout.setContentsMargins(0,0,0,0)
+        low_power_layout.setSpacing(10)
+
+        self.low_power_checkbox = QCheckBox(t('label_low_power_mode'))
+        self.low_power_checkbox.setChecked(parent.settings.get_bool('low_power_mode') if parent else False)
+
+        def on_low_power_toggle(state):
+            parent = self.parent() if isinstance(self.parent(), GameLibrary) else None
+            if parent:
+                parent.settings.set('low_power_mode', state == Qt.Checked)
+        self.low_power_checkbox.stateChanged.connect(on_low_power_toggle)
+        low_power_layout.addWidget(self.low_power_checkbox)
+
+        hint_low_power = QLabel(t('hint_low_power_mode'))
+        hint_low_power.setStyleSheet('color:#9aa0a6;')
+        low_power_layout.addWidget(hint_low_power)
+        low_power_layout.addStretch()
+        layout.addWidget(low_power_container)
         
         # Botón para limpiar caché
         cache_container = QWidget()
@@ -2320,36 +2263,18 @@ class ColorPickerDialog(QDialog):
 
     def _persist_custom_themes(self, custom_themes):
         """Persiste los temas personalizados en theme.json"""
-        try:
-            if self.parent() and hasattr(self.parent(), 'theme_file'):
-                theme_file = self.parent().theme_file
-                if theme_file.exists():
-                    with open(theme_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    data['custom_themes'] = custom_themes
-                    with open(theme_file, 'w', encoding='utf-8') as f:
-                        json.dump(data, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print(f'Error persisting custom themes: {e}')
+        if self.parent() and hasattr(self.parent(), 'settings'):
+            self.parent().settings.set('custom_themes', custom_themes)
 
     def get_custom_themes(self):
         """Obtiene los temas personalizados guardados (desde caché o desde archivo)"""
         if hasattr(self, 'custom_themes_cache'):
             return self.custom_themes_cache
         
-        # Intentar cargar desde theme.json
-        try:
-            # Buscar el archivo theme.json del parent (GameLibrary)
-            if self.parent() and hasattr(self.parent(), 'theme_file'):
-                theme_file = self.parent().theme_file
-                if theme_file.exists():
-                    with open(theme_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        custom_themes = data.get('custom_themes', {})
-                        self.custom_themes_cache = custom_themes
-                        return custom_themes
-        except Exception:
-            pass
+        # Cargar desde la configuración del parent (GameLibrary)
+        if self.parent() and hasattr(self.parent(), 'settings'):
+            self.custom_themes_cache = self.parent().settings.get_dict('custom_themes')
+            return self.custom_themes_cache
         
         return {}
 
@@ -2544,13 +2469,39 @@ class ColorPickerDialog(QDialog):
 
 class GameLibrary(QMainWindow):
     """Ventana principal de la biblioteca de juegos"""
+    # Registros que se pintan antes de terminar de cargar la biblioteca
+    FIRST_PAGE_SIZE = 24
+    # A partir de cuántos juegos filtrados se usa la vista virtualizada aunque no esté activada
+    VIRTUAL_VIEW_THRESHOLD = 500
+    MIN_WINDOW_SIZE = QSize(1000, 600)
+    # Espera tras la última tecla antes de aplicar la búsqueda
+    SEARCH_DEBOUNCE_MS = 150
+    # Presupuesto por tick para crear tarjetas fuera de la primera pantalla
+    RENDER_SLICE_MS = 8
+
+    # Progreso de la construcción de tarjetas: (creadas, total)
+    render_progress = pyqtSignal(int, int)
     
     def __init__(self):
         super().__init__()
         self.games = []
+        self.search_index = SearchIndex()
+        self.library_query = LibraryQuery(self.search_index)
+        self.card_animator = CardAnimator(self)
+        self.card_pool = CardPool(self)
         self.data_file = Path.home() / '.game_library' / 'games.json'
         self.data_file.parent.mkdir(exist_ok=True)
+        self.library = LibraryStore(self.data_file)
         self.theme_file = Path.home() / '.game_library' / 'theme.json'
+        # Configuración: se lee una sola vez y se guarda con debounce
+        self._settings_save_timer = QTimer(self)
+        self._settings_save_timer.setSingleShot(True)
+        self._settings_save_timer.setInterval(400)
+        self.settings = SettingsStore(self.theme_file, schedule_save=self._settings_save_timer.start)
+        self._settings_save_timer.timeout.connect(self.settings.flush)
+        QApplication.instance().aboutToQuit.connect(self.settings.flush)
+        # Presupuesto de memoria de la caché compartida de imágenes escaladas
+        ImageCache.instance().set_budget(self.settings.get_float('image_cache_mb') * 1024 * 1024)
         self.custom_folders = []
         self.active_folder = None  # None -> todos
         self.folder_buttons = {}
@@ -2560,10 +2511,36 @@ class GameLibrary(QMainWindow):
         self.filter_platform = None  # None/Steam/Epic/Manual
         self.sort_mode = 'name_asc'  # default sort
         self._suppress_render_animation = False
+        # Tarjetas renderizadas por clave de juego (ver _reconcile_cards)
+        self._rendered_cards = {}
+        self._rendered_card_keys = []
+        self._rendered_cards_style = None
+        self._empty_label = None
+        # id de juego -> GameCard en el grid, para actualizar el tiempo jugado en vivo
+        self._cards_by_id = weakref.WeakValueDictionary()
+        # Tarjetas pendientes de crear por tandas (ver _start_card_build)
+        self._pending_cards = []
+        self._pending_list_mode = False
+        self._render_built = 0
+        self._render_total = 0
+        self._render_timer = QTimer(self)
+        self._render_timer.setInterval(0)
+        self._render_timer.timeout.connect(self._render_tick)
+
+        # Primera pantalla desde games.head.json y la biblioteca completa en segundo plano
+        self._library_loading = False
+        self._library_loader = None
+        self._library_changed_ids = set()  # Juegos editados, agregados o borrados durante la carga
+        self._save_pending = False
+        self._library_load_failed = False  # games.json ilegible: no se guarda la lista parcial
 
         # Seguimiento de tiempo de juego
         self.playtime_tracking_enabled = True
-        self._play_session = None  # {'game_id': str, 'start_time': datetime, 'process': Popen}
+        self._play_session = None  # {'game_id': str, 'start_time': datetime, 'process': Popen, 'session_id': str}
+        # Checkpoints append-only para no perder sesiones si el launcher se cierra mal
+        self.playtime_journal = PlaytimeJournal(Path.home() / '.game_library' / 'sessions.jsonl')
+        # Sesiones ya sumadas en memoria que se cierran en el diario al confirmarse el guardado
+        self._journal_unsaved = []
         self.playtime_timer = QTimer(self)
         self.playtime_timer.setInterval(1000)
         self.playtime_timer.timeout.connect(self._tick_playtime)
@@ -2577,15 +2554,15 @@ class GameLibrary(QMainWindow):
         # Cargar preferencia de seguimiento de tiempo
         self._load_playtime_setting()
         
-        self.bg_pixmap = None
+        # Fondo ya escalado y con opacidad, cacheado por tamaño (ver paintEvent)
+        self.bg_compositor = BackgroundCompositor()
         self.bg_movie = None  # QMovie para GIF animados
-        self.bg_video_cap = None  # cv2.VideoCapture para videos
-        self.bg_video_timer = None  # Timer para refrescar frames de video
+        self.bg_video = None  # VideoBackgroundDecoder para videos (decodifica en su hilo)
+        self.bg_video_frame = None  # Frame del video en pantalla (su buffer respalda la QImage)
         self.bg_opacity = 0.15
         self.bg_history = []
         self.bg_type = 'static'  # static, animated, video
         self.color_scheme = {}
-        self._bg_paint_update_timer = None  # Timer para actualizar paintEvent durante animación
         # Arrastre simple
         self._drag_pos = None
         # Animación de minimizar/restaurar
@@ -2594,10 +2571,8 @@ class GameLibrary(QMainWindow):
         self._saved_geometry = None
         
         self._first_run_setup()
-        self.load_games()
-        # Limpieza defensiva de duplicados por steam_appid
-        if hasattr(self, '_dedupe_games_by_appid') and self._dedupe_games_by_appid():
-            self.save_games()
+        self.settings.add_listener(self._on_setting_changed)
+        self._load_games_head()
         self.load_theme()
         
         # Establecer icono de la aplicación
@@ -2643,7 +2618,8 @@ class GameLibrary(QMainWindow):
         
         # Setup UI rápido (sin datos)
         self.setup_ui()
-        self.apply_color_scheme_fixed()
+        # La primera renderización la hace _lazy_load_data
+        self.apply_color_scheme_fixed(rerender=False)
         self.enable_shadow()
         
         # Hacer lazy loading de datos en background
@@ -2664,19 +2640,9 @@ class GameLibrary(QMainWindow):
     def _lazy_load_data(self):
         """Carga datos en background sin bloquear la UI (lazy loading)"""
         try:
-            # Cargar juegos
-            self.load_games()
-            
-            # Limpieza defensiva de duplicados
-            if hasattr(self, '_dedupe_games_by_appid') and self._dedupe_games_by_appid():
-                self.save_games()
-            
-            # Renderizar juegos
+            # Renderizar la primera pantalla (o la biblioteca completa si no hubo cabecera)
             self.render_games()
             
-            # Check automático de updates
-            self._auto_check_updates()
-            
             # Mostrar ventana principal
             self.show()
             
@@ -2684,6 +2650,21 @@ class GameLibrary(QMainWindow):
             if hasattr(self, 'splash') and self.splash:
                 self.splash.close()
                 self.splash.deleteLater()
+            
+            # Cargar el resto de la biblioteca en segundo plano
+            if self._library_loading:
+                self._start_library_load()
+            else:
+                if self._save_pending:
+                    self._save_pending = False
+                    self.save_games()
+                self._recover_play_sessions()
+                if self.games and not self.library.has_head():
+                    # Primera vez con esta versión: dejar lista la cabecera para el próximo inicio
+                    self.library.save_head(self._first_page_games(), total=len(self.games))
+            
+            # Check automático de updates
+            self._auto_check_updates()
                 
         except Exception as e:
             print(f"Error en lazy loading: {e}")
@@ -2691,7 +2672,7 @@ class GameLibrary(QMainWindow):
             if hasattr(self, 'splash') and self.splash:
                 self.splash.close()
 
-    def apply_color_scheme_fixed(self):
+    def apply_color_scheme_fixed(self, rerender=True):
         """Aplicar el esquema de colores, tipografía y espaciado personalizado a toda la interfaz"""
         if not self.color_scheme:
             return
@@ -2865,56 +2846,59 @@ class GameLibrary(QMainWindow):
         }
         
         # Recargar las tarjetas para aplicar nuevos estilos de espaciado
-        if hasattr(self, 'render_games'):
+        if rerender and hasattr(self, 'render_games'):
             self.render_games()
 
     def load_theme(self):
-        if self.theme_file.exists():
-            try:
-                data = json.load(open(self.theme_file, 'r', encoding='utf-8'))
-                bg_path = data.get('background_image')
-                self.bg_type = data.get('background_type', 'static')  # static, animated, video
-                self.bg_opacity = float(data.get('background_opacity', self.bg_opacity))
-                self.bg_history = list(data.get('background_history', []) or [])
-                
-                # Cargar tema completo (incluye colors, typography, spacing)
-                theme_data = data.get('theme')
-                if theme_data:
-                    # Copiar TODO el objeto tema (colores, tipografía, espaciado, gradientes)
-                    self.color_scheme = dict(theme_data)
-                else:
-                    # Fallback a color_scheme para compatibilidad hacia atrás
-                    self.color_scheme = data.get('color_scheme', {})
-                
-                self.playtime_tracking_enabled = bool(data.get('playtime_tracking_enabled', self.playtime_tracking_enabled))
-                self.custom_folders = list(data.get('custom_folders', []) or [])
-                self.folder_icons = dict(data.get('folder_icons', {}) or {})
-                self.active_folder = data.get('last_folder') or None
-                self.filter_platform = data.get('filter_platform') or None
-                self.filter_favorites = bool(data.get('filter_favorites', False))
-                self.sort_mode = data.get('sort_mode') or 'name_asc'
-                
-                if bg_path and os.path.exists(bg_path):
-                    if self.bg_type == 'animated' and bg_path.lower().endswith('.gif'):
-                        # Cargar GIF como QMovie
-                        self._load_animated_background(bg_path)
-                    elif self.bg_type == 'video':
-                        # Cargar video como fondo
-                        self._load_video_background(bg_path)
-                    else:
-                        # Cargar estático
-                        pm = QPixmap(bg_path)
-                        if not pm.isNull():
-                            # Detener recursos previos (gif/video)
-                            if self.bg_movie:
-                                self.bg_movie.stop()
-                                self.bg_movie = None
-                            self._stop_video_background()
-                            if self._bg_paint_update_timer and self._bg_paint_update_timer.isActive():
-                                self._bg_paint_update_timer.stop()
-                            self.bg_pixmap = pm
-            except Exception as e:
-                print('Error cargando theme:', e)
+        """Aplica la configuración en memoria (fondo, tema, carpetas y filtros)"""
+        if not self.settings.exists:
+            return
+        try:
+            self._load_theme_state()
+            self._load_background()
+        except Exception as e:
+            print('Error cargando theme:', e)
+
+    def _load_theme_state(self):
+        """Copia a la ventana los valores de tema, carpetas y filtros (sin tocar el fondo)"""
+        self.bg_type = self.settings.get_str('background_type', 'static')  # static, animated, video
+        self.bg_opacity = self.settings.get_float('background_opacity', self.bg_opacity)
+        self.bg_history = self.settings.get_list('background_history')
+        
+        # Cargar tema completo (incluye colors, typography, spacing)
+        theme_data = self.settings.get_dict('theme')
+        if theme_data:
+            # Copiar TODO el objeto tema (colores, tipografía, espaciado, gradientes)
+            self.color_scheme = theme_data
+        else:
+            # Fallback a color_scheme para compatibilidad hacia atrás
+            self.color_scheme = self.settings.get_dict('color_scheme')
+        
+        self.playtime_tracking_enabled = self.settings.get_bool('playtime_tracking_enabled')
+        self.custom_folders = self.settings.get_list('custom_folders')
+        self.folder_icons = self.settings.get_dict('folder_icons')
+        self.active_folder = self.settings.get('last_folder') or None
+        self.filter_platform = self.settings.get('filter_platform') or None
+        self.filter_favorites = self.settings.get_bool('filter_favorites')
+        self.sort_mode = self.settings.get('sort_mode') or 'name_asc'
+
+    def _load_background(self):
+        """Carga (decodifica) la imagen, GIF o video de fondo configurado"""
+        bg_path = self.settings.get_str('background_image')
+        if bg_path and os.path.exists(bg_path):
+            if self.bg_type == 'animated' and bg_path.lower().endswith('.gif'):
+                # Cargar GIF como QMovie
+                self._load_animated_background(bg_path)
+            elif self.bg_type == 'video':
+                # Cargar video como fondo
+                self._load_video_background(bg_path)
+            else:
+                # Cargar estático
+                pm = QPixmap(bg_path)
+                if not pm.isNull():
+                    # Detener recursos previos (gif/video) y soltar los frames de GIF ya compuestos
+                    self._clear_background()
+                    self.bg_compositor.set_source(pm)
 
     def _load_animated_background(self, gif_path):
         """Carga un GIF animado como fondo"""
@@ -2924,115 +2908,113 @@ class GameLibrary(QMainWindow):
             if self.bg_movie:
                 self.bg_movie.stop()
             
+            # Sin caché de QMovie: los frames se guardan ya compuestos al tamaño de la ventana
             self.bg_movie = QMovie(gif_path)
-            self.bg_movie.setCacheMode(QMovie.CacheAll)
+            self.bg_movie.setCacheMode(QMovie.CacheNone)
             
-            # Conectar señal para redibujar cuando cambia el frame
-            self.bg_movie.frameChanged.connect(self.update)
+            # Limpiar imagen estática
+            self.bg_compositor.clear()
             
-            # Iniciar reproducción
+            # Solo se repinta cuando el GIF cambia de frame
+            self.bg_movie.frameChanged.connect(self._on_bg_movie_frame)
             self.bg_movie.start()
-            
-            # Limpiar pixmap estático
-            self.bg_pixmap = None
-            
-            # Crear timer para actualizar cada frame (aprox 30fps)
-            if not self._bg_paint_update_timer:
-                self._bg_paint_update_timer = QTimer(self)
-                self._bg_paint_update_timer.timeout.connect(self.update)
-                self._bg_paint_update_timer.setInterval(33)  # ~30fps
-            
-            if not self._bg_paint_update_timer.isActive():
-                self._bg_paint_update_timer.start()
-                
+            self._sync_background_playback()
         except Exception as e:
             print(f'Error cargando GIF animado: {e}')
 
+    def _on_bg_movie_frame(self, frame):
+        if self.bg_movie:
+            # Cada número de frame se compone una vez; las siguientes vueltas usan el ya compuesto
+            self.bg_compositor.set_source(self.bg_movie.currentPixmap(), frame)
+            self.update()
+
+    def _background_can_play(self):
+        """El fondo animado solo avanza con la ventana visible, expuesta y la aplicación activa"""
+        if not self.isVisible() or self.isMinimized():
+            return False
+        handle = self.windowHandle()
+        if handle is not None and not handle.isExposed():
+            return False
+        return QApplication.applicationState() == Qt.ApplicationActive
+
+    def _sync_background_playback(self):
+        """Pausa o reanuda el fondo animado o de video según el estado de la ventana"""
+        if self.bg_movie:
+            paused = not self._background_can_play()
+            if paused != (self.bg_movie.state() == QMovie.Paused):
+                self.bg_movie.setPaused(paused)
+        if self.bg_video:
+            self.bg_video.set_paused(not self._background_can_play())
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        handle = self.windowHandle()
+        if handle is not None and not getattr(self, '_expose_filter', False):
+            # Expose avisa cuando la ventana queda tapada o vuelve a verse
+            handle.installEventFilter(self)
+            self._expose_filter = True
+            QApplication.instance().applicationStateChanged.connect(lambda *_: self._sync_background_playback())
+        self._sync_background_playback()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._sync_background_playback()
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Expose and obj is self.windowHandle():
+            self._sync_background_playback()
+        return super().eventFilter(obj, event)
+
     def _stop_video_background(self):
-        """Detiene y libera recursos de fondo de video"""
-        try:
-            if self.bg_video_timer and self.bg_video_timer.isActive():
-                self.bg_video_timer.stop()
-        except Exception:
-            pass
-        self.bg_video_timer = None
-        try:
-            if self.bg_video_cap:
-                self.bg_video_cap.release()
-        except Exception:
-            pass
-        self.bg_video_cap = None
+        """Detiene el hilo del video y libera sus buffers"""
+        if self.bg_video:
+            try:
+                self.bg_video.frame_ready.disconnect(self._on_video_frame)
+            except TypeError:
+                pass
+            self.bg_video.stop()
+            self.bg_video = None
+        if self.bg_video_frame is not None:
+            # El compositor apunta al buffer del frame: soltar ambos juntos
+            self.bg_video_frame = None
+            self.bg_compositor.clear()
+
+    def _video_target_size(self):
+        """Tamaño físico de la ventana, al que el hilo escala cada frame"""
+        dpr = self.devicePixelRatioF()
+        return QSize(max(1, round(self.width() * dpr)), max(1, round(self.height() * dpr)))
 
     def _load_video_background(self, video_path):
-        """Carga un video como fondo (sin audio) usando OpenCV"""
+        """Carga un video como fondo (sin audio) decodificándolo con OpenCV en otro hilo"""
         try:
             # Detener GIF/animaciones previas
             if self.bg_movie:
                 self.bg_movie.stop()
                 self.bg_movie = None
-            if self._bg_paint_update_timer and self._bg_paint_update_timer.isActive():
-                self._bg_paint_update_timer.stop()
 
             # Detener video previo
             self._stop_video_background()
 
-            try:
-                import cv2
-            except ImportError:
+            if not HAVE_CV2:
                 print('OpenCV no está instalado; fondo de video no disponible')
                 return
 
-            cap = cv2.VideoCapture(video_path)
-            if not cap.isOpened():
-                print(f'No se pudo abrir el video: {video_path}')
-                return
-
-            fps = cap.get(cv2.CAP_PROP_FPS) or 0
-            if fps <= 1 or fps > 120:
-                fps = 30
-            interval = max(15, int(1000 / fps))
-
-            self.bg_video_cap = cap
-            if not self.bg_video_timer:
-                self.bg_video_timer = QTimer(self)
-                self.bg_video_timer.timeout.connect(self._update_video_frame)
-            self.bg_video_timer.setInterval(interval)
-            self.bg_video_timer.start()
-
-            # Limpiar pixmap inicial; se actualizará en el siguiente frame
-            self.bg_pixmap = None
-            self._update_video_frame()
+            # Limpiar imagen inicial; se actualizará con el primer frame
+            self.bg_compositor.clear()
+            self.bg_video = VideoBackgroundDecoder(video_path, self._video_target_size(), self)
+            self.bg_video.frame_ready.connect(self._on_video_frame)
+            self._sync_background_playback()
+            self.bg_video.start()
         except Exception as e:
             print(f'Error cargando video: {e}')
 
-    def _update_video_frame(self):
-        """Lee el siguiente frame del video y actualiza el fondo"""
-        if not self.bg_video_cap:
-            if self.bg_video_timer:
-                self.bg_video_timer.stop()
-            return
-        try:
-            import cv2
-        except ImportError:
-            if self.bg_video_timer:
-                self.bg_video_timer.stop()
+    def _on_video_frame(self):
+        """El hilo dejó un frame listo: solo se cambia la fuente del compositor"""
+        frame = self.bg_video.take_frame() if self.bg_video else None
+        if frame is None:
             return
-
-        ret, frame = self.bg_video_cap.read()
-        if not ret:
-            # Reiniciar al inicio
-            self.bg_video_cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
-            ret, frame = self.bg_video_cap.read()
-            if not ret:
-                if self.bg_video_timer:
-                    self.bg_video_timer.stop()
-                return
-
-        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        h, w, _ = frame.shape
-        bytes_per_line = 3 * w
-        img = QImage(frame.data, w, h, bytes_per_line, QImage.Format_RGB888).copy()
-        self.bg_pixmap = QPixmap.fromImage(img)
+        self.bg_video_frame = frame
+        self.bg_compositor.set_source(frame.image)
         self.update()
 
     def save_theme(self, background_image, background_opacity, color_scheme=None, background_type='static', theme=None, custom_themes=None):
@@ -3047,17 +3029,9 @@ class GameLibrary(QMainWindow):
             # no añadir entradas vacías
             pass
         
-        # Cargar datos existentes para preservar language y startup_on_boot
-        existing_data = {}
-        try:
-            if self.theme_file.exists():
-                existing_data = json.load(open(self.theme_file, 'r', encoding='utf-8'))
-        except Exception:
-            pass
-        
-        # Actualizar solo los campos que queremos cambiar
-        payload = existing_data.copy()
-        payload.update({
+        # Actualizar solo los campos que queremos cambiar (language, startup_on_boot, etc. se conservan)
+        old_scheme = dict(self.color_scheme or {})
+        changed = self.settings.update({
             'background_image': background_image if background_image else '',
             'background_type': background_type,
             'background_opacity': background_opacity,
@@ -3072,56 +3046,65 @@ class GameLibrary(QMainWindow):
             'filter_favorites': self.filter_favorites,
             'sort_mode': self.sort_mode
         })
-        if 'playtime_tracking_enabled' not in payload:
-            payload['playtime_tracking_enabled'] = self.playtime_tracking_enabled
-        
-        try:
-            json.dump(payload, open(self.theme_file, 'w', encoding='utf-8'), indent=2, ensure_ascii=False)
-        except Exception as e:
-            print('Error guardando theme', e)
-        self.load_theme()
-        self.apply_color_scheme_fixed()
-        self.render_games()
-        self.update()
+        self._apply_settings_changes(changed, old_scheme)
+
+    def _apply_settings_changes(self, changed, old_scheme=None):
+        """Rehace solo el trabajo que invalidan las claves de configuración modificadas"""
+        if not changed:
+            return
+        self._load_theme_state()
+        invalid = invalidations_for(changed)
+        if old_scheme is not None and ({'theme', 'color_scheme'} & set(changed)):
+            # Afinar: un cambio de tema solo reconstruye cards si tocó claves de las cards
+            invalid -= {INVALIDATE_STYLESHEET, INVALIDATE_CARDS}
+            invalid |= theme_invalidations(old_scheme, self.color_scheme)
+        if INVALIDATE_BACKGROUND in invalid:
+            self._clear_background()
+            self._load_background()
+        if INVALIDATE_STYLESHEET in invalid:
+            self.apply_color_scheme_fixed(rerender=False)
+        if INVALIDATE_SIDEBAR in invalid:
+            self._refresh_sidebar_buttons()
+        if INVALIDATE_CARDS in invalid or INVALIDATE_FILTER in invalid:
+            self.render_games()
+        if invalid & {INVALIDATE_BACKGROUND, INVALIDATE_REPAINT, INVALIDATE_STYLESHEET}:
+            self.update()
+
+    def _clear_background(self):
+        """Libera el fondo actual (imagen, GIF o video) antes de cargar otro"""
+        if self.bg_movie:
+            self.bg_movie.stop()
+            self.bg_movie = None
+        self._stop_video_background()
+        self.bg_compositor.clear()
 
     def _load_language(self):
-        """Carga el idioma desde theme.json antes de crear la UI"""
-        try:
-            if self.theme_file.exists():
-                data = json.load(open(self.theme_file, 'r', encoding='utf-8'))
-                lang = data.get('language', 'en')
-                I18n.set_language(lang)
-            else:
-                # Idioma por defecto: inglés
-                I18n.set_language('en')
-        except Exception as e:
-            print(f'Error cargando idioma: {e}')
-            I18n.set_language('en')
+        """Aplica el idioma guardado antes de crear la UI"""
+        I18n.set_language(self.settings.get_str('language', 'en'))
     
     def _load_process_priority(self):
-        """Cargar y aplicar la prioridad de proceso guardada"""
-        try:
-            if self.theme_file.exists():
-                data = json.load(open(self.theme_file, 'r', encoding='utf-8'))
-                priority = data.get('process_priority', 'normal')
-                self._set_process_priority(priority)
-            else:
-                self._set_process_priority('normal')
-        except Exception as e:
-            print(f'Error cargando prioridad: {e}')
-            self._set_process_priority('normal')
+        """Aplicar la prioridad de proceso guardada"""
+        self._set_process_priority(self.settings.get_str('process_priority', 'normal'))
 
     def _load_playtime_setting(self):
-        """Cargar preferencia de tracking de tiempo desde theme.json"""
-        try:
-            if self.theme_file.exists():
-                data = json.load(open(self.theme_file, 'r', encoding='utf-8'))
-                self.playtime_tracking_enabled = bool(data.get('playtime_tracking_enabled', True))
-            else:
-                self.playtime_tracking_enabled = True
-        except Exception as e:
-            print(f'Error cargando preferencia de playtime: {e}')
-            self.playtime_tracking_enabled = True
+        """Cargar preferencia de tracking de tiempo"""
+        self.playtime_tracking_enabled = self.settings.get_bool('playtime_tracking_enabled')
+
+    def _on_setting_changed(self, key, value):
+        """Aplica los efectos inmediatos de un cambio de configuración"""
+        if key == 'process_priority':
+            self._set_process_priority(value)
+        elif key == 'playtime_tracking_enabled':
+            self.set_playtime_tracking(bool(value))
+        elif key == 'startup_on_boot':
+            self._set_startup_on_boot(bool(value))
+        elif key == 'virtualized_view':
+            self.render_games()
+        elif key == 'search_fuzzy':
+            if self.search_input.text().strip():
+                self.render_games()
+        elif key == 'image_cache_mb':
+            ImageCache.instance().set_budget(self.settings.get_float('image_cache_mb') * 1024 * 1024)
     
     def _first_run_setup(self):
         """Prepara entorno de primera ejecución: crea carpetas, archivos base y verifica dependencias externas."""
@@ -3130,11 +3113,11 @@ class GameLibrary(QMainWindow):
             base.mkdir(parents=True, exist_ok=True)
             # Crear games.json si no existe
             if not self.data_file.exists():
-                json.dump([], open(self.data_file, 'w', encoding='utf-8'))
+                self.library.save([])
             # Crear theme.json por defecto si no existe
-            if not self.theme_file.exists():
+            if not self.settings.exists:
                 dialog = ColorPickerDialog(None)
-                json.dump({
+                self.settings.update({
                     'background_image': '',
                     'background_type': 'static',
                     'background_opacity': 0.15,
@@ -3146,7 +3129,8 @@ class GameLibrary(QMainWindow):
                     'language': 'en',
                     'playtime_tracking_enabled': True,
                     'process_priority': 'normal'
-                }, open(self.theme_file, 'w', encoding='utf-8'))
+                }, notify=False)
+                self.settings.flush()
             # Crear carpetas de caché
             (Path.home() / '.game_library' / 'icons').mkdir(parents=True, exist_ok=True)
             (Path.home() / '.game_library' / 'steam_images').mkdir(parents=True, exist_ok=True)
@@ -3175,8 +3159,7 @@ class GameLibrary(QMainWindow):
 
         # Preguntar sobre inicio automático en la primera ejecución
         try:
-            data = json.load(open(self.theme_file, 'r', encoding='utf-8'))
-            if not data.get('startup_on_boot_decided', False):
+            if not self.settings.get_bool('startup_on_boot_decided'):
                 reply = QMessageBox.question(
                     self,
                     t('msg_startup_title'),
@@ -3185,9 +3168,7 @@ class GameLibrary(QMainWindow):
                 )
                 want = reply == QMessageBox.Yes
                 self._set_startup_on_boot(want)
-                data['startup_on_boot'] = want
-                data['startup_on_boot_decided'] = True
-                json.dump(data, open(self.theme_file, 'w', encoding='utf-8'), indent=2, ensure_ascii=False)
+                self.settings.update({'startup_on_boot': want, 'startup_on_boot_decided': True}, notify=False)
         except Exception as e:
             print('Startup prompt error:', e)
 
@@ -3325,12 +3306,14 @@ objLink.Save()
         
     def setup_ui(self):
         self.setWindowTitle(t('app_title'))
-        # Volver a tamaño fijo para evitar recortes entre pantallas
-        self.setFixedSize(1400, 700)
+        # Redimensionable: el grid de tarjetas se re-acomoda al ancho (sin recortes entre pantallas)
+        self.setMinimumSize(self.MIN_WINDOW_SIZE)
+        self.resize(1400, 700)
         try:
             primary = QApplication.primaryScreen()
             avail = primary.availableGeometry() if primary else None
             if avail:
+                self.resize(self.size().boundedTo(avail.size()))
                 x = avail.x() + (avail.width() - self.width()) // 2
                 y = avail.y() + (avail.height() - self.height()) // 2
                 self.move(x, y)
@@ -3404,7 +3387,12 @@ objLink.Save()
                 background-color: #252d3d;
             }
         """)
-        self.search_input.textChanged.connect(self.render_games)
+        # Búsqueda diferida: una sola pasada de render al dejar de escribir
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self.render_games)
+        self.search_input.textChanged.connect(self._search_timer.start)
         tb_layout.addWidget(self.search_input)
         
         tb_layout.addStretch()
@@ -3615,15 +3603,47 @@ objLink.Save()
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         
         self.games_widget = QWidget()
-        self.games_widget.setStyleSheet("background: transparent;")
-        self.games_layout = QGridLayout()
+        self.games_widget.setObjectName('gamesContainer')
+        self._card_theme = None
+        self._apply_card_theme()
+        self.games_layout = CardFlowLayout()
         self.games_layout.setSpacing(25)
         self.games_widget.setLayout(self.games_layout)
         
         scroll.setWidget(self.games_widget)
+        self.games_scroll = scroll
+        # Las portadas GIF solo se animan mientras se ven en el viewport
+        scroll.verticalScrollBar().valueChanged.connect(AnimatedCovers.instance().schedule_visibility)
+
+        # Vista virtualizada (modelo/vista) para bibliotecas grandes: solo pinta las filas visibles
+        self.games_model = GameListModel(self)
+        self.games_view = GameGridView()
+        self.games_delegate = GameCardDelegate(self.games_view)
+        self.games_view.setItemDelegate(self.games_delegate)
+        # Portadas e iconos asíncronos: repintar solo la fila que recibió su imagen
+        self.games_delegate.image_ready.connect(self.games_model.refresh_game)
+        self.games_view.setModel(self.games_model)
+        self.games_view.game_activated.connect(self.play_game)
+        self.games_view.context_menu_requested.connect(
+            lambda game, pos: self._show_game_context_menu(game, pos, self.games_view))
+        self.games_view.favorite_toggled.connect(self._on_view_favorite_toggled)
+
+        self.games_stack = QStackedWidget()
+        self.games_stack.addWidget(scroll)
+        self.games_stack.addWidget(self.games_view)
+
+        # Barra fina de progreso mientras se crean tarjetas en segundo plano
+        self.render_progress_bar = ThinProgressBar()
+        self.render_progress_bar.hide()
+        self.render_progress.connect(self._on_render_progress)
+        games_column = QVBoxLayout()
+        games_column.setContentsMargins(0, 0, 0, 0)
+        games_column.setSpacing(0)
+        games_column.addWidget(self.render_progress_bar)
+        games_column.addWidget(self.games_stack, 1)
 
         content_layout.addWidget(self.sidebar_container)
-        content_layout.addWidget(scroll, 1)
+        content_layout.addLayout(games_column, 1)
         inner_layout.addLayout(content_layout)
         main_layout.addWidget(inner)
         
@@ -3639,6 +3659,21 @@ objLink.Save()
         self.top_bar.mouseMoveEvent = top_bar_move
         # Sin acciones de doble clic (no hay maximizar/restaurar)
 
+        # Ventana sin marco: se redimensiona desde la esquina inferior derecha
+        self._size_grip = QSizeGrip(self)
+        self._size_grip.setStyleSheet("background: transparent;")
+        self._size_grip.resize(16, 16)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        grip = getattr(self, '_size_grip', None)
+        if grip is not None:
+            grip.move(self.width() - grip.width(), self.height() - grip.height())
+            grip.raise_()
+        if getattr(self, 'bg_video', None):
+            self.bg_video.set_target_size(self._video_target_size())
+        AnimatedCovers.instance().schedule_visibility()
+
     def _start_move(self, event):
         if event.button() == Qt.LeftButton:
             self._drag_pos = event.globalPos() - self.frameGeometry().topLeft()
@@ -3664,6 +3699,10 @@ objLink.Save()
         self.sidebar_hint.setVisible(False)
         self.sidebar_layout.addWidget(self.sidebar_hint)
         self.sidebar_layout.addStretch()
+        self._sidebar_timer = QTimer(self)
+        self._sidebar_timer.setSingleShot(True)
+        self._sidebar_timer.setInterval(0)
+        self._sidebar_timer.timeout.connect(self._refresh_sidebar_buttons)
         self._refresh_sidebar_buttons()
 
         def enter(ev):
@@ -3702,15 +3741,13 @@ objLink.Save()
         self.sidebar_hint.setVisible(False)
 
     def _collect_folders(self):
+        """Carpetas personalizadas y con juegos (del índice de carpetas, sin recorrer la biblioteca)"""
+        query = self.library_query
         folders = set(self.custom_folders or [])
-        for g in self.games:
-            for f in g.get('folders', []) or []:
-                folders.add(f)
-        has_steam = any(g.get('is_steam_game') for g in self.games)
-        has_epic = any(g.get('is_epic_game') for g in self.games)
-        if has_steam:
+        folders.update(query.folder_counts())
+        if query.platform_count('Steam'):
             folders.add('Steam')
-        if has_epic:
+        if query.platform_count('Epic'):
             folders.add('Epic')
         return sorted(folders)
 
@@ -3787,17 +3824,64 @@ objLink.Save()
          self.render_games()
 
     def _persist_filters(self):
-         try:
-             data = json.load(open(self.theme_file, 'r', encoding='utf-8')) if self.theme_file.exists() else {}
-             data['filter_platform'] = self.filter_platform
-             data['filter_favorites'] = self.filter_favorites
-             data['sort_mode'] = self.sort_mode
-             data['last_folder'] = self.active_folder
-             json.dump(data, open(self.theme_file, 'w', encoding='utf-8'), indent=2, ensure_ascii=False)
-         except Exception:
-             pass
+         self.settings.update({
+             'filter_platform': self.filter_platform,
+             'filter_favorites': self.filter_favorites,
+             'sort_mode': self.sort_mode,
+             'last_folder': self.active_folder
+         })
+
+    def _sidebar_entries(self):
+        """Botones de la barra lateral: (clave, texto, icono de texto, ruta de icono, personalizada, conteo)"""
+        query = self.library_query
+        entries = [('__all__', t('label_all_games'), '🗂', None, False, len(query))]
+        if query.platform_count('Steam'):
+            entries.append(('Steam', t('label_folder_steam'), '🟦', None, False, query.folder_count('Steam')))
+        if query.platform_count('Epic'):
+            entries.append(('Epic', t('label_folder_epic'), '⬛', None, False, query.folder_count('Epic')))
+        entries.append(('__favorites__', t('btn_favorites_filter'), '⭐', None, False, query.favorite_count()))
+        for folder in self._collect_folders():
+            if folder in ('Steam', 'Epic'):
+                continue
+            icon_path = self.folder_icons.get(folder)
+            if not (icon_path and os.path.exists(icon_path)):
+                icon_path = None
+            entries.append((folder, folder, '📁', icon_path, True, query.folder_count(folder)))
+        return entries
+
+    @staticmethod
+    def _sidebar_text(label_text, icon_text, count):
+        text = f"{icon_text}  {label_text}" if icon_text else label_text
+        return f"{text}  ({count})"
+
+    def _schedule_sidebar_refresh(self):
+        """Actualiza los conteos de la barra lateral una vez tras una tanda de cambios"""
+        timer = getattr(self, '_sidebar_timer', None)
+        if timer is not None:
+            timer.start()
 
     def _refresh_sidebar_buttons(self):
+        """
+        Sincroniza la barra lateral con el índice de carpetas
+
+        Si las carpetas (y sus iconos) son las mismas, solo se cambia el texto
+        de los botones cuyo conteo o traducción cambió; si no, se reconstruye.
+        """
+        entries = self._sidebar_entries()
+        signature = [(key, icon_path, is_custom) for key, _, _, icon_path, is_custom, _ in entries]
+        if signature == getattr(self, '_sidebar_signature', None):
+            for key, label_text, icon_text, icon_path, _, count in entries:
+                btn = self.folder_buttons[key]
+                text = self._sidebar_text(label_text, '' if btn.property('hasIcon') else icon_text, count)
+                if btn.text() != text:
+                    btn.setText(text)
+            new_text = f"＋  {t('btn_new_folder')}"
+            if self._new_folder_btn.text() != new_text:
+                self._new_folder_btn.setText(new_text)
+                self.sidebar_hint.setText(t('sidebar_hint'))
+            return
+        self._sidebar_signature = signature
+
         while self.sidebar_layout.count() > 0:
             item = self.sidebar_layout.takeAt(0)
             w = item.widget()
@@ -3807,8 +3891,12 @@ objLink.Save()
 
         self.sidebar_layout.addWidget(self.sidebar_hint)
 
-        def add_btn(key, label_text, icon_text='📁', checkable=True, disabled=False, is_custom=False):
-            btn = QPushButton(f"{icon_text}  {label_text}")
+        def add_btn(key, label_text, icon_text, count, checkable=True, disabled=False, is_custom=False, pixmap=None):
+            btn = QPushButton(self._sidebar_text(label_text, '' if pixmap else icon_text, count))
+            if pixmap:
+                btn.setIcon(QIcon(pixmap))
+                btn.setIconSize(QSize(20, 20))
+                btn.setProperty('hasIcon', True)
             btn.setCheckable(checkable)
             btn.setDisabled(disabled)
             btn.setStyleSheet("""
@@ -3824,42 +3912,11 @@ objLink.Save()
             self.sidebar_layout.addWidget(btn)
             self.folder_buttons[key] = btn
 
-        add_btn('__all__', t('label_all_games'), icon_text='🗂')
-
-        has_steam = any(g.get('is_steam_game') for g in self.games)
-        has_epic = any(g.get('is_epic_game') for g in self.games)
-        if has_steam:
-            add_btn('Steam', t('label_folder_steam'), icon_text='🟦')
-        if has_epic:
-            add_btn('Epic', t('label_folder_epic'), icon_text='⬛')
-
-        add_btn('__favorites__', t('btn_favorites_filter'), icon_text='⭐')
-
-        for folder in self._collect_folders():
-            if folder in ('Steam', 'Epic'):
-                continue
-            icon_path = self.folder_icons.get(folder)
-            icon_text = '📁'
-            if icon_path and os.path.exists(icon_path):
-                pm = QPixmap(icon_path)
-                if not pm.isNull():
-                    icon_text = ''
-                    btn = QPushButton(folder)
-                    btn.setIcon(QIcon(pm))
-                    btn.setIconSize(QSize(20, 20))
-                    btn.setCheckable(True)
-                    btn.setStyleSheet("""
-                        QPushButton {background:#1a1f2e; color:#e8eaed; border:1px solid #2d3748; border-radius:10px; padding:10px; text-align:left;}
-                        QPushButton:hover {border-color:#667eea; background:#252d3d;}
-                        QPushButton:checked {background:#667eea; color:white; border-color:#667eea;}
-                    """)
-                    btn.clicked.connect(lambda _, k=folder: self._on_folder_clicked(k))
-                    btn.setContextMenuPolicy(Qt.CustomContextMenu)
-                    btn.customContextMenuRequested.connect(lambda pos, k=folder, b=btn: self._on_folder_context(k, b))
-                    self.sidebar_layout.addWidget(btn)
-                    self.folder_buttons[folder] = btn
-                    continue
-            add_btn(folder, folder, icon_text=icon_text, is_custom=True)
+        for key, label_text, icon_text, icon_path, is_custom, count in entries:
+            pixmap = None
+            if icon_path:
+                pixmap = ImageCache.instance().pixmap(icon_path, QSize(20, 20), self.devicePixelRatioF(), Qt.KeepAspectRatio)
+            add_btn(key, label_text, icon_text, count, is_custom=is_custom, pixmap=pixmap)
 
         new_btn = QPushButton(f"＋  {t('btn_new_folder')}")
         new_btn.setStyleSheet("""
@@ -3868,6 +3925,7 @@ objLink.Save()
         """)
         new_btn.clicked.connect(self._show_new_folder_dialog)
         self.sidebar_layout.addWidget(new_btn)
+        self._new_folder_btn = new_btn
 
         self.sidebar_layout.addStretch()
         self.sidebar_layout.insertWidget(0, self.sidebar_hint)
@@ -3887,16 +3945,10 @@ objLink.Save()
         else:
             self.filter_favorites = False
             self.active_folder = None if key == '__all__' else key
-        try:
-            if self.theme_file.exists():
-                data = json.load(open(self.theme_file, 'r', encoding='utf-8'))
-            else:
-                data = {}
-            data['last_folder'] = self.active_folder
-            data['filter_favorites'] = self.filter_favorites
-            json.dump(data, open(self.theme_file, 'w', encoding='utf-8'), indent=2, ensure_ascii=False)
-        except Exception:
-            pass
+        self.settings.update({
+            'last_folder': self.active_folder,
+            'filter_favorites': self.filter_favorites
+        })
         self._sync_folder_selection()
         self.render_games()
 
@@ -3944,16 +3996,10 @@ objLink.Save()
                     self.custom_folders.append(name)
                 if icon_path and os.path.exists(icon_path):
                     self.folder_icons[name] = icon_path
-                try:
-                    if self.theme_file.exists():
-                        data = json.load(open(self.theme_file, 'r', encoding='utf-8'))
-                    else:
-                        data = {}
-                    data['custom_folders'] = self.custom_folders
-                    data['folder_icons'] = self.folder_icons
-                    json.dump(data, open(self.theme_file, 'w', encoding='utf-8'), indent=2, ensure_ascii=False)
-                except Exception:
-                    pass
+                self.settings.update({
+                    'custom_folders': self.custom_folders,
+                    'folder_icons': self.folder_icons
+                })
                 self._refresh_sidebar_buttons()
 
     def _show_edit_folder_dialog(self, folder_name):
@@ -4007,6 +4053,7 @@ objLink.Save()
                     for g in self.games:
                         if g.get('folders'):
                             g['folders'] = [new_name if f == folder_name else f for f in g['folders']]
+                    self.library_query.rebuild(self.games)
                     if folder_name in self.folder_icons:
                         self.folder_icons[new_name] = self.folder_icons.pop(folder_name)
                     if self.active_folder == folder_name:
@@ -4016,17 +4063,11 @@ objLink.Save()
                     self.folder_icons[new_name] = icon_path
                 elif new_name in self.folder_icons and not icon_path:
                     del self.folder_icons[new_name]
-                try:
-                    if self.theme_file.exists():
-                        data = json.load(open(self.theme_file, 'r', encoding='utf-8'))
-                    else:
-                        data = {}
-                    data['custom_folders'] = self.custom_folders
-                    data['folder_icons'] = self.folder_icons
-                    data['last_folder'] = self.active_folder
-                    json.dump(data, open(self.theme_file, 'w', encoding='utf-8'), indent=2, ensure_ascii=False)
-                except Exception:
-                    pass
+                self.settings.update({
+                    'custom_folders': self.custom_folders,
+                    'folder_icons': self.folder_icons,
+                    'last_folder': self.active_folder
+                })
                 self.save_games()
                 self._refresh_sidebar_buttons()
                 self.render_games()
@@ -4055,20 +4096,15 @@ objLink.Save()
         for g in self.games:
             if g.get('folders'):
                 g['folders'] = [f for f in g['folders'] if f != folder_name]
+        self.library_query.rebuild(self.games)
         # Si era la carpeta activa, volver a All
         if self.active_folder == folder_name:
             self.active_folder = None
         # Persistir en theme y games
-        try:
-            if self.theme_file.exists():
-                data = json.load(open(self.theme_file, 'r', encoding='utf-8'))
-            else:
-                data = {}
-            data['custom_folders'] = self.custom_folders
-            data['last_folder'] = self.active_folder
-            json.dump(data, open(self.theme_file, 'w', encoding='utf-8'), indent=2, ensure_ascii=False)
-        except Exception:
-            pass
+        self.settings.update({
+            'custom_folders': self.custom_folders,
+            'last_folder': self.active_folder
+        })
         self.save_games()
         self._refresh_sidebar_buttons()
         self._suppress_render_animation = True
@@ -4088,6 +4124,7 @@ objLink.Save()
                 else:
                     folders = [f for f in folders if f != folder_name]
                 g['folders'] = folders
+                self._game_changed(g)
                 break
         self.save_games()
         self._refresh_sidebar_buttons()
@@ -4209,6 +4246,8 @@ objLink.Save()
         """Interceptar cambios de estado de la ventana"""
         from PyQt5.QtCore import QEvent, QTimer
         
+        if event.type() in (QEvent.WindowStateChange, QEvent.ActivationChange):
+            self._sync_background_playback()
         if event.type() == QEvent.WindowStateChange:
             # Si la ventana se está restaurando desde minimizada
             if not self.isMinimized() and event.oldState() & Qt.WindowMinimized:
@@ -4220,42 +4259,22 @@ objLink.Save()
         
         super().changeEvent(event)
 
-    # Animaciones y lógica de maximizar eliminadas para ventana fija
+    # Animaciones y lógica de maximizar eliminadas
 
     # Eliminado eventFilter y animación de ventana para evitar agrandar toda la ventana.
 
     def paintEvent(self, event):
         super().paintEvent(event)
-        if self.bg_movie and self.bg_movie.isValid():
-            # Dibujar GIF animado
-            painter = QPainter(self)
-            painter.setRenderHint(QPainter.SmoothPixmapTransform)
-            current_pixmap = self.bg_movie.currentPixmap()
-            if not current_pixmap.isNull():
-                scaled = current_pixmap.scaled(self.size(), Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-                painter.setOpacity(self.bg_opacity)
-                painter.drawPixmap(0, 0, scaled)
-        elif self.bg_pixmap:
-            # Dibujar imagen estática
+        if self.bg_compositor.has_source():
+            # Fondo (imagen, frame de GIF o de video) ya escalado y con opacidad: solo la parte expuesta
             painter = QPainter(self)
-            painter.setRenderHint(QPainter.SmoothPixmapTransform)
-            scaled = self.bg_pixmap.scaled(self.size(), Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation)
-            painter.setOpacity(self.bg_opacity)
-            painter.drawPixmap(0, 0, scaled)
+            self.bg_compositor.paint(painter, event.rect(), self.size(), self.devicePixelRatioF(), self.bg_opacity)
+            painter.end()
 
     def open_settings(self):
-        bg = ''
-        current_theme = None
-        custom_themes = {}
-        if self.theme_file.exists():
-            try:
-                with open(self.theme_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    bg = data.get('background_image', '') or ''
-                    current_theme = data.get('theme')  # Cargar tema completo si existe
-                    custom_themes = data.get('custom_themes', {})  # Cargar temas personalizados
-            except Exception:
-                pass
+        bg = self.settings.get_str('background_image')
+        current_theme = self.settings.get_dict('theme') or None  # Tema completo si existe
+        custom_themes = self.settings.get_dict('custom_themes')
         dlg = ColorPickerDialog(self, current_bg=bg, current_opacity=self.bg_opacity, color_scheme=self.color_scheme, current_bg_type=self.bg_type, current_theme=current_theme)
         # Inicializar caché de temas personalizados
         dlg.custom_themes_cache = custom_themes
@@ -4304,110 +4323,237 @@ objLink.Save()
             self._build_filter_menu()
         
     def load_games(self):
-        """Cargar juegos desde el archivo JSON"""
-        if self.data_file.exists():
-            try:
-                with open(self.data_file, 'r', encoding='utf-8') as f:
-                    self.games = json.load(f)
-            except Exception as e:
-                print(f"Error al cargar juegos: {e}")
-                self.games = []
+        """Cargar juegos desde el archivo JSON (las migraciones de esquema se aplican una sola vez)"""
+        self.games = self.library.load()
+        if dedupe_games(self.games):
+            # Se guarda al terminar el arranque, con filtros y orden ya cargados para la cabecera
+            self._save_pending = True
+        self._games_reset()
+
+    def _games_reset(self):
+        """Reconstruye índice de búsqueda y claves de orden (carga o cambios masivos)"""
+        self.search_index.rebuild(self.games)
+        self.library_query.rebuild(self.games)
+        self._schedule_sidebar_refresh()
+
+    def _game_changed(self, game):
+        """Actualiza índice y claves de un juego nuevo o modificado"""
+        if self._library_loading or self._library_load_failed:
+            self._library_changed_ids.add(game['id'])
+        self.search_index.add(game)
+        self.library_query.update(game)
+        self._schedule_sidebar_refresh()
+
+    def _game_removed(self, game_id):
+        if self._library_loading or self._library_load_failed:
+            self._library_changed_ids.add(game_id)
+        self.search_index.remove(game_id)
+        self.library_query.remove(game_id)
+        self._schedule_sidebar_refresh()
+
+    def _warm_thumbnails(self, games):
+        """Genera en segundo plano las miniaturas en disco de portadas e iconos (tras importar/editar)"""
+        decoder = ImageDecoder.instance()
+        dpr = self.devicePixelRatioF()
+        cover = QSize(316, 176) if self.view_combo.currentIndex() == 1 else QSize(296, 176)
+        for game in games:
+            image = game.get('image') or ''
+            if os.path.isfile(image) and not image.lower().endswith('.gif'):
+                decoder.warm(image, cover, dpr=dpr)
+            icon = game.get('icon') or ''
+            if os.path.isfile(icon):
+                decoder.warm(icon, QSize(42, 42), Qt.KeepAspectRatio, dpr)
+
+    def _load_games_head(self):
+        """Carga solo la primera pantalla de juegos si hay cabecera válida; si no, la biblioteca completa"""
+        head = self.library.load_head()
+        if head is None:
+            self.load_games()
+            return
+        self.games = head
+        self._games_reset()
+        self._library_loading = True
+
+    def _start_library_load(self):
+        """Carga la biblioteca completa en un thread; la vista muestra la cabecera hasta que termine"""
+        self._library_changed_ids = set()
+        loader = LibraryLoader(self.library, self.games)
+        loader.finished.connect(self._on_library_loaded)
+        self._library_loader = loader
+        loader.start()
+
+    def _on_library_loaded(self):
+        """Termina la carga en segundo plano (con un reintento síncrono si el thread no pudo leer)"""
+        loader, self._library_loader = self._library_loader, None
+        if loader.games or not self.games:
+            self._finish_library_load(loader.games, loader.search_index, loader.library_query)
+            return
+        games = self.library.load()
+        if not games:
+            # Ni el thread ni un reintento síncrono pudieron leer games.json:
+            # no guardar nunca la lista parcial encima del archivo, pero avisar
+            self._library_loading = False
+            self._library_load_failed = True
+            print("Error al cargar biblioteca: se mantiene solo la primera pantalla")
+            QMessageBox.warning(self, t('error_generic'), t('msg_library_load_failed'))
+            return
+        self._finish_library_load(games)
+
+    def _finish_library_load(self, games, search_index=None, library_query=None):
+        """
+        Adopta la biblioteca completa leída de games.json y re-renderiza
+
+        Args:
+            games: Registros en el orden del archivo
+            search_index, library_query: Ya construidos sobre `games` por LibraryLoader;
+                si faltan se reconstruyen aquí
+
+        Returns:
+            True si no quedó un guardado pendiente sin escribir
+        """
+        current = {g['id']: g for g in self.games}
+        changed = self._library_changed_ids
+        loaded_ids = {g['id'] for g in games}
+        # Los de la cabecera conservan sus cambios; los borrados durante la carga no vuelven
+        # y los agregados durante la carga van al final
+        self.games = [current.get(g['id'], g) for g in games if g['id'] in current or g['id'] not in changed]
+        self.games.extend(g for g in current.values() if g['id'] not in loaded_ids)
+        deduped = dedupe_games(self.games)
+        if deduped:
+            # Importaciones durante la carga que ya estaban en games.json
+            self._save_pending = True
+        if search_index is None or deduped:
+            self._games_reset()
         else:
-            self.games = []
-        # Asegurar campos para playtime y favoritos en datos existentes
-        changed = False
-        fallback_base = datetime.now()
-        for idx, game in enumerate(self.games):
-            if 'is_favorite' not in game:
-                game['is_favorite'] = False
-                changed = True
-            if 'total_play_time' not in game:
-                game['total_play_time'] = 0
-                changed = True
-            if 'last_played' not in game:
-                game['last_played'] = None
-                changed = True
-            if 'date_added' not in game:
-                # Intentar campos previos; si no, usar orden del archivo como prioridad más antigua
-                ts = game.get('created_at') or game.get('added_at')
-                if not ts:
-                    ts = (fallback_base - timedelta(seconds=(len(self.games) - idx))).isoformat()
-                game['date_added'] = ts
-                changed = True
-            folders = game.get('folders')
-            if not isinstance(folders, list):
-                game['folders'] = []
-                folders = game['folders']
-                changed = True
-            auto_added = False
-            if game.get('is_steam_game') and 'Steam' not in folders:
-                folders.append('Steam')
-                auto_added = True
-            if game.get('is_epic_game') and 'Epic' not in folders:
-                folders.append('Epic')
-                auto_added = True
-            if auto_added:
-                changed = True
-        if changed:
-            self.save_games()
-            
+            # Índice armado en el thread: solo re-aplicar lo que cambió mientras tanto
+            self.search_index, self.library_query = search_index, library_query
+            for game_id in changed - current.keys():
+                self._game_removed(game_id)
+            for game_id in changed & current.keys():
+                self._game_changed(current[game_id])
+        self._library_changed_ids = set()
+        self._library_loading = False
+        self._library_load_failed = False
+        saved = True
+        if self._save_pending:
+            self._save_pending = False
+            saved = self.save_games()
+        self._recover_play_sessions()
+        self._refresh_sidebar_buttons()
+        self.render_games()
+        return saved
+
     def save_games(self):
-        """Guardar juegos en el archivo JSON"""
-        try:
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(self.games, f, indent=2, ensure_ascii=False)
-        except Exception as e:
-            print(f"Error al guardar juegos: {e}")
+        """
+        Guardar juegos en el archivo JSON
+
+        Returns:
+            True si quedaron en disco; False si se difirió (carga en curso) o falló
+        """
+        if self._library_loading:
+            # Aún no está toda la biblioteca en memoria: guardar al terminar la carga
+            self._save_pending = True
+            return False
+        if self._library_load_failed:
+            # La carga completa falló: reintentar leer games.json antes de guardar
+            games = self.library.load()
+            if not games:
+                print("No se guardaron los cambios: la biblioteca completa no está cargada")
+                return False
+            self._save_pending = True
+            return self._finish_library_load(games)
+        if not self.library.save(self.games, head=self._first_page_games()):
+            return False
+        if self._journal_unsaved:
+            # Su tiempo ya está en games.json: cerrarlas en el diario
+            for session_id in self._journal_unsaved:
+                self.playtime_journal.end(session_id)
+            self._journal_unsaved = []
+            if not self._play_session:
+                self.playtime_journal.clear()
+        return True
+
+    def _first_page_games(self):
+        """Primera pantalla de juegos con los filtros y el orden persistidos (sin búsqueda)"""
+        return self._filter_and_sort_games()[:self.FIRST_PAGE_SIZE]
     
     def toggle_favorite(self, game_id, is_favorite):
         """Alternar estado favorito de un juego y guardar"""
         for game in self.games:
             if game['id'] == game_id:
                 game['is_favorite'] = is_favorite
+                self._game_changed(game)
                 break
         self.save_games()
 
+    def _on_view_favorite_toggled(self, game_id, is_favorite):
+        """Clic en la estrella de la vista virtualizada"""
+        self.toggle_favorite(game_id, is_favorite)
+        if self.filter_favorites or self.active_folder == '__favorites__':
+            self.render_games()
+        else:
+            self.games_model.refresh_game(game_id)
+
     def _update_last_played(self, game_id, persist=False):
         """Actualizar el campo last_played para un juego"""
         timestamp = datetime.now().isoformat()
         for game in self.games:
             if game['id'] == game_id:
                 game['last_played'] = timestamp
+                self._game_changed(game)
                 break
         if persist:
             self.save_games()
 
     def _update_playtime_labels(self, game_id, total_seconds):
         """Refresca el texto de tiempo jugado en la tarjeta correspondiente."""
-        # Recorre el grid para encontrar la GameCard y actualizar su label sin re-renderizar todo
+        if self.games_stack.currentWidget() is self.games_view:
+            self.games_model.set_playtime(game_id, total_seconds)
+            return
+        card = self._cards_by_id.get(game_id)
+        if card is None:
+            return
         try:
-            for i in range(self.games_layout.count()):
-                item = self.games_layout.itemAt(i)
-                w = item.widget()
-                # En grid, el widget es un contenedor; en lista es la propia card
-                candidates = []
-                if hasattr(w, 'game'):
-                    candidates.append(w)
-                if hasattr(w, 'layout') and callable(w.layout):
-                    layout = w.layout()
-                    if layout and layout.count() == 1 and hasattr(layout.itemAt(0).widget(), 'game'):
-                        candidates.append(layout.itemAt(0).widget())
-                for card in candidates:
-                    if hasattr(card, 'game') and card.game.get('id') == game_id:
-                        if hasattr(card, 'playtime_label'):
-                            card.playtime_label.setText(t('label_playtime', value=card._format_playtime(total_seconds)))
-                        return
-        except Exception:
-            pass
+            card.set_playtime(total_seconds)
+        except RuntimeError:
+            # La tarjeta se destruyó sin pasar por el registro
+            self._cards_by_id.pop(game_id, None)
+
+    def _recover_play_sessions(self):
+        """Suma a total_play_time las sesiones que quedaron abiertas por un cierre inesperado."""
+        # La sesión en curso y las ya sumadas pendientes de guardado no se recuperan
+        known = set(self._journal_unsaved)
+        if self._play_session:
+            known.add(self._play_session.get('session_id'))
+        unfinished = [s for s in self.playtime_journal.recover() if s['session'] not in known]
+        if not unfinished:
+            return
+        by_id = {g['id']: g for g in self.games}
+        for session in unfinished:
+            self._journal_unsaved.append(session['session'])
+            game = by_id.get(session['game_id'])
+            if not game or session['elapsed'] <= 0:
+                continue
+            game['total_play_time'] = int(game.get('total_play_time', 0) or 0) + session['elapsed']
+            if session.get('at'):
+                game['last_played'] = session['at']
+            self._game_changed(game)
+        # El diario se limpia solo si el guardado llega a disco
+        self.save_games()
 
     def _start_play_session(self, game_id, process_handle=None):
         """Inicia una sesión de juego para acumular tiempo."""
         # Cerrar sesión anterior si existiera
         self._finish_play_session()
+        start_time = datetime.now()
         self._play_session = {
             'game_id': game_id,
-            'start_time': datetime.now(),
-            'process': process_handle
+            'start_time': start_time,
+            'process': process_handle,
+            'session_id': self.playtime_journal.begin(game_id, start_time),
+            'last_checkpoint': 0,
+            # Tiempo acumulado al empezar, para el contador en vivo sin buscar el juego en cada tick
+            'base': next((int(g.get('total_play_time', 0) or 0) for g in self.games if g['id'] == game_id), 0)
         }
         self._update_last_played(game_id, persist=True)
         if self.playtime_tracking_enabled and not self.playtime_timer.isActive():
@@ -4431,11 +4577,18 @@ objLink.Save()
                 total = base + elapsed
                 game['total_play_time'] = total
                 game['last_played'] = datetime.now().isoformat()
+                self._game_changed(game)
                 self._update_playtime_labels(game_id, total)
                 break
-        self.save_games()
+        session_id = self._play_session.get('session_id')
+        if session_id:
+            # Tiempo final en el diario: si el guardado se difiere o falla, el próximo inicio lo recupera
+            self.playtime_journal.checkpoint(session_id, game_id, elapsed)
+            self._journal_unsaved.append(session_id)
         self._play_session = None
         self.playtime_timer.stop()
+        # La sesión se cierra en el diario solo cuando save_games() escribe games.json
+        self.save_games()
 
     def _tick_playtime(self):
         """Revisa periódicamente si el proceso terminó para cerrar la sesión."""
@@ -4447,12 +4600,12 @@ objLink.Save()
         start = self._play_session.get('start_time')
         if start and game_id:
             elapsed = int((datetime.now() - start).total_seconds())
+            # Checkpoint periódico en el diario (no reescribe games.json)
+            if elapsed - self._play_session.get('last_checkpoint', 0) >= CHECKPOINT_INTERVAL_SECONDS:
+                self.playtime_journal.checkpoint(self._play_session.get('session_id'), game_id, elapsed)
+                self._play_session['last_checkpoint'] = elapsed
             # Mostrar tiempo vivo en la tarjeta
-            for game in self.games:
-                if game['id'] == game_id:
-                    base = int(game.get('total_play_time', 0) or 0)
-                    self._update_playtime_labels(game_id, base + elapsed)
-                    break
+            self._update_playtime_labels(game_id, self._play_session.get('base', 0) + elapsed)
         running = True
         if proc is not None:
             try:
@@ -4488,6 +4641,8 @@ objLink.Save()
         cache_files = [
             Path(__file__).parent / '.cache',
             Path(__file__).parent / 'image_cache',
+            REMOTE_CACHE_DIR,
+            THUMBNAIL_DIR,
         ]
         
         # Eliminar directorios
@@ -4523,6 +4678,7 @@ objLink.Save()
             QPixmapCache.clear()
         except:
             pass
+        ImageCache.instance().clear()
         
         # Convertir bytes a MB
         size_mb = total_size / (1024 * 1024)
@@ -4676,13 +4832,7 @@ objLink.Save()
         """Check automático de updates al iniciar (solo si está habilitado)"""
         try:
             # Verificar si el auto-update está habilitado
-            if not self.theme_file.exists():
-                return
-            
-            data = json.load(open(self.theme_file, 'r', encoding='utf-8'))
-            auto_update_enabled = data.get('auto_update_enabled', False)
-            
-            if not auto_update_enabled:
+            if not self.settings.get_bool('auto_update_enabled'):
                 return
             
             # Check for updates en background
@@ -4804,52 +4954,40 @@ objLink.Save()
         
         dialog.exec_()
             
+    def _filter_and_sort_games(self, search_query=''):
+        """Juegos con la búsqueda, favoritos, carpeta, plataforma y orden activos (lista cacheada: no modificar)"""
+        folder = self.active_folder if self.active_folder not in (None, '__favorites__', '__all__') else None
+        return self.library_query.run(
+            search_query,
+            folder=folder,
+            platform=self.filter_platform,
+            favorites=self.filter_favorites or self.active_folder == '__favorites__',
+            sort_mode=self.sort_mode,
+            fuzzy=self.settings.get_bool('search_fuzzy'),
+        )
+
     def render_games(self):
-        """Renderizar la lista de juegos"""
-        # Limpiar layout
-        while self.games_layout.count():
-            item = self.games_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        
-        # Filtrar juegos por búsqueda
+        """Renderizar la lista de juegos (solo se tocan las tarjetas que cambian)"""
         search_query = self.search_input.text().lower().strip() if hasattr(self, 'search_input') else ''
-        filtered_games = [g for g in self.games if search_query in g['name'].lower()] if search_query else self.games
-        
-        # Filtrar por favoritos (dropdown o carpeta Favoritos)
-        if self.filter_favorites or (self.active_folder == '__favorites__'):
-            filtered_games = [g for g in filtered_games if g.get('is_favorite', False)]
-
-        # Filtrar por carpeta activa (custom/Steam/Epic)
-        if self.active_folder and self.active_folder not in ('__favorites__', '__all__'):
-            filtered_games = [g for g in filtered_games if self.active_folder in (g.get('folders') or [])]
-
-        # Filtrar por plataforma
-        if self.filter_platform == 'Steam':
-            filtered_games = [g for g in filtered_games if g.get('is_steam_game')]
-        elif self.filter_platform == 'Epic':
-            filtered_games = [g for g in filtered_games if g.get('is_epic_game')]
-        elif self.filter_platform == 'Manual':
-            filtered_games = [g for g in filtered_games if not g.get('is_steam_game') and not g.get('is_epic_game')]
-
-        # Ordenamiento
-        def sort_key(game):
-            if self.sort_mode == 'name_asc':
-                return (game.get('name') or '').lower()
-            if self.sort_mode == 'last_played_desc':
-                ts = game.get('last_played') or ''
-                return ts
-            if self.sort_mode == 'playtime_desc':
-                return -(int(game.get('total_play_time', 0) or 0))
-            if self.sort_mode == 'date_added_desc':
-                return game.get('date_added') or ''
-            if self.sort_mode == 'date_added_asc':
-                return game.get('date_added') or ''
-            return 0
-        reverse = True if self.sort_mode in ('last_played_desc', 'playtime_desc', 'date_added_desc') else False
-        filtered_games = sorted(filtered_games, key=sort_key, reverse=reverse)
+        filtered_games = self._filter_and_sort_games(search_query)
+        list_mode = self.view_combo.currentIndex() == 1  # 0=Grid, 1=List
+
+        if filtered_games and self._use_virtual_view(len(filtered_games)):
+            self._clear_game_cards()
+            self.games_delegate.set_colors(GameCard._custom_colors)
+            self.games_view.set_list_mode(list_mode)
+            self.games_model.set_games(filtered_games)
+            self.games_stack.setCurrentWidget(self.games_view)
+            self._suppress_render_animation = False
+            return
+        self.games_model.set_games([])
+        self.games_stack.setCurrentWidget(self.games_scroll)
         
         if not filtered_games:
+            if self._library_loading:
+                # Los resultados pueden estar en el resto de la biblioteca, que aún se está cargando
+                return
+            self._clear_game_cards(recycle=True)
             # Mostrar estado vacío o sin resultados
             if not self.games:
                 empty_label = QLabel("Tu biblioteca está vacía\n\nAgrega tu primer juego para comenzar")
@@ -4861,30 +4999,225 @@ objLink.Save()
                 font-size: 18px;
                 padding: 100px;
             """)
-            self.games_layout.addWidget(empty_label, 0, 0)
+            self.games_layout.add_widget(empty_label, 0, full_row=True)
+            self._empty_label = empty_label
             return
         
-        # Mostrar juegos en grid
-        list_mode = self.view_combo.currentIndex() == 1  # 0=Grid, 1=List
-        columns = 1 if list_mode else 3
-        skip_anim = getattr(self, '_suppress_render_animation', False)
-        for i, game in enumerate(filtered_games):
-            delay = 0 if skip_anim else i * 50
-            card = GameCard(game, self, list_mode=list_mode, animation_delay=delay)
+        self._reconcile_cards(filtered_games, list_mode)
+        self._suppress_render_animation = False
+
+    def _apply_card_theme(self):
+        """Aplica al contenedor del grid la hoja de estilo compartida de las tarjetas (una vez por tema)"""
+        theme = CardTheme.for_colors(GameCard._custom_colors)
+        if theme is self._card_theme:
+            return
+        self._card_theme = theme
+        self.games_widget.setStyleSheet("QWidget#gamesContainer { background: transparent; }" + theme.stylesheet)
+
+    def _clear_game_cards(self, recycle=False):
+        """Elimina todas las tarjetas (y el estado vacío) del grid; con recycle las guarda en el pool"""
+        self.card_animator.cancel_all()
+        self._cancel_card_build()
+        cards = {id(entry['widget']): entry for entry in self._rendered_cards.values()}
+        list_mode = bool(self._rendered_cards_style and self._rendered_cards_style[0])
+        while self.games_layout.count():
+            item = self.games_layout.takeAt(0)
+            widget = item.widget()
+            if widget is None:
+                continue
+            entry = cards.get(id(widget))
+            if recycle and entry is not None:
+                self.card_pool.release(list_mode, widget, entry['card'])
+            else:
+                widget.deleteLater()
+        self._rendered_cards = {}
+        self._rendered_card_keys = []
+        self._cards_by_id.clear()
+        AnimatedCovers.instance().schedule_visibility()
+        if not recycle:
+            self._rendered_cards_style = None
+        self._empty_label = None
+
+    @staticmethod
+    def _card_signature(game):
+        """Campos que obligan a reconstruir la tarjeta si cambian"""
+        return (game.get('name'), game.get('path'), game.get('image'), game.get('icon'),
+                bool(game.get('is_steam_game')), bool(game.get('is_epic_game')))
+
+    def _reconcile_cards(self, games, list_mode):
+        """
+        Lleva el grid de la lista renderizada anterior a `games` con el mínimo de cambios:
+        elimina las tarjetas que sobran, crea las nuevas, reconstruye las que cambiaron
+        y solo recoloca las que cambiaron de posición. Las demás (con su imagen ya
+        cargada) quedan intactas, igual que la posición del scroll.
+        """
+        # Modo, tema o idioma distintos: todas las tarjetas son inválidas
+        style = (list_mode, dict(GameCard._custom_colors), I18n.get_language())
+        if style != self._rendered_cards_style:
+            # Las tarjetas guardadas tienen el estilo/modo anterior
+            self.card_pool.clear()
+            self._clear_game_cards()
+            self._rendered_cards_style = style
+            self._apply_card_theme()
             if list_mode:
-                # Direct add (vertical stack)
-                self.games_layout.addWidget(card, i, 0)
+                self.games_layout.set_cell(QSize(900, 180), max_columns=1)
             else:
-                container = QWidget()
-                container.setFixedSize(320, 300)
-                c_layout = QHBoxLayout(container)
-                c_layout.setContentsMargins(10, 10, 10, 10)
-                c_layout.addWidget(card)
-                row = i // columns
-                col = i % columns
-                self.games_layout.addWidget(container, row, col)
-            self._suppress_render_animation = False
-            
+                self.games_layout.set_cell(QSize(320, 300))
+        elif self._empty_label is not None:
+            self.games_layout.removeWidget(self._empty_label)
+            self._empty_label.deleteLater()
+            self._empty_label = None
+
+        # Clave estable por juego (los ids repetidos se distinguen por aparición)
+        keys = []
+        seen = {}
+        for game in games:
+            n = seen.get(game['id'], 0)
+            seen[game['id']] = n + 1
+            keys.append((game['id'], n))
+
+        # Pool: el área visible más una pantalla de margen
+        self.card_pool.set_capacity(len(self._visible_card_slots()) * 2)
+
+        wanted = set(keys)
+        for key in self._rendered_card_keys:
+            if key not in wanted:
+                # Puede no existir si quedó pendiente de un render anterior cancelado
+                entry = self._rendered_cards.pop(key, None)
+                if entry is not None:
+                    if self._cards_by_id.get(key[0]) is entry['card']:
+                        del self._cards_by_id[key[0]]
+                    self.games_layout.removeWidget(entry['widget'])
+                    self.card_pool.release(list_mode, entry['widget'], entry['card'])
+
+        pending = []
+        for i, (key, game) in enumerate(zip(keys, games)):
+            entry = self._rendered_cards.get(key)
+            sig = self._card_signature(game)
+            if entry and (entry['sig'] != sig or entry['card'].game is not game):
+                # Datos visibles cambiados: re-enlazar la misma tarjeta
+                entry['card'].bind(game)
+                entry['sig'] = sig
+                entry['favorite'] = bool(game.get('is_favorite'))
+                entry['playtime'] = int(game.get('total_play_time', 0) or 0)
+            # Posición lógica: el layout la convierte en fila/columna según el ancho
+            position = i
+            if entry is None:
+                # Crear tarjetas es lo caro: se hace después, por tandas
+                pending.append((key, game, sig, position))
+                continue
+            # Cambios menores: actualizar en sitio
+            favorite = bool(game.get('is_favorite'))
+            if entry['favorite'] != favorite:
+                entry['card'].set_favorite(favorite)
+                entry['favorite'] = favorite
+            playtime = int(game.get('total_play_time', 0) or 0)
+            if entry['playtime'] != playtime:
+                entry['card'].set_playtime(playtime)
+                entry['playtime'] = playtime
+            if entry['position'] != position:
+                self.games_layout.move_widget(entry['widget'], position)
+                entry['position'] = position
+        self._rendered_card_keys = keys
+        self._start_card_build(pending, list_mode)
+        AnimatedCovers.instance().schedule_visibility()
+
+    def _build_card(self, key, game, sig, position, list_mode):
+        """Toma una tarjeta del pool (o crea una) para un juego y la agrega al grid"""
+        pooled = self.card_pool.acquire(list_mode)
+        if pooled is not None:
+            widget, card = pooled
+            card.bind(game)
+        else:
+            widget, card = self._new_card(game, list_mode)
+        self._rendered_cards[key] = {'widget': widget, 'card': card, 'sig': sig, 'position': position,
+                                     'favorite': bool(game.get('is_favorite')),
+                                     'playtime': int(game.get('total_play_time', 0) or 0)}
+        if key[1] == 0:
+            self._cards_by_id[key[0]] = card
+        if pooled is not None:
+            widget.show()
+        self.games_layout.add_widget(widget, position)
+        return card
+
+    def _new_card(self, game, list_mode):
+        card = GameCard(game, self, list_mode=list_mode)
+        if list_mode:
+            # Direct add (vertical stack)
+            widget = card
+        else:
+            widget = QWidget()
+            widget.setFixedSize(320, 300)
+            c_layout = QHBoxLayout(widget)
+            c_layout.setContentsMargins(10, 10, 10, 10)
+            c_layout.addWidget(card)
+        return widget, card
+
+    def _start_card_build(self, pending, list_mode):
+        """
+        Crea ya las tarjetas de la primera pantalla y deja el resto para _render_tick
+
+        Un render nuevo reemplaza la cola pendiente, así que una búsqueda que
+        llega a mitad de camino abandona las tarjetas que ya no hacen falta.
+        """
+        self._cancel_card_build()
+        slots = self._visible_card_slots()
+        first = [p for p in pending if p[3] in slots]
+        created = [self._build_card(*p, list_mode) for p in first]
+        if created and self._card_animations_enabled():
+            self.card_animator.animate(created)
+        self._pending_cards = [p for p in pending if p[3] not in slots]
+        if self._pending_cards:
+            self._pending_list_mode = list_mode
+            self._render_built = 0
+            self._render_total = len(self._pending_cards)
+            self.render_progress.emit(0, self._render_total)
+            self._render_timer.start()
+
+    def _render_tick(self):
+        """Crea tarjetas pendientes hasta agotar RENDER_SLICE_MS y devuelve el control al event loop"""
+        deadline = time.perf_counter() + self.RENDER_SLICE_MS / 1000
+        pending = self._pending_cards
+        while pending and time.perf_counter() < deadline:
+            self._build_card(*pending.pop(0), self._pending_list_mode)
+            self._render_built += 1
+        self.render_progress.emit(self._render_built, self._render_total)
+        if not pending:
+            self._render_timer.stop()
+
+    def _cancel_card_build(self):
+        if self._pending_cards or self._render_timer.isActive():
+            self._render_timer.stop()
+            self._pending_cards = []
+            self.render_progress.emit(self._render_total, self._render_total)
+
+    def _on_render_progress(self, built, total):
+        if built >= total:
+            self.render_progress_bar.hide()
+            return
+        self.render_progress_bar.set_progress(built, total)
+        self.render_progress_bar.show()
+
+    def _card_animations_enabled(self):
+        """Sin animación de entrada en modo de bajo consumo, con bibliotecas grandes o al restaurar"""
+        if getattr(self, '_suppress_render_animation', False) or self.settings.get_bool('low_power_mode'):
+            return False
+        return len(self.games) <= int(self.settings.get('animation_max_games') or 0)
+
+    def _visible_card_slots(self):
+        """Posiciones del grid que intersectan el viewport del scroll (según el tamaño fijo de las celdas)"""
+        layout = self.games_layout
+        columns = layout.columns_for(self.games_scroll.viewport().width())
+        cell = layout.cell().height() + layout.spacing()
+        top = self.games_scroll.verticalScrollBar().value() - layout.contentsMargins().top()
+        height = self.games_scroll.viewport().height()
+        first, last = max(0, top // cell), max(0, (top + height) // cell)
+        return range(first * columns, (last + 1) * columns)
+
+    def _use_virtual_view(self, count):
+        """Vista virtualizada si el usuario la activó o si hay demasiadas tarjetas que crear"""
+        return self.settings.get_bool('virtualized_view') or count > self.VIRTUAL_VIEW_THRESHOLD
+
     def add_game(self):
         """Abrir diálogo para agregar juego"""
         dialog = AddGameDialog(self)
@@ -4896,8 +5229,10 @@ objLink.Save()
                 game_data['last_played'] = None
                 game_data['date_added'] = datetime.now().isoformat()
                 game_data['folders'] = []
-                game_data['id'] = str(len(self.games) + 1)
+                # Id único como en los escáneres: len()+1 repetía ids tras borrar juegos
+                game_data['id'] = str(uuid.uuid4())
                 self.games.append(game_data)
+                self._game_changed(game_data)
                 # Intentar icono si vacío
                 if not game_data.get('icon') and os.path.exists(game_data['path']):
                     try:
@@ -4945,6 +5280,7 @@ objLink.Save()
                         pass
                 self.save_games()
                 self.render_games()
+                self._warm_thumbnails([game_data])
             else:
                 QMessageBox.warning(self, "Error", "Por favor completa los campos obligatorios")
     
@@ -5062,12 +5398,14 @@ objLink.Save()
                         'steam_appid': game_data['appid'],
                         'is_steam_game': True,
                         'is_favorite': False,
+                        'folders': ['Steam'],
                         'total_play_time': 0,
                         'last_played': None,
                         'date_added': datetime.now().isoformat()
                     }
 
                     self.games.append(new_game)
+                    self._game_changed(new_game)
                     imported_count += 1
 
                 except Exception as e:
@@ -5080,6 +5418,7 @@ objLink.Save()
             if imported_count > 0:
                 self.save_games()
                 self.render_games()
+                self._warm_thumbnails(self.games[-imported_count:])
                 
                 QMessageBox.information(
                     self,
@@ -5236,12 +5575,14 @@ objLink.Save()
                         'epic_app_name': game_data['app_name'],
                         'is_epic_game': True,
                         'is_favorite': False,
+                        'folders': ['Epic'],
                         'total_play_time': 0,
                         'last_played': None,
                         'date_added': datetime.now().isoformat()
                     }
                     
                     self.games.append(new_game)
+                    self._game_changed(new_game)
                     imported_count += 1
                     
                 except Exception as e:
@@ -5254,6 +5595,7 @@ objLink.Save()
             if imported_count > 0:
                 self.save_games()
                 self.render_games()
+                self._warm_thumbnails(self.games[-imported_count:])
                 
                 QMessageBox.information(
                     self,
@@ -5316,6 +5658,65 @@ objLink.Save()
         # Fallback
         return ''
                 
+    def _show_game_context_menu(self, game, global_pos, source=None):
+        """Menú contextual de un juego (GameCard o vista virtualizada)"""
+        menu = QMenu(source or self)
+        menu.setStyleSheet("""
+            QMenu {
+                background-color: #1a1f2e;
+                border: 1px solid #2d3748;
+                border-radius: 8px;
+                padding: 5px;
+            }
+            QMenu::item {
+                color: #e8eaed;
+                padding: 10px 20px;
+                border-radius: 6px;
+            }
+            QMenu::item:selected {
+                background-color: #252d3d;
+            }
+        """)
+        
+        play_action = menu.addAction("▶ Jugar")
+        edit_action = menu.addAction("✎ Editar")
+        delete_action = menu.addAction("🗑 Eliminar")
+
+        folders_menu = menu.addMenu(t('menu_folders'))
+        folders_menu.setStyleSheet(menu.styleSheet())
+        new_folder_action = folders_menu.addAction(f"＋ {t('btn_new_folder')}")
+        folders_menu.addSeparator()
+        folders = self._collect_folders()
+        for fname in ['Steam', 'Epic']:
+            if fname not in folders:
+                folders.append(fname)
+        seen = set()
+        for fname in folders:
+            if fname in seen:
+                continue
+            seen.add(fname)
+            action = folders_menu.addAction(fname)
+            action.setCheckable(True)
+            if fname in (game.get('folders') or []):
+                action.setChecked(True)
+            is_auto_locked = (fname == 'Steam' and game.get('is_steam_game')) or (fname == 'Epic' and game.get('is_epic_game'))
+            if is_auto_locked:
+                action.setDisabled(True)
+            def make_handler(folder=fname, act=action, locked=is_auto_locked):
+                return lambda: self._update_game_folders(game['id'], folder, add=act.isChecked(), lock_auto=locked)
+            action.toggled.connect(make_handler())
+
+        new_folder_action.triggered.connect(lambda: self._show_new_folder_dialog())
+        
+        action = menu.exec_(global_pos)
+        
+        if action == play_action:
+            self.play_game(game)
+        elif action == edit_action:
+            self.edit_game(game)
+        elif action == delete_action:
+            self.delete_game(game)
+
     def edit_game(self, game):
         """Editar juego existente"""
         dialog = AddGameDialog(self, game)
@@ -5362,28 +5763,12 @@ objLink.Save()
                                             ctypes.windll.user32.DestroyIcon(small_icon)
                             except Exception:
                                 pass
+                        self._game_changed(self.games[i])
+                        self._warm_thumbnails([self.games[i]])
                         break
                 self.save_games()
                 self.render_games()
                 
-    def _dedupe_games_by_appid(self) -> bool:
-        """Elimina duplicados conservando el primero cuando comparten steam_appid.
-        Retorna True si hubo cambios."""
-        seen = set()
-        new_list = []
-        changed = False
-        for g in self.games:
-            appid = g.get('steam_appid')
-            if appid:
-                if appid in seen:
-                    changed = True
-                    continue
-                seen.add(appid)
-            new_list.append(g)
-        if changed:
-            self.games = new_list
-        return changed
-
     def delete_game(self, game):
         """Eliminar juego"""
         reply = QMessageBox.question(
@@ -5395,6 +5780,7 @@ objLink.Save()
         
         if reply == QMessageBox.Yes:
             self.games = [g for g in self.games if g['id'] != game['id']]
+            self._game_removed(game['id'])
             self.save_games()
             self.render_games()
             
@@ -5459,14 +5845,16 @@ objLink.Save()
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Error al ejecutar el juego:\n{str(e)}")
 
-        def closeEvent(self, event):
-            """Al cerrar la app, finaliza sesión de juego en curso."""
-            try:
-                if self.playtime_tracking_enabled:
-                    self._finish_play_session()
-            except Exception:
-                pass
-            super().closeEvent(event)
+    def closeEvent(self, event):
+        """Al cerrar la app, finaliza sesión de juego en curso."""
+        try:
+            if self.playtime_tracking_enabled:
+                self._finish_play_session()
+        except Exception:
+            pass
+        # El hilo del video no puede seguir vivo al destruirse la ventana
+        self._stop_video_background()
+        super().closeEvent(event)
 
 
 def main():
@@ -48,6 +48,12 @@ TRANSLATIONS = {
         'label_playtime': 'Tiempo jugado: {value}',
         'label_playtime_tracking': 'Seguimiento de tiempo de juego',
         'hint_playtime_tracking': 'Puedes desactivarlo para reducir uso de recursos',
+        'label_virtualized_view': 'Vista optimizada para bibliotecas grandes',
+        'hint_virtualized_view': 'Se activa sola con más de 500 juegos',
+        'label_search_fuzzy': 'Búsqueda tolerante a errores',
+        'hint_search_fuzzy': 'Incluye coincidencias aproximadas, ordenadas por relevancia',
+        'label_low_power_mode': 'Modo de bajo consumo',
+        'hint_low_power_mode': 'Desactiva las animaciones de las tarjetas',
         'btn_clear_cache': 'Limpiar Caché',
         'label_clear_cache': 'Eliminar imágenes en caché y datos temporales',
         'confirm_clear_cache': '¿Estás seguro de que deseas eliminar toda la caché? Esto borrará todas las imágenes descargadas y datos temporales.',
@@ -213,6 +219,7 @@ TRANSLATIONS = {
         'msg_theme_deleted': 'Tema eliminado',
         'msg_confirm_delete_theme': '¿Estás seguro de que deseas eliminar el tema "{name}"?',
         'msg_theme_name_required': 'Por favor ingresa un nombre para el tema',
+        'msg_library_load_failed': 'No se pudo leer la biblioteca completa (games.json).\n\nSolo se muestra la primera pantalla y los cambios no se guardarán hasta que el archivo pueda leerse; se reintentará en cada cambio.',
     },
     'en': {
         # Ventana principal
@@ -260,6 +267,12 @@ TRANSLATIONS = {
         'label_playtime': 'Play time: {value}',
         'label_playtime_tracking': 'Playtime tracking',
         'hint_playtime_tracking': 'Disable it to reduce resource usage',
+        'label_virtualized_view': 'Optimized view for large libraries',
+        'hint_virtualized_view': 'Turns on automatically above 500 games',
+        'label_search_fuzzy': 'Typo-tolerant search',
+        'hint_search_fuzzy': 'Includes approximate matches, sorted by relevance',
+        'label_low_power_mode': 'Low power mode',
+        'hint_low_power_mode': 'Turns off card animations',
         'btn_clear_cache': 'Clear Cache',
         'label_clear_cache': 'Delete cached images and temporary data',
         'confirm_clear_cache': 'Are you sure you want to clear all cache? This will delete all downloaded images and temporary data.',
@@ -425,6 +438,7 @@ TRANSLATIONS = {
         'msg_theme_deleted': 'Theme deleted',
         'msg_confirm_delete_theme': 'Are you sure you want to delete the theme "{name}"?',
         'msg_theme_name_required': 'Please enter a theme name',
+        'msg_library_load_failed': 'The full library (games.json) could not be read.\n\nOnly the first screen is shown and changes will not be saved until the file can be read; it will be retried on every change.',
     }
 }
 
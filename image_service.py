@@ -0,0 +1,566 @@
+"""
+Servicio de imágenes de portadas e iconos
+
+ImageDecoder decodifica archivos locales en un QThreadPool directamente al
+tamaño en que se van a mostrar (QImageReader.setScaledSize), devuelve QImage
+por señal y la conversión a QPixmap se hace en el hilo de UI. Cada pedido se
+puede cancelar, y se cancela solo si se destruye el widget dueño.
+
+ImageCache guarda los QPixmap ya escalados de toda la aplicación (tarjetas,
+vista virtualizada, iconos de carpetas) con presupuesto de memoria y
+expulsión LRU, de modo que re-renderizar no vuelve a leer ni escalar nada.
+
+ThumbnailCache guarda en disco miniaturas ya escaladas al tamaño de la
+tarjeta (WebP, o JPEG/PNG si no hay plugin WebP), con clave hash del
+contenido + tamaño, para que un arranque en frío no vuelva a decodificar las
+portadas originales a resolución completa.
+
+ImageFetcher descarga portadas e iconos remotos (http/https) en un pool
+acotado de hilos, une pedidos simultáneos de la misma URL, guarda el archivo
+en la caché de disco y lo entrega a ImageDecoder para decodificarlo al tamaño
+de destino.
+"""
+import hashlib
+import itertools
+import os
+import threading
+import urllib.request
+from pathlib import Path
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from PyQt5.QtCore import Qt, QObject, QRunnable, QThread, QThreadPool, QSize, pyqtSignal
+from PyQt5.QtGui import QImage, QImageReader, QImageWriter, QPixmap
+
+
+def decode_scaled(path: str, width: int, height: int, mode=Qt.KeepAspectRatioByExpanding) -> QImage:
+    """
+    Decodifica una imagen al tamaño pedido sin pasar por la resolución completa
+
+    Con KeepAspectRatioByExpanding el resultado se recorta al centro para
+    llenar exactamente width x height; con KeepAspectRatio entra dentro del
+    rectángulo. Seguro de llamar desde cualquier hilo. Retorna QImage nulo si falla.
+    """
+    reader = QImageReader(path)
+    reader.setAutoTransform(True)
+    source = reader.size()
+    if source.isValid() and width > 0 and height > 0:
+        # Los formatos que no escalan al decodificar los escala QImageReader tras leer
+        reader.setScaledSize(source.scaled(width, height, mode))
+    image = reader.read()
+    if image.isNull():
+        return image
+    if mode == Qt.KeepAspectRatioByExpanding and (image.width() > width or image.height() > height):
+        x = max(0, (image.width() - width) // 2)
+        y = max(0, (image.height() - height) // 2)
+        image = image.copy(x, y, min(width, image.width()), min(height, image.height()))
+    return image
+
+
+# Carpeta y calidad de las miniaturas en disco
+THUMBNAIL_DIR = Path.home() / '.game_library' / 'thumbnails'
+THUMBNAIL_QUALITY = 85
+# Fuentes más chicas que esto se decodifican directo (la miniatura no ahorraría nada)
+THUMBNAIL_MIN_SOURCE_BYTES = 32 * 1024
+
+
+class ThumbnailCache:
+    """Miniaturas en disco por (hash del contenido, tamaño, modo); seguro entre hilos"""
+    _instance = None
+
+    def __init__(self, cache_dir: Path = THUMBNAIL_DIR, quality: int = THUMBNAIL_QUALITY):
+        self.cache_dir = Path(cache_dir)
+        self.quality = quality
+        formats = {bytes(f).decode() for f in QImageWriter.supportedImageFormats()}
+        self.use_webp = 'webp' in formats
+        # ruta -> (mtime_ns, tamaño, hash): solo se vuelve a leer el archivo si cambió
+        self._hashes: Dict[str, tuple] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def instance(cls) -> 'ThumbnailCache':
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def content_hash(self, path: str) -> Optional[str]:
+        """Hash del contenido de `path` (None si no existe o es demasiado chico para cachear)"""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        if st.st_size < THUMBNAIL_MIN_SOURCE_BYTES:
+            return None
+        with self._lock:
+            memo = self._hashes.get(path)
+        if memo is not None and memo[:2] == (st.st_mtime_ns, st.st_size):
+            return memo[2]
+        digest = hashlib.blake2b(digest_size=16)
+        try:
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                    digest.update(chunk)
+        except OSError:
+            return None
+        value = digest.hexdigest()
+        with self._lock:
+            self._hashes[path] = (st.st_mtime_ns, st.st_size, value)
+        if memo is not None and memo[2] != value:
+            # La fuente cambió: sus miniaturas anteriores ya no sirven
+            self._discard(memo[2])
+        return value
+
+    def _discard(self, digest: str) -> None:
+        for old in self.cache_dir.glob(f'{digest}_*'):
+            try:
+                old.unlink()
+            except OSError:
+                pass
+
+    def _stem(self, digest: str, width: int, height: int, mode) -> str:
+        return f'{digest}_{width}x{height}_{int(mode)}'
+
+    def _find(self, stem: str) -> Optional[Path]:
+        for ext in ('.webp', '.jpg', '.png'):
+            candidate = self.cache_dir / (stem + ext)
+            if candidate.exists():
+                return candidate
+        return None
+
+    def _store(self, stem: str, image: QImage) -> None:
+        if self.use_webp:
+            fmt = 'webp'
+        else:
+            fmt = 'png' if image.hasAlphaChannel() else 'jpg'
+        target = self.cache_dir / f'{stem}.{fmt}'
+        tmp = self.cache_dir / f'{stem}.{threading.get_ident()}.part'
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            if image.save(str(tmp), fmt.upper(), self.quality):
+                os.replace(tmp, target)
+        except OSError as e:
+            print(f'Error guardando miniatura {target.name}: {e}')
+
+    def load(self, path: str, width: int, height: int, mode=Qt.KeepAspectRatioByExpanding) -> QImage:
+        """Como decode_scaled, pero leyendo/generando la miniatura en disco"""
+        digest = self.content_hash(path)
+        if digest is None:
+            return decode_scaled(path, width, height, mode)
+        stem = self._stem(digest, width, height, mode)
+        cached = self._find(stem)
+        if cached is not None:
+            image = QImage(str(cached))
+            if not image.isNull():
+                self.hits += 1
+                return image
+        self.misses += 1
+        image = decode_scaled(path, width, height, mode)
+        if not image.isNull():
+            self._store(stem, image)
+        return image
+
+    def ensure(self, path: str, width: int, height: int, mode=Qt.KeepAspectRatioByExpanding) -> None:
+        """Genera la miniatura si todavía no existe (sin devolverla)"""
+        digest = self.content_hash(path)
+        if digest is None:
+            return
+        stem = self._stem(digest, width, height, mode)
+        if self._find(stem) is None:
+            image = decode_scaled(path, width, height, mode)
+            if not image.isNull():
+                self._store(stem, image)
+
+
+# Presupuesto por defecto de ImageCache (configurable con 'image_cache_mb')
+DEFAULT_CACHE_BUDGET_MB = 64
+
+
+class ImageCache:
+    """Caché LRU de pixmaps escalados, clave (ruta, mtime, tamaño, DPR, modo)"""
+    _instance = None
+
+    def __init__(self, budget_bytes: int = DEFAULT_CACHE_BUDGET_MB * 1024 * 1024):
+        self.budget_bytes = budget_bytes
+        self._entries: 'OrderedDict[tuple, QPixmap]' = OrderedDict()
+        self._costs: Dict[tuple, int] = {}
+        self.used_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def instance(cls) -> 'ImageCache':
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @staticmethod
+    def key(path: str, size: QSize, dpr: float = 1.0, mode=Qt.KeepAspectRatioByExpanding) -> Optional[tuple]:
+        """
+        Clave de caché de una imagen a un tamaño
+
+        Las rutas locales incluyen su mtime, así un archivo reemplazado no
+        reutiliza la versión vieja. Retorna None si la ruta local no existe.
+        """
+        if path.startswith(('http://', 'https://')):
+            mtime = 0
+        else:
+            try:
+                mtime = os.stat(path).st_mtime_ns
+            except OSError:
+                return None
+        return (path, mtime, size.width(), size.height(), round(dpr, 2), int(mode))
+
+    def get(self, key: Optional[tuple]) -> Optional[QPixmap]:
+        if key is None:
+            return None
+        pixmap = self._entries.get(key)
+        if pixmap is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return pixmap
+
+    def put(self, key: Optional[tuple], pixmap: QPixmap) -> None:
+        if key is None or pixmap is None or pixmap.isNull():
+            return
+        cost = pixmap.width() * pixmap.height() * max(1, pixmap.depth()) // 8
+        if cost > self.budget_bytes:
+            return
+        if key in self._entries:
+            self.used_bytes -= self._costs[key]
+        self._entries[key] = pixmap
+        self._entries.move_to_end(key)
+        self._costs[key] = cost
+        self.used_bytes += cost
+        self._evict()
+
+    def pixmap(self, path: str, size: QSize, dpr: float = 1.0, mode=Qt.KeepAspectRatioByExpanding) -> Optional[QPixmap]:
+        """Versión síncrona para imágenes chicas (iconos): cacheada o decodificada aquí mismo"""
+        key = self.key(path, size, dpr, mode)
+        if key is None:
+            return None
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+        physical = QSize(max(1, round(size.width() * dpr)), max(1, round(size.height() * dpr)))
+        image = ThumbnailCache.instance().load(path, physical.width(), physical.height(), mode)
+        if image.isNull():
+            return None
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(dpr)
+        self.put(key, pixmap)
+        return pixmap
+
+    def set_budget(self, budget_bytes: int) -> None:
+        self.budget_bytes = max(0, int(budget_bytes))
+        self._evict()
+
+    def _evict(self) -> None:
+        while self.used_bytes > self.budget_bytes and self._entries:
+            key, _ = self._entries.popitem(last=False)
+            self.used_bytes -= self._costs.pop(key)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._costs.clear()
+        self.used_bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'entries': len(self._entries),
+            'bytes': self.used_bytes,
+            'budget': self.budget_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+
+class _DecodeSignals(QObject):
+    finished = pyqtSignal(int, QImage)  # ticket, imagen (nula si falló o se canceló)
+
+
+class _DecodeTask(QRunnable):
+    def __init__(self, ticket, path, size, mode, signals, cancelled):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.ticket = ticket
+        self.path = path
+        self.size = size
+        self.mode = mode
+        self.signals = signals
+        self.cancelled = cancelled
+
+    def run(self):
+        image = QImage()
+        if self.ticket not in self.cancelled:
+            try:
+                image = ThumbnailCache.instance().load(self.path, self.size.width(), self.size.height(), self.mode)
+            except Exception as e:
+                print(f'Error decodificando imagen {self.path}: {e}')
+        # Siempre avisar para que el servicio libere el pedido
+        self.signals.finished.emit(self.ticket, image)
+
+
+class _ThumbnailTask(QRunnable):
+    def __init__(self, path, size, mode):
+        super().__init__()
+        self.path = path
+        self.size = size
+        self.mode = mode
+
+    def run(self):
+        try:
+            ThumbnailCache.instance().ensure(self.path, self.size.width(), self.size.height(), self.mode)
+        except Exception as e:
+            print(f'Error generando miniatura {self.path}: {e}')
+
+
+class ImageDecoder(QObject):
+    """Decodificación de imágenes locales fuera del hilo de UI"""
+    _instance = None
+
+    def __init__(self, parent=None, max_threads: Optional[int] = None, cache: Optional[ImageCache] = None):
+        super().__init__(parent)
+        self.cache = cache if cache is not None else ImageCache.instance()
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_threads or max(2, min(4, QThread.idealThreadCount())))
+        self._signals = _DecodeSignals()
+        self._signals.finished.connect(self._on_finished)
+        self._callbacks: Dict[int, Tuple[Callable[[QPixmap], None], float, Optional[tuple], Optional[Callable[[], None]]]] = {}
+        self._tasks: Dict[int, _DecodeTask] = {}
+        self._cancelled = set()
+        self._tickets = itertools.count(1)
+
+    @classmethod
+    def instance(cls) -> 'ImageDecoder':
+        """Servicio compartido por toda la aplicación (requiere QApplication)"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def request(self, path: str, size: QSize, callback: Callable[[QPixmap], None],
+                mode=Qt.KeepAspectRatioByExpanding, dpr: float = 1.0, owner: Optional[QObject] = None,
+                failed: Optional[Callable[[], None]] = None) -> int:
+        """
+        Pide decodificar `path` a `size` (en píxeles lógicos)
+
+        Args:
+            callback: Recibe el QPixmap en el hilo de UI (no se llama si falla o se cancela)
+            dpr: devicePixelRatio del destino; se decodifica a size * dpr
+            owner: Widget dueño; si se destruye, el pedido se cancela
+            failed: Se llama si la imagen no se pudo decodificar (no si se cancela)
+
+        Returns:
+            Ticket para cancel(); 0 si la imagen ya estaba en caché y se entregó en el acto
+        """
+        key = self.cache.key(path, size, dpr, mode)
+        cached = self.cache.get(key)
+        if cached is not None:
+            callback(cached)
+            return 0
+        ticket = next(self._tickets)
+        physical = QSize(max(1, round(size.width() * dpr)), max(1, round(size.height() * dpr)))
+        task = _DecodeTask(ticket, path, physical, mode, self._signals, self._cancelled)
+        self._callbacks[ticket] = (callback, dpr, key, failed)
+        self._tasks[ticket] = task
+        if owner is not None:
+            owner.destroyed.connect(lambda *_, t=ticket: self.cancel(t))
+        self.pool.start(task)
+        return ticket
+
+    def warm(self, path: str, size: QSize, mode=Qt.KeepAspectRatioByExpanding, dpr: float = 1.0) -> None:
+        """Genera en segundo plano la miniatura en disco de `path` a `size` (p. ej. tras importar)"""
+        physical = QSize(max(1, round(size.width() * dpr)), max(1, round(size.height() * dpr)))
+        # Prioridad baja: los pedidos de tarjetas visibles van primero
+        self.pool.start(_ThumbnailTask(path, physical, mode), -1)
+
+    def cancel(self, ticket: int) -> None:
+        """Cancela un pedido: si aún no empezó se descarta, si está en curso se ignora el resultado"""
+        if self._callbacks.pop(ticket, None) is None:
+            return
+        task = self._tasks.get(ticket)
+        if task is not None and self.pool.tryTake(task):
+            self._tasks.pop(ticket, None)
+            return
+        self._cancelled.add(ticket)
+
+    def pending(self) -> int:
+        return len(self._tasks)
+
+    def _on_finished(self, ticket, image):
+        self._tasks.pop(ticket, None)
+        self._cancelled.discard(ticket)
+        entry = self._callbacks.pop(ticket, None)
+        if entry is None:
+            return
+        callback, dpr, key, failed = entry
+        if image.isNull():
+            if failed is not None:
+                failed()
+            return
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(dpr)
+        self.cache.put(key, pixmap)
+        try:
+            callback(pixmap)
+        except RuntimeError:
+            # El widget destino ya no existe
+            pass
+
+
+# Carpeta donde se guardan las imágenes remotas descargadas
+REMOTE_CACHE_DIR = Path.home() / '.game_library' / 'remote_images'
+
+
+def remote_cache_path(url: str, cache_dir: Path = REMOTE_CACHE_DIR) -> Path:
+    """Ruta estable en disco para una URL (hash de la URL + extensión original)"""
+    ext = os.path.splitext(url.split('?', 1)[0])[1].lower()
+    if ext not in ('.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp', '.ico'):
+        ext = '.img'
+    return cache_dir / (hashlib.sha1(url.encode('utf-8')).hexdigest() + ext)
+
+
+class _FetchSignals(QObject):
+    finished = pyqtSignal(str, str)  # url, ruta local ('' si falló)
+
+
+class _FetchTask(QRunnable):
+    def __init__(self, url, target, signals):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.url = url
+        self.target = target
+        self.signals = signals
+
+    def run(self):
+        path = ''
+        try:
+            with urllib.request.urlopen(self.url, timeout=10) as response:
+                data = response.read()
+            self.target.parent.mkdir(parents=True, exist_ok=True)
+            # Escritura atómica: nunca queda un archivo a medias en la caché
+            tmp = self.target.with_name(self.target.name + '.part')
+            with open(tmp, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, self.target)
+            path = str(self.target)
+        except Exception as e:
+            print(f"Error al cargar imagen {self.url}: {e}")
+        self.signals.finished.emit(self.url, path)
+
+
+class ImageFetcher(QObject):
+    """Descarga de imágenes remotas con concurrencia acotada, deduplicación y caché en disco"""
+    _instance = None
+
+    def __init__(self, parent=None, max_downloads: int = 4, cache_dir: Path = REMOTE_CACHE_DIR,
+                 decoder: Optional[ImageDecoder] = None):
+        super().__init__(parent)
+        self.cache_dir = Path(cache_dir)
+        self.decoder = decoder
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_downloads)
+        self._signals = _FetchSignals()
+        self._signals.finished.connect(self._on_finished)
+        # URL -> tickets que esperan esa descarga; ticket -> (url, parámetros de decodificación)
+        self._waiting: Dict[str, List[int]] = {}
+        self._requests: Dict[int, tuple] = {}
+        self._tasks: Dict[str, _FetchTask] = {}
+        # Ticket propio -> ticket de ImageDecoder mientras se decodifica el archivo descargado
+        self._decoding: Dict[int, int] = {}
+        self._tickets = itertools.count(1)
+
+    @classmethod
+    def instance(cls) -> 'ImageFetcher':
+        """Servicio compartido por toda la aplicación (requiere QApplication)"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def _decoder(self) -> ImageDecoder:
+        return self.decoder if self.decoder is not None else ImageDecoder.instance()
+
+    def request(self, url: str, size: QSize, callback: Callable[[QPixmap], None],
+                mode=Qt.KeepAspectRatioByExpanding, dpr: float = 1.0, owner: Optional[QObject] = None,
+                failed: Optional[Callable[[], None]] = None) -> int:
+        """
+        Pide una imagen remota decodificada a `size` (mismos argumentos que ImageDecoder.request)
+
+        Si ya está en la caché de disco se decodifica directamente; si otra
+        tarjeta ya la está descargando, el pedido espera esa misma descarga.
+
+        Returns:
+            Ticket para cancel(), válido tanto durante la descarga como durante la decodificación
+        """
+        target = remote_cache_path(url, self.cache_dir)
+        ticket = next(self._tickets)
+        if owner is not None:
+            owner.destroyed.connect(lambda *_, t=ticket: self.cancel(t))
+        if target.exists():
+            self._decode(ticket, str(target), size, callback, mode, dpr, failed)
+            return ticket
+        self._requests[ticket] = (url, size, callback, mode, dpr, failed)
+        waiting = self._waiting.setdefault(url, [])
+        waiting.append(ticket)
+        if url not in self._tasks:
+            # Una sola descarga por URL: si sigue en curso tras cancelarla, este pedido la espera
+            task = _FetchTask(url, target, self._signals)
+            self._tasks[url] = task
+            self.pool.start(task)
+        return ticket
+
+    def _decode(self, ticket, path, size, callback, mode, dpr, failed) -> None:
+        def done(pixmap):
+            self._decoding.pop(ticket, None)
+            callback(pixmap)
+
+        def error():
+            self._decoding.pop(ticket, None)
+            if failed is not None:
+                failed()
+
+        decode_ticket = self._decoder().request(path, size, done, mode, dpr, None, error)
+        if decode_ticket:
+            self._decoding[ticket] = decode_ticket
+
+    def cancel(self, ticket: int) -> None:
+        """Cancela un pedido; la descarga solo se descarta si nadie más la espera y aún no empezó"""
+        decode_ticket = self._decoding.pop(ticket, None)
+        if decode_ticket is not None:
+            self._decoder().cancel(decode_ticket)
+            return
+        entry = self._requests.pop(ticket, None)
+        if entry is None:
+            return
+        url = entry[0]
+        waiting = self._waiting.get(url, [])
+        if ticket in waiting:
+            waiting.remove(ticket)
+        if not waiting:
+            self._waiting.pop(url, None)
+            task = self._tasks.get(url)
+            if task is not None and self.pool.tryTake(task):
+                self._tasks.pop(url, None)
+
+    def pending(self) -> int:
+        """Descargas en curso o en cola"""
+        return len(self._tasks)
+
+    def _on_finished(self, url, path):
+        self._tasks.pop(url, None)
+        for ticket in self._waiting.pop(url, []):
+            entry = self._requests.pop(ticket, None)
+            if entry is None:
+                continue
+            _, size, callback, mode, dpr, failed = entry
+            if not path:
+                if failed is not None:
+                    failed()
+                continue
+            self._decode(ticket, path, size, callback, mode, dpr, failed)
@@ -0,0 +1,141 @@
+"""
+Índice columnar de la biblioteca (NumPy)
+
+Para bibliotecas muy grandes, LibraryQuery guarda los datos de filtro y orden
+como columnas NumPy: código de plataforma, favorito, carpetas como máscara de
+bits, tiempo jugado, timestamps y rango del nombre. Filtrar es aritmética de
+máscaras booleanas y ordenar es indexar con una permutación precalculada por
+modo. Si NumPy no está instalado, HAVE_NUMPY es False y LibraryQuery usa su
+camino en Python puro.
+"""
+from typing import Dict, List, Optional, Sequence
+
+try:
+    import numpy as np
+    HAVE_NUMPY = True
+except ImportError:
+    np = None
+    HAVE_NUMPY = False
+
+
+PLATFORM_CODES = {'Manual': 0, 'Steam': 1, 'Epic': 2}
+
+# Columnas numéricas de orden (el nombre se ordena por rango precalculado)
+SORT_COLUMNS = ('name', 'last_played', 'playtime', 'date_added')
+
+
+class ColumnarIndex:
+    """Columnas NumPy paralelas a la lista de juegos de LibraryQuery (una fila por juego)"""
+
+    def __init__(self, records: Sequence):
+        """
+        Args:
+            records: Registros (_Record de library_query) en el orden de la biblioteca
+        """
+        n = len(records)
+        self.size = n
+        self.platform = np.fromiter((PLATFORM_CODES.get(r.platform, 0) for r in records), dtype=np.int8, count=n)
+        self.favorite = np.fromiter((r.favorite for r in records), dtype=np.bool_, count=n)
+        self.playtime = np.fromiter((r.playtime for r in records), dtype=np.int64, count=n)
+        self.last_played = np.fromiter((r.last_played for r in records), dtype=np.int64, count=n)
+        self.date_added = np.fromiter((r.date_added for r in records), dtype=np.int64, count=n)
+
+        # Rango del nombre normalizado: ordenar texto una sola vez
+        names = [r.name for r in records]
+        ranks = {name: i for i, name in enumerate(sorted(set(names)))}
+        self.name = np.fromiter((ranks[name] for name in names), dtype=np.int64, count=n)
+
+        # Carpetas como bits: carpeta -> (palabra, bit) sobre una matriz n x palabras de uint64
+        self.folder_bits: Dict[str, tuple] = {}
+        for r in records:
+            for folder in r.folders:
+                if folder not in self.folder_bits:
+                    idx = len(self.folder_bits)
+                    self.folder_bits[folder] = (idx // 64, np.uint64(1) << np.uint64(idx % 64))
+        words = max(1, (len(self.folder_bits) + 63) // 64)
+        self.folders = np.zeros((n, words), dtype=np.uint64)
+        for row, r in enumerate(records):
+            for folder in r.folders:
+                word, bit = self.folder_bits[folder]
+                self.folders[row, word] |= bit
+
+        self._orders: Dict[tuple, 'np.ndarray'] = {}
+
+    def update_row(self, row: int, old, new) -> bool:
+        """
+        Actualiza en sitio la fila de un juego modificado
+
+        Returns:
+            False si el cambio no se puede aplicar en sitio (nombre o carpeta nueva)
+            y hay que reconstruir el índice
+        """
+        if old.name != new.name:
+            return False
+        new_folders = set(new.folders) - set(self.folder_bits)
+        if new_folders:
+            return False
+        self.platform[row] = PLATFORM_CODES.get(new.platform, 0)
+        self.favorite[row] = new.favorite
+        self.playtime[row] = new.playtime
+        self.last_played[row] = new.last_played
+        self.date_added[row] = new.date_added
+        self.folders[row] = 0
+        for folder in new.folders:
+            word, bit = self.folder_bits[folder]
+            self.folders[row, word] |= bit
+        for field in SORT_COLUMNS:
+            if getattr(old, field) != getattr(new, field):
+                self._orders.pop((field, False), None)
+                self._orders.pop((field, True), None)
+        return True
+
+    def order(self, field: str, descending: bool) -> 'np.ndarray':
+        """Permutación de filas ordenada por una columna (estable: empates en orden de biblioteca)"""
+        key = (field, descending)
+        perm = self._orders.get(key)
+        if perm is None:
+            column = getattr(self, field)
+            perm = np.argsort(-column if descending else column, kind='stable')
+            self._orders[key] = perm
+        return perm
+
+    def mask(self, favorites: bool = False, folder: Optional[str] = None,
+             platform: Optional[str] = None) -> Optional['np.ndarray']:
+        """Máscara booleana de filas que cumplen los filtros (None = todas)"""
+        result = None
+        if favorites:
+            result = self.favorite.copy()
+        if folder:
+            bits = self.folder_bits.get(folder)
+            if bits is None:
+                return np.zeros(self.size, dtype=np.bool_)
+            word, bit = bits
+            in_folder = (self.folders[:, word] & bit) != 0
+            result = in_folder if result is None else (result & in_folder)
+        if platform:
+            on_platform = self.platform == PLATFORM_CODES.get(platform, -1)
+            result = on_platform if result is None else (result & on_platform)
+        return result
+
+    def select(self, sort: Optional[tuple], favorites: bool = False, folder: Optional[str] = None,
+               platform: Optional[str] = None, rows: Optional[Sequence[int]] = None) -> List[int]:
+        """
+        Filas que cumplen los filtros, ordenadas
+
+        Args:
+            sort: (columna, descendente) o None para el orden de la biblioteca
+            rows: Si se indica, solo se consideran estas filas (p. ej. resultado de una búsqueda)
+        """
+        mask = self.mask(favorites, folder, platform)
+        if rows is not None:
+            rows = np.sort(np.asarray(rows, dtype=np.int64))
+            if mask is not None:
+                rows = rows[mask[rows]]
+            if sort is not None:
+                column = getattr(self, sort[0])[rows]
+                rows = rows[np.argsort(-column if sort[1] else column, kind='stable')]
+            return rows.tolist()
+        perm = self.order(*sort) if sort is not None else np.arange(self.size)
+        if mask is not None:
+            perm = perm[mask[perm]]
+        return perm.tolist()
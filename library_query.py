@@ -0,0 +1,292 @@
+"""
+Consulta de la biblioteca: filtro y orden con claves precalculadas
+
+LibraryQuery guarda, por juego, las claves de orden (nombre normalizado,
+timestamps como enteros, tiempo jugado) y los datos de filtro, calculados una
+sola vez al cargar o al cambiar ese juego. El orden completo de la biblioteca
+para cada modo se cachea y los resultados se memorizan por
+(búsqueda, carpeta, plataforma, favoritos, orden, versión), así que
+re-renderizar por un cambio ajeno a la lista (p. ej. el modo de vista) no
+vuelve a filtrar ni a ordenar. Con bibliotecas grandes y NumPy disponible,
+filtros y orden se resuelven sobre un ColumnarIndex (library_columns).
+
+También mantiene, de forma incremental, qué juegos pertenecen a cada carpeta,
+plataforma y a favoritos, de modo que la barra lateral obtiene la lista de
+carpetas y sus conteos sin recorrer la biblioteca.
+"""
+from collections import OrderedDict, namedtuple
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set
+
+from library_columns import ColumnarIndex, HAVE_NUMPY
+from search_index import SearchIndex, normalize
+
+
+# Modo de orden -> (campo de _Record, descendente). Los campos descendentes son
+# enteros y se ordenan negados, así los empates conservan el orden de la biblioteca
+SORT_MODES = {
+    'name_asc': ('name', False),
+    'last_played_desc': ('last_played', True),
+    'playtime_desc': ('playtime', True),
+    'date_added_desc': ('date_added', True),
+    'date_added_asc': ('date_added', False),
+}
+
+# Cantidad de resultados distintos que se recuerdan
+RESULT_CACHE_SIZE = 16
+
+# A partir de cuántos juegos se usa el índice columnar (si hay NumPy)
+COLUMNAR_MIN_SIZE = 2000
+
+_Record = namedtuple('_Record', 'name last_played playtime date_added platform favorite folders')
+
+
+def timestamp_key(value) -> int:
+    """Fecha ISO como entero (segundos); 0 si falta o no es válida"""
+    if not value:
+        return 0
+    try:
+        return int(datetime.fromisoformat(str(value)).timestamp())
+    except (ValueError, OverflowError, OSError):
+        return 0
+
+
+def platform_of(game: Dict) -> str:
+    if game.get('is_steam_game'):
+        return 'Steam'
+    if game.get('is_epic_game'):
+        return 'Epic'
+    return 'Manual'
+
+
+def make_record(game: Dict) -> _Record:
+    return _Record(
+        name=normalize(game.get('name') or ''),
+        last_played=timestamp_key(game.get('last_played')),
+        playtime=int(game.get('total_play_time', 0) or 0),
+        date_added=timestamp_key(game.get('date_added')),
+        platform=platform_of(game),
+        favorite=bool(game.get('is_favorite', False)),
+        folders=frozenset(game.get('folders') or ()),
+    )
+
+
+class LibraryQuery:
+    """Pipeline de búsqueda, filtros y orden sobre la biblioteca en memoria"""
+
+    def __init__(self, search_index: Optional[SearchIndex] = None):
+        self.search_index = search_index if search_index is not None else SearchIndex()
+        self.version = 0
+        self._games: List[Dict] = []
+        self._records: Dict[str, _Record] = {}
+        self._orders: Dict[str, List[Dict]] = {}
+        self._positions: Optional[Dict[str, int]] = None
+        self._columns: Optional[ColumnarIndex] = None
+        self.use_columns = HAVE_NUMPY
+        self._results: 'OrderedDict[tuple, List[Dict]]' = OrderedDict()
+        # Pertenencia: carpeta / plataforma / favoritos -> ids de juego
+        self._folder_ids: Dict[str, Set[str]] = {}
+        self._platform_ids: Dict[str, Set[str]] = {}
+        self._favorite_ids: Set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._games)
+
+    # Mantenimiento -------------------------------------------------------
+
+    def rebuild(self, games: Iterable[Dict]) -> None:
+        """Recalcula todas las claves (carga de la biblioteca o cambios masivos)"""
+        self._games = list(games)
+        self._records = {g['id']: make_record(g) for g in self._games}
+        self._folder_ids = {}
+        self._platform_ids = {}
+        self._favorite_ids = set()
+        for game_id, record in self._records.items():
+            self._index_membership(game_id, None, record)
+        self._orders = {}
+        self._positions = None
+        self._columns = None
+        self._bump()
+
+    def update(self, game: Dict) -> None:
+        """Agrega un juego nuevo o recalcula solo las claves de un juego modificado"""
+        game_id = game['id']
+        old = self._records.get(game_id)
+        new = make_record(game)
+        if old is None:
+            self._games.append(game)
+            self._orders = {}
+            self._positions = None
+            self._columns = None
+        else:
+            # Solo se descartan los órdenes cuya clave cambió para este juego
+            for mode in list(self._orders):
+                if mode in SORT_MODES and getattr(old, SORT_MODES[mode][0]) != getattr(new, SORT_MODES[mode][0]):
+                    del self._orders[mode]
+            if old == new:
+                return
+            if self._columns is not None and not self._columns.update_row(self._position(game), old, new):
+                self._columns = None
+        self._index_membership(game_id, old, new)
+        self._records[game_id] = new
+        self._bump()
+
+    def remove(self, game_id: str) -> None:
+        """Quita un juego (los órdenes cacheados se filtran sin reordenar)"""
+        old = self._records.pop(game_id, None)
+        if old is None:
+            return
+        self._index_membership(game_id, old, None)
+        self._games = [g for g in self._games if g['id'] != game_id]
+        self._positions = None
+        self._columns = None
+        for mode, order in self._orders.items():
+            self._orders[mode] = [g for g in order if g['id'] != game_id]
+        self._bump()
+
+    def _index_membership(self, game_id: str, old: Optional[_Record], new: Optional[_Record]) -> None:
+        """Mueve un juego entre los conjuntos de carpeta, plataforma y favoritos"""
+        old_folders = old.folders if old else frozenset()
+        new_folders = new.folders if new else frozenset()
+        for folder in old_folders - new_folders:
+            ids = self._folder_ids.get(folder)
+            if ids is not None:
+                ids.discard(game_id)
+                if not ids:
+                    del self._folder_ids[folder]
+        for folder in new_folders - old_folders:
+            self._folder_ids.setdefault(folder, set()).add(game_id)
+        old_platform = old.platform if old else None
+        new_platform = new.platform if new else None
+        if old_platform != new_platform:
+            if old_platform is not None:
+                self._platform_ids.get(old_platform, set()).discard(game_id)
+            if new_platform is not None:
+                self._platform_ids.setdefault(new_platform, set()).add(game_id)
+        if new is not None and new.favorite:
+            self._favorite_ids.add(game_id)
+        else:
+            self._favorite_ids.discard(game_id)
+
+    def _bump(self) -> None:
+        self.version += 1
+        self._results.clear()
+
+    def _sort_key(self, sort_mode: str):
+        field, descending = SORT_MODES[sort_mode]
+        idx = _Record._fields.index(field)
+        records = self._records
+        if descending:
+            return lambda g: -records[g['id']][idx]
+        return lambda g: records[g['id']][idx]
+
+    def _position(self, game: Dict) -> int:
+        if self._positions is None:
+            self._positions = {g['id']: i for i, g in enumerate(self._games)}
+        return self._positions.get(game['id'], len(self._positions))
+
+    def _columns_enabled(self) -> bool:
+        return self.use_columns and HAVE_NUMPY and len(self._games) >= COLUMNAR_MIN_SIZE
+
+    def _column_index(self) -> ColumnarIndex:
+        if self._columns is None:
+            self._columns = ColumnarIndex([self._records[g['id']] for g in self._games])
+        return self._columns
+
+    # Carpetas ------------------------------------------------------------
+
+    def folder_counts(self) -> Dict[str, int]:
+        """Carpetas con al menos un juego y cuántos tiene cada una"""
+        return {folder: len(ids) for folder, ids in self._folder_ids.items()}
+
+    def folder_count(self, folder: str) -> int:
+        return len(self._folder_ids.get(folder, ()))
+
+    def platform_count(self, platform: str) -> int:
+        """Juegos de una plataforma ('Steam', 'Epic' o 'Manual')"""
+        return len(self._platform_ids.get(platform, ()))
+
+    def favorite_count(self) -> int:
+        return len(self._favorite_ids)
+
+    # Consulta ------------------------------------------------------------
+
+    def _order(self, sort_mode: str) -> List[Dict]:
+        """Biblioteca completa en el orden pedido (cacheada por modo)"""
+        order = self._orders.get(sort_mode)
+        if order is None:
+            if sort_mode in SORT_MODES and self._columns_enabled():
+                games = self._games
+                order = [games[i] for i in self._column_index().order(*SORT_MODES[sort_mode]).tolist()]
+            elif sort_mode in SORT_MODES:
+                order = sorted(self._games, key=self._sort_key(sort_mode))
+            else:
+                order = list(self._games)
+            self._orders[sort_mode] = order
+        return order
+
+    def run(self, query: str = '', folder: Optional[str] = None, platform: Optional[str] = None,
+            favorites: bool = False, sort_mode: str = 'name_asc', fuzzy: bool = False) -> List[Dict]:
+        """
+        Juegos que cumplen la búsqueda y los filtros, ya ordenados
+
+        Args:
+            query: Texto de búsqueda (vacío = todos)
+            folder: Carpeta a la que deben pertenecer (None = todas)
+            platform: 'Steam', 'Epic', 'Manual' o None
+            favorites: Solo favoritos
+            sort_mode: Clave de SORT_MODES; se ignora si fuzzy ordena por relevancia
+            fuzzy: Búsqueda aproximada ordenada por relevancia
+
+        Returns:
+            Lista de juegos compartida con la caché: no modificarla
+        """
+        query = normalize(query)
+        ranked = bool(query) and fuzzy
+        key = (query, folder, platform, bool(favorites), sort_mode, ranked, self.version)
+        cached = self._results.get(key)
+        if cached is not None:
+            self._results.move_to_end(key)
+            return cached
+
+        records = self._records
+
+        def keep(game):
+            rec = records.get(game['id'])
+            if rec is None:
+                return False
+            if favorites and not rec.favorite:
+                return False
+            if folder and folder not in rec.folders:
+                return False
+            if platform and rec.platform != platform:
+                return False
+            return True
+
+        columns = self._column_index() if self._columns_enabled() else None
+        games = self._games
+        if query:
+            found = self.search_index.games_for(self.search_index.search(query, fuzzy=ranked))
+            if ranked:
+                result = [g for g in found if keep(g)]
+            elif columns is not None:
+                rows = columns.select(SORT_MODES.get(sort_mode), favorites, folder, platform,
+                                      rows=[self._position(g) for g in found])
+                result = [games[i] for i in rows]
+            else:
+                result = [g for g in found if keep(g)]
+                result.sort(key=self._position)
+                if sort_mode in SORT_MODES:
+                    result.sort(key=self._sort_key(sort_mode))
+        elif not (favorites or folder or platform):
+            result = self._order(sort_mode)
+        elif columns is not None:
+            rows = columns.select(SORT_MODES.get(sort_mode), favorites, folder, platform)
+            result = [games[i] for i in rows]
+        else:
+            result = [g for g in self._order(sort_mode) if keep(g)]
+
+        self._results[key] = result
+        if len(self._results) > RESULT_CACHE_SIZE:
+            self._results.popitem(last=False)
+        return result
@@ -0,0 +1,207 @@
+"""
+Almacén persistente de la biblioteca de juegos (games.json)
+
+El archivo guarda un sobre versionado:
+
+    {"schema_version": N, "games": [...]}
+
+Las migraciones se ejecutan una sola vez, en orden, solo cuando la versión
+guardada es anterior a SCHEMA_VERSION. En estado estable la carga no hace
+ningún arreglo por registro ni reescribe el archivo.
+
+Junto a games.json se guarda games.head.json con la primera pantalla de
+registros en el orden persistido, para pintar la ventana sin esperar a
+parsear la biblioteca completa (ver load_head).
+"""
+import json
+import os
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, List, Dict, Optional, Tuple
+
+
+# Versión actual del esquema de games.json
+SCHEMA_VERSION = 1
+
+
+def write_json_atomic(path: Path, payload, indent=None) -> None:
+    """Escribe JSON en un archivo temporal del mismo directorio y lo reemplaza de forma atómica"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), prefix='.' + path.stem + '-', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, indent=indent, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _migrate_v1_normalize_fields(games: List[Dict]) -> None:
+    """v0 -> v1: completa campos de playtime/favoritos/carpetas y elimina duplicados"""
+    fallback_base = datetime.now()
+    for idx, game in enumerate(games):
+        game.setdefault('is_favorite', False)
+        game.setdefault('total_play_time', 0)
+        game.setdefault('last_played', None)
+        if 'date_added' not in game:
+            # Intentar campos previos; si no, usar orden del archivo como prioridad más antigua
+            ts = game.get('created_at') or game.get('added_at')
+            if not ts:
+                ts = (fallback_base - timedelta(seconds=(len(games) - idx))).isoformat()
+            game['date_added'] = ts
+        folders = game.get('folders')
+        if not isinstance(folders, list):
+            folders = game['folders'] = []
+        if game.get('is_steam_game') and 'Steam' not in folders:
+            folders.append('Steam')
+        if game.get('is_epic_game') and 'Epic' not in folders:
+            folders.append('Epic')
+
+    dedupe_games(games)
+
+
+def dedupe_games(games: List[Dict]) -> bool:
+    """
+    Elimina registros repetidos conservando el primero
+
+    Cuentan como repetidos los que comparten id, steam_appid o epic_app_name.
+    Es una pasada barata que se repite en cada carga completa: las
+    importaciones durante la carga en segundo plano comparan contra una
+    lista parcial y pueden agregar un juego que ya estaba en games.json.
+
+    Returns:
+        True si se quitó algún registro (hay que volver a guardar)
+    """
+    seen = set()
+    deduped = []
+    for game in games:
+        keys = [('id', game.get('id'))]
+        if game.get('steam_appid'):
+            keys.append(('steam', game['steam_appid']))
+        if game.get('epic_app_name'):
+            keys.append(('epic', game['epic_app_name']))
+        if any(key in seen for key in keys):
+            continue
+        seen.update(keys)
+        deduped.append(game)
+    if len(deduped) == len(games):
+        return False
+    games[:] = deduped
+    return True
+
+
+# Migraciones ordenadas: (versión destino, función que muta la lista en sitio)
+MIGRATIONS: List[Tuple[int, Callable[[List[Dict]], None]]] = [
+    (1, _migrate_v1_normalize_fields),
+]
+
+
+class LibraryStore:
+    """Carga y guarda la lista de juegos aplicando migraciones de esquema"""
+
+    def __init__(self, data_file: Path):
+        self.data_file = Path(data_file)
+        self.head_file = self.data_file.with_name(self.data_file.stem + '.head.json')
+        self.schema_version = SCHEMA_VERSION
+
+    def load(self) -> List[Dict]:
+        """
+        Lee games.json y aplica las migraciones pendientes
+
+        Returns:
+            Lista de juegos (vacía si no existe o no se puede leer)
+        """
+        if not self.data_file.exists():
+            return []
+        try:
+            with open(self.data_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except Exception as e:
+            print(f"Error al cargar juegos: {e}")
+            return []
+
+        # Formato heredado: lista plana sin versión
+        if isinstance(data, list):
+            version, games = 0, data
+        else:
+            version = int(data.get('schema_version', 0) or 0)
+            games = list(data.get('games', []) or [])
+
+        if version < SCHEMA_VERSION:
+            for target, migrate in MIGRATIONS:
+                if version < target:
+                    migrate(games)
+                    version = target
+            self.save(games)
+        return games
+
+    def load_head(self) -> Optional[List[Dict]]:
+        """
+        Lee la primera pantalla de registros guardada junto a games.json
+
+        Returns:
+            Lista de registros, o None si no hay cabecera o no corresponde
+            a la versión actual de games.json (en ese caso hay que usar load())
+        """
+        try:
+            with open(self.head_file, 'r', encoding='utf-8') as f:
+                head = json.load(f)
+            st = self.data_file.stat()
+            if (head.get('schema_version') != SCHEMA_VERSION
+                    or head.get('source_mtime_ns') != st.st_mtime_ns
+                    or head.get('source_size') != st.st_size):
+                return None
+            return list(head.get('games', []) or [])
+        except Exception:
+            return None
+
+    def save(self, games: List[Dict], head: Optional[List[Dict]] = None) -> bool:
+        """
+        Guarda la lista de juegos de forma atómica (archivo temporal + replace)
+
+        Args:
+            games: Lista completa de juegos
+            head: Primera pantalla de registros en el orden persistido (opcional)
+
+        Returns:
+            True si games.json quedó escrito (la cabecera es solo una caché)
+        """
+        try:
+            write_json_atomic(self.data_file, {'schema_version': SCHEMA_VERSION, 'games': games}, indent=2)
+        except Exception as e:
+            print(f"Error al guardar juegos: {e}")
+            return False
+        if head is None:
+            # Sin cabecera nueva: invalidar la anterior para no pintar datos viejos
+            try:
+                if self.head_file.exists():
+                    self.head_file.unlink()
+            except OSError:
+                pass
+            return True
+        self.save_head(head, total=len(games))
+        return True
+
+    def has_head(self) -> bool:
+        """True si existe una cabecera válida para el games.json actual"""
+        return self.load_head() is not None
+
+    def save_head(self, head: List[Dict], total: Optional[int] = None) -> None:
+        """Guarda la primera pantalla de registros ligada al games.json actual"""
+        try:
+            st = self.data_file.stat()
+            write_json_atomic(self.head_file, {
+                'schema_version': SCHEMA_VERSION,
+                'source_mtime_ns': st.st_mtime_ns,
+                'source_size': st.st_size,
+                'total': total if total is not None else len(head),
+                'games': head,
+            })
+        except Exception as e:
+            print(f"Error al guardar cabecera de juegos: {e}")
@@ -0,0 +1,368 @@
+"""
+Vista virtualizada de la biblioteca (modelo/vista de Qt)
+
+GameListModel expone la lista filtrada de juegos y GameCardDelegate pinta
+portada, título, tiempo jugado e insignias solo de las filas visibles, sin
+crear un widget por juego. Memoria y tiempo de render se mantienen estables
+aunque la biblioteca crezca. Las portadas e iconos se piden a ImageDecoder /
+ImageFetcher fuera de paint(): mientras llegan se pinta el placeholder y al
+llegar se repinta solo la fila del juego.
+"""
+import time
+
+from PyQt5.QtWidgets import QListView, QStyledItemDelegate, QStyle, QAbstractItemView
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, QSize, QRect, QRectF, pyqtSignal
+from PyQt5.QtGui import QPainter, QPainterPath, QColor, QFont, QLinearGradient, QPen
+
+from i18n import t
+from image_service import ImageCache, ImageDecoder, ImageFetcher, remote_cache_path
+
+
+# Una imagen que no se pudo cargar se vuelve a pedir pasado este tiempo
+# (las locales también si cambia su mtime, que forma parte de la clave)
+IMAGE_RETRY_SECONDS = 60
+
+
+def format_playtime(seconds) -> str:
+    """Formatea segundos como '3h 25m' o '25m'"""
+    seconds = int(seconds or 0)
+    minutes = seconds // 60
+    hours = minutes // 60
+    minutes = minutes % 60
+    if hours:
+        return f"{hours}h {minutes}m"
+    return f"{minutes}m"
+
+
+class GameListModel(QAbstractListModel):
+    """Modelo de lista sobre los juegos ya filtrados y ordenados"""
+    GameRole = Qt.UserRole + 1
+    PlaytimeRole = Qt.UserRole + 2
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._games = []
+        self._rows = {}
+        self._live_playtime = {}
+
+    def set_games(self, games):
+        self.beginResetModel()
+        self._games = list(games)
+        self._rows = {g['id']: i for i, g in enumerate(self._games)}
+        self._live_playtime = {}
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._games)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._games):
+            return None
+        game = self._games[index.row()]
+        if role == Qt.DisplayRole:
+            return game.get('name', '')
+        if role == Qt.ToolTipRole:
+            return game.get('path', '')
+        if role == self.GameRole:
+            return game
+        if role == self.PlaytimeRole:
+            return self._live_playtime.get(game['id'], int(game.get('total_play_time', 0) or 0))
+        return None
+
+    def game_at(self, row):
+        return self._games[row] if 0 <= row < len(self._games) else None
+
+    def row_for_id(self, game_id):
+        return self._rows.get(game_id, -1)
+
+    def refresh_game(self, game_id):
+        """Repinta la fila de un juego tras cambiar sus datos"""
+        row = self.row_for_id(game_id)
+        if row >= 0:
+            idx = self.index(row)
+            self.dataChanged.emit(idx, idx)
+
+    def set_playtime(self, game_id, total_seconds):
+        """Tiempo jugado en vivo (sesión en curso) para una fila; repinta solo si cambia el minuto"""
+        total_seconds = int(total_seconds)
+        previous = self._live_playtime.get(game_id)
+        self._live_playtime[game_id] = total_seconds
+        if previous is None or previous // 60 != total_seconds // 60:
+            self.refresh_game(game_id)
+
+
+class GameCardDelegate(QStyledItemDelegate):
+    """Pinta cada juego como una tarjeta (grid o lista) sin widgets"""
+    GRID_SIZE = QSize(300, 280)
+    LIST_SIZE = QSize(900, 180)
+    COVER_HEIGHT = 176
+    image_ready = pyqtSignal(str)  # id del juego cuya portada o icono ya está en ImageCache
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.list_mode = False
+        self.colors = {}
+        self._fonts = {}
+        self._pending = {}  # clave de ImageCache -> ids de juegos que la esperan
+        self._failed = {}  # clave de ImageCache -> momento del fallo
+
+    def set_list_mode(self, list_mode: bool):
+        self.list_mode = list_mode
+
+    def set_colors(self, colors: dict):
+        """Colores/tipografía del tema (mismas claves que GameCard._custom_colors)"""
+        if colors != self.colors:
+            self.colors = dict(colors or {})
+            self._fonts = {}
+
+    def sizeHint(self, option, index):
+        return self.LIST_SIZE if self.list_mode else self.GRID_SIZE
+
+    def _font(self, size, bold=False):
+        key = (size, bold)
+        if key not in self._fonts:
+            font = QFont(self.colors.get('font_family', 'Segoe UI'), size)
+            if bold:
+                font.setBold(True)
+            self._fonts[key] = font
+        return self._fonts[key]
+
+    def _pixmap(self, game_id, path, width, height, dpr, keep_aspect=Qt.KeepAspectRatioByExpanding):
+        """
+        Imagen escalada desde ImageCache; si no está, se pide en segundo plano y retorna None
+
+        Al llegar se emite image_ready(game_id) para repintar solo esa fila.
+        """
+        if not path:
+            return None
+        size = QSize(width, height)
+        cache = ImageCache.instance()
+        remote = path.startswith(('http://', 'https://'))
+        # ImageFetcher decodifica la copia en disco: la caché la guarda bajo esa ruta, no bajo la URL
+        source = str(remote_cache_path(path, ImageFetcher.instance().cache_dir)) if remote else path
+        key = cache.key(source, size, dpr, keep_aspect)
+        if key is None:
+            if not remote:
+                return None
+            # Todavía sin descargar: el pedido se identifica por la URL
+            key = (path, size.width(), size.height(), round(dpr, 2), int(keep_aspect))
+        pm = cache.get(key)
+        if pm is not None:
+            return pm
+        waiting = self._pending.get(key)
+        if waiting is not None:
+            waiting.add(game_id)
+            return None
+        failed_at = self._failed.get(key)
+        if failed_at is not None:
+            if time.monotonic() - failed_at < IMAGE_RETRY_SECONDS:
+                return None
+            del self._failed[key]
+        self._pending[key] = {game_id}
+        service = ImageFetcher.instance() if remote else ImageDecoder.instance()
+        service.request(path, size, lambda pm, k=key: self._on_image(k), keep_aspect, dpr,
+                        failed=lambda k=key: self._on_image_failed(k))
+        return None
+
+    def _on_image(self, key):
+        for game_id in self._pending.pop(key, ()):
+            self.image_ready.emit(game_id)
+
+    def _on_image_failed(self, key):
+        self._pending.pop(key, None)
+        self._failed[key] = time.monotonic()
+
+    def cover_rect(self, rect: QRect) -> QRect:
+        if self.list_mode:
+            return QRect(rect.x() + 2, rect.y() + 2, 316, self.COVER_HEIGHT)
+        return QRect(rect.x() + 2, rect.y() + 2, rect.width() - 4, self.COVER_HEIGHT)
+
+    def favorite_rect(self, rect: QRect) -> QRect:
+        """Zona clicable del botón de favorito dentro de la tarjeta"""
+        return QRect(rect.right() - 50, rect.y() + 10, 40, 40)
+
+    def paint(self, painter, option, index):
+        game = index.data(GameListModel.GameRole)
+        if not game:
+            return
+        c = self.colors
+        rect = option.rect
+        hovered = bool(option.state & QStyle.State_MouseOver)
+        radius = c.get('card_radius', 12)
+        border_width = c.get('border_width', 2)
+
+        dpr = painter.device().devicePixelRatioF()
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
+
+        # Fondo y borde de la tarjeta
+        card_path = QPainterPath()
+        card_path.addRoundedRect(QRectF(rect).adjusted(1, 1, -1, -1), radius, radius)
+        bg = c.get('card_hover_bg', '#252d3d') if hovered else c.get('card_bg', '#1a1f2e')
+        painter.fillPath(card_path, QColor(bg))
+        border = c.get('card_hover_border', '#667eea') if hovered else c.get('card_border', 'transparent')
+        if border != 'transparent':
+            painter.setPen(QPen(QColor(border), border_width))
+            painter.drawPath(card_path)
+
+        # Portada
+        cover = self.cover_rect(rect)
+        painter.save()
+        painter.setClipPath(card_path)
+        pm = self._pixmap(game['id'], game.get('image') or '', cover.width(), cover.height(), dpr)
+        if pm:
+            painter.drawPixmap(cover.topLeft(), pm)
+        else:
+            grad = QLinearGradient(cover.topLeft(), cover.bottomRight())
+            grad.setColorAt(0, QColor(c.get('accent_start', '#667eea')))
+            grad.setColorAt(1, QColor(c.get('accent_end', '#764ba2')))
+            painter.fillRect(cover, grad)
+            painter.setFont(self._font(36))
+            painter.setPen(QColor('#ffffff'))
+            painter.drawText(cover, Qt.AlignCenter, "🎮")
+        painter.restore()
+
+        text_primary = QColor(c.get('text_primary', '#e8eaed'))
+        text_secondary = QColor(c.get('text_secondary', '#9aa0a6'))
+        title_size = c.get('card_title_size', 15)
+        secondary_size = c.get('secondary_size', 12)
+        playtime = t('label_playtime', value=format_playtime(index.data(GameListModel.PlaytimeRole)))
+
+        if self.list_mode:
+            x = cover.right() + 22
+            text_w = rect.right() - x - 60
+            y = rect.y() + 20
+            painter.setFont(self._font(title_size + 6, True))
+            painter.setPen(text_primary)
+            painter.drawText(QRect(x, y, text_w, 40), Qt.AlignLeft | Qt.AlignVCenter, game.get('name', ''))
+            y += 48
+            painter.setFont(self._font(secondary_size))
+            painter.setPen(text_secondary)
+            painter.drawText(QRect(x, y, text_w, 24), Qt.AlignLeft | Qt.AlignVCenter, playtime)
+            self._paint_badges(painter, game, x, y + 32, 24)
+        else:
+            content_y = cover.bottom() + 15
+            icon_rect = QRect(rect.x() + 15, content_y, 50, 50)
+            icon_bg = QPainterPath()
+            icon_bg.addRoundedRect(QRectF(icon_rect), c.get('button_radius', 8), c.get('button_radius', 8))
+            painter.fillPath(icon_bg, QColor(c.get('card_hover_bg', '#252d3d')))
+            icon = self._pixmap(game['id'], game.get('icon') or '', 42, 42, dpr, Qt.KeepAspectRatio)
+            if icon:
+                # Tamaño lógico: el pixmap viene a 42 * dpr píxeles
+                icon_size = icon.size() / icon.devicePixelRatio()
+                painter.drawPixmap(icon_rect.x() + (50 - icon_size.width()) // 2,
+                                   icon_rect.y() + (50 - icon_size.height()) // 2, icon)
+            else:
+                painter.setFont(self._font(18))
+                painter.setPen(text_primary)
+                painter.drawText(icon_rect, Qt.AlignCenter, "🎮")
+
+            x = icon_rect.right() + 12
+            text_w = rect.right() - x - 10
+            painter.setFont(self._font(title_size, True))
+            painter.setPen(text_primary)
+            title = painter.fontMetrics().elidedText(game.get('name', ''), Qt.ElideRight, text_w)
+            painter.drawText(QRect(x, content_y - 4, text_w, 22), Qt.AlignLeft | Qt.AlignVCenter, title)
+            painter.setFont(self._font(max(1, secondary_size - 1)))
+            painter.setPen(text_secondary)
+            path_text = painter.fontMetrics().elidedText(game.get('path', ''), Qt.ElideMiddle, text_w)
+            painter.drawText(QRect(x, content_y + 18, text_w, 18), Qt.AlignLeft | Qt.AlignVCenter, path_text)
+            painter.drawText(QRect(x, content_y + 36, text_w, 18), Qt.AlignLeft | Qt.AlignVCenter, playtime)
+            self._paint_badges(painter, game, x, content_y + 56, 18)
+
+        # Favorito: visible en hover (como el botón de GameCard) o si está marcado
+        if hovered or game.get('is_favorite'):
+            fav = self.favorite_rect(rect)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor(0, 0, 0, 200))
+            painter.drawEllipse(fav)
+            painter.setFont(self._font(16, True))
+            painter.setPen(QColor('#FFD700'))
+            painter.drawText(fav, Qt.AlignCenter, '⭐' if game.get('is_favorite') else '☆')
+
+        painter.restore()
+
+    def _paint_badges(self, painter, game, x, y, height):
+        badges = []
+        if game.get('is_steam_game'):
+            badges.append(("Steam", '#cfe6ff', '#1b2838', '#2a475e'))
+        if game.get('is_epic_game'):
+            badges.append(("Epic", '#ffffff', '#1a1a1a', '#2d2d2d'))
+        painter.setFont(self._font(9 if height < 24 else 10, True))
+        for text, fg, bg, border in badges:
+            w = painter.fontMetrics().horizontalAdvance(text) + 14
+            badge = QRectF(x, y, w, height)
+            painter.setPen(QPen(QColor(border), 1))
+            painter.setBrush(QColor(bg))
+            painter.drawRoundedRect(badge, 6, 6)
+            painter.setPen(QColor(fg))
+            painter.drawText(badge, Qt.AlignCenter, text)
+            x += w + 6
+
+
+class GameGridView(QListView):
+    """QListView configurado como grid o lista de tarjetas pintadas por GameCardDelegate"""
+    game_activated = pyqtSignal(dict)
+    context_menu_requested = pyqtSignal(dict, object)  # juego, QPoint global
+    favorite_toggled = pyqtSignal(str, bool)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setUniformItemSizes(True)
+        self.setResizeMode(QListView.Adjust)
+        self.setMovement(QListView.Static)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setMouseTracking(True)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setContextMenuPolicy(Qt.DefaultContextMenu)
+        self.setStyleSheet("QListView { background: transparent; border: none; }")
+        self.viewport().setAutoFillBackground(False)
+        self.set_list_mode(False)
+
+    def set_list_mode(self, list_mode: bool):
+        delegate = self.itemDelegate()
+        if isinstance(delegate, GameCardDelegate):
+            delegate.set_list_mode(list_mode)
+        if list_mode:
+            self.setViewMode(QListView.ListMode)
+            self.setFlow(QListView.TopToBottom)
+            self.setWrapping(False)
+            self.setSpacing(10)
+        else:
+            self.setViewMode(QListView.IconMode)
+            self.setFlow(QListView.LeftToRight)
+            self.setWrapping(True)
+            self.setSpacing(10)
+        self.scheduleDelayedItemsLayout()
+
+    def _game_at(self, pos):
+        index = self.indexAt(pos)
+        if not index.isValid():
+            return None, None
+        return index, index.data(GameListModel.GameRole)
+
+    def mouseDoubleClickEvent(self, event):
+        index, game = self._game_at(event.pos())
+        if game:
+            self.game_activated.emit(game)
+            return
+        super().mouseDoubleClickEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        index, game = self._game_at(event.pos())
+        delegate = self.itemDelegate()
+        if game and event.button() == Qt.LeftButton and isinstance(delegate, GameCardDelegate):
+            if delegate.favorite_rect(self.visualRect(index)).contains(event.pos()):
+                self.favorite_toggled.emit(game['id'], not game.get('is_favorite', False))
+                self.viewport().update(self.visualRect(index))
+                return
+        super().mouseReleaseEvent(event)
+
+    def contextMenuEvent(self, event):
+        index, game = self._game_at(event.pos())
+        if game:
+            self.context_menu_requested.emit(game, event.globalPos())
@@ -0,0 +1,95 @@
+"""
+Diario de sesiones de juego (sessions.jsonl)
+
+Mientras un juego está abierto se agregan líneas pequeñas a un archivo
+append-only cada pocos minutos, sin reescribir games.json. Si el launcher
+se cierra de forma inesperada, al siguiente inicio recover() devuelve el
+último tiempo registrado de cada sesión sin terminar para sumarlo a
+total_play_time.
+"""
+import json
+import os
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List
+
+
+# Cada cuánto se registra un checkpoint de la sesión abierta
+CHECKPOINT_INTERVAL_SECONDS = 120
+
+
+class PlaytimeJournal:
+    """Registro append-only de inicio, checkpoints y fin de sesiones de juego"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    def begin(self, game_id: str, start_time: datetime) -> str:
+        """Registra el inicio de una sesión y retorna su id"""
+        session_id = str(uuid.uuid4())
+        self._append({'event': 'start', 'session': session_id, 'game_id': game_id,
+                      'at': start_time.isoformat(), 'elapsed': 0})
+        return session_id
+
+    def checkpoint(self, session_id: str, game_id: str, elapsed: int) -> None:
+        """Registra el tiempo acumulado hasta ahora de una sesión abierta"""
+        self._append({'event': 'checkpoint', 'session': session_id, 'game_id': game_id,
+                      'at': datetime.now().isoformat(), 'elapsed': int(elapsed)})
+
+    def end(self, session_id: str) -> None:
+        """Marca la sesión como terminada (su tiempo ya está en games.json)"""
+        self._append({'event': 'end', 'session': session_id, 'at': datetime.now().isoformat()})
+
+    def recover(self) -> List[Dict]:
+        """
+        Sesiones que no llegaron a terminar
+
+        Returns:
+            Lista de {'session', 'game_id', 'elapsed', 'at'} con el último checkpoint de cada una
+        """
+        if not self.path.exists():
+            return []
+        open_sessions: Dict[str, Dict] = {}
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # Línea truncada por un corte de luz: ignorar
+                        continue
+                    sid = entry.get('session')
+                    if not sid:
+                        continue
+                    if entry.get('event') == 'end':
+                        open_sessions.pop(sid, None)
+                    else:
+                        open_sessions[sid] = {
+                            'session': sid,
+                            'game_id': entry.get('game_id'),
+                            'elapsed': int(entry.get('elapsed', 0) or 0),
+                            'at': entry.get('at'),
+                        }
+        except Exception as e:
+            print(f'Error leyendo diario de sesiones: {e}')
+            return []
+        return [s for s in open_sessions.values() if s['game_id']]
+
+    def clear(self) -> None:
+        """Vacía el diario (todas las sesiones ya están reflejadas en games.json)"""
+        try:
+            if self.path.exists():
+                self.path.unlink()
+        except Exception as e:
+            print(f'Error limpiando diario de sesiones: {e}')
+
+    def _append(self, entry: Dict) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+        except Exception as e:
+            print(f'Error escribiendo diario de sesiones: {e}')
@@ -0,0 +1,193 @@
+"""
+Índice de búsqueda por nombre de juego
+
+Los nombres se normalizan una sola vez (casefold y sin acentos) y se indexan
+por n-gramas de 1 a 3 caracteres, de modo que cada búsqueda solo verifica los
+juegos candidatos en lugar de recorrer toda la biblioteca. El índice se
+mantiene de forma incremental al agregar, editar o eliminar juegos.
+"""
+import unicodedata
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Set
+
+
+# Similitud mínima (Dice sobre bigramas) entre cada palabra de la consulta y
+# alguna palabra del nombre para contar como coincidencia aproximada
+FUZZY_THRESHOLD = 0.6
+
+
+def normalize(text: str) -> str:
+    """Texto en minúsculas (casefold), sin acentos y con espacios simples"""
+    decomposed = unicodedata.normalize('NFKD', text or '')
+    stripped = ''.join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return ' '.join(stripped.casefold().split())
+
+
+def ngrams(text: str, n: int) -> Set[str]:
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+def word_similarity(a: str, b: str) -> float:
+    """Coeficiente de Dice entre los bigramas de dos palabras (con bordes marcados)"""
+    ga = ngrams(f'^{a}$', 2)
+    gb = ngrams(f'^{b}$', 2)
+    return 2 * len(ga & gb) / (len(ga) + len(gb))
+
+
+class SearchIndex:
+    """Índice de n-gramas de los nombres normalizados"""
+
+    def __init__(self, games: Optional[Iterable[Dict]] = None):
+        self._names: Dict[str, str] = {}
+        self._games: Dict[str, Dict] = {}
+        # n -> n-grama -> ids (1 y 2 para consultas cortas y fuzzy, 3 para el resto)
+        self._grams: Dict[int, Dict[str, Set[str]]] = {1: {}, 2: {}, 3: {}}
+        if games is not None:
+            self.rebuild(games)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def rebuild(self, games: Iterable[Dict]) -> None:
+        """Reconstruye el índice completo"""
+        self._names = {}
+        self._games = {}
+        self._grams = {1: {}, 2: {}, 3: {}}
+        for game in games:
+            self.add(game)
+
+    def add(self, game: Dict) -> None:
+        """Indexa un juego nuevo o reindexa uno editado"""
+        game_id = game['id']
+        name = normalize(game.get('name', ''))
+        self._games[game_id] = game
+        if self._names.get(game_id) == name:
+            return
+        self._unindex(game_id)
+        self._names[game_id] = name
+        for n, postings in self._grams.items():
+            for gram in ngrams(name, n):
+                postings.setdefault(gram, set()).add(game_id)
+
+    def remove(self, game_id: str) -> None:
+        """Quita un juego del índice"""
+        self._unindex(game_id)
+        self._games.pop(game_id, None)
+
+    def _unindex(self, game_id: str) -> None:
+        name = self._names.pop(game_id, None)
+        if name is None:
+            return
+        for n, postings in self._grams.items():
+            for gram in ngrams(name, n):
+                ids = postings.get(gram)
+                if ids is not None:
+                    ids.discard(game_id)
+                    if not ids:
+                        del postings[gram]
+
+    def game(self, game_id: str) -> Optional[Dict]:
+        return self._games.get(game_id)
+
+    def games_for(self, ids: Iterable[str]) -> List[Dict]:
+        """Juegos correspondientes a una lista de ids, en el mismo orden"""
+        return [self._games[i] for i in ids if i in self._games]
+
+    # Búsqueda ------------------------------------------------------------
+
+    def _candidates(self, token: str) -> Set[str]:
+        """Ids cuyo nombre podría contener `token` (superconjunto, sin verificar)"""
+        n = min(len(token), 3)
+        postings = self._grams[n]
+        sets = []
+        for key in ngrams(token, n):
+            ids = postings.get(key)
+            if not ids:
+                return set()
+            sets.append(ids)
+        sets.sort(key=len)
+        result = set(sets[0])
+        for ids in sets[1:]:
+            result &= ids
+            if not result:
+                break
+        return result
+
+    def search(self, query: str, fuzzy: bool = False) -> List[str]:
+        """
+        Ids de los juegos cuyo nombre contiene todas las palabras de la consulta
+
+        Args:
+            query: Texto buscado (se normaliza igual que los nombres)
+            fuzzy: Si es True, agrega coincidencias aproximadas (errores de tipeo)
+                y ordena el resultado por relevancia
+
+        Returns:
+            Lista de ids; sin fuzzy el orden no está definido
+        """
+        q = normalize(query)
+        if not q:
+            return list(self._names)
+        tokens = q.split()
+        # Empezar por la palabra más larga: suele dar menos candidatos
+        tokens.sort(key=len, reverse=True)
+        matches = None
+        for token in tokens:
+            cands = self._candidates(token) if matches is None else matches
+            matches = {i for i in cands if token in self._names[i]}
+            if not matches:
+                break
+        matches = matches or set()
+        if not fuzzy:
+            return list(matches)
+
+        scores = {i: self._score(q, tokens, self._names[i]) for i in matches}
+        q_grams = ngrams(q, 2)
+        if len(q) >= 3:
+            # Prefiltro: nombres que comparten al menos la mitad de los bigramas
+            shared = Counter()
+            for gram in q_grams:
+                shared.update(self._grams[2].get(gram, ()))
+            needed = len(q_grams) / 2
+            similarity_cache: Dict[tuple, float] = {}
+            for game_id, count in shared.items():
+                if game_id in scores or count < needed:
+                    continue
+                similarity = self._fuzzy_score(tokens, self._names[game_id], similarity_cache)
+                if similarity >= FUZZY_THRESHOLD:
+                    scores[game_id] = similarity
+        return sorted(scores, key=lambda i: (-scores[i], self._names[i]))
+
+    @staticmethod
+    def _fuzzy_score(tokens: List[str], name: str, cache: Dict[tuple, float]) -> float:
+        """
+        Similitud media de cada palabra de la consulta con su palabra más parecida
+        del nombre (0 si alguna no alcanza el umbral)
+        """
+        words = name.split()
+        total = 0.0
+        for token in tokens:
+            best = 0.0
+            for w in words:
+                key = (token, w)
+                sim = cache.get(key)
+                if sim is None:
+                    sim = cache[key] = word_similarity(token, w)
+                if sim > best:
+                    best = sim
+            if best < FUZZY_THRESHOLD:
+                return 0.0
+            total += best
+        return total / len(tokens)
+
+    @staticmethod
+    def _score(query: str, tokens: List[str], name: str) -> float:
+        """Relevancia de una coincidencia exacta (siempre mayor que cualquier aproximada)"""
+        if name == query:
+            return 4.0
+        if name.startswith(query):
+            return 3.0
+        words = name.split()
+        if all(any(w.startswith(tok) for w in words) for tok in tokens):
+            return 2.0
+        return 1.0
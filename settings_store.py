@@ -0,0 +1,231 @@
+"""
+Configuración de la aplicación (theme.json)
+
+SettingsStore lee theme.json una sola vez al iniciar y mantiene los valores
+en memoria. Los cambios marcan las claves como sucias, notifican a los
+listeners y se guardan de forma diferida (debounce) y atómica, sin volver
+a leer el archivo.
+"""
+import copy
+import json
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from library_store import write_json_atomic
+
+
+# Valores por defecto de cada clave conocida de theme.json
+SETTINGS_DEFAULTS: Dict[str, Any] = {
+    'background_image': '',
+    'background_type': 'static',
+    'background_opacity': 0.15,
+    'background_history': [],
+    'color_scheme': {},
+    'theme': {},
+    'custom_themes': {},
+    'language': 'en',
+    'process_priority': 'normal',
+    'playtime_tracking_enabled': True,
+    'startup_on_boot': False,
+    'startup_on_boot_decided': False,
+    'auto_update_enabled': False,
+    'custom_folders': [],
+    'folder_icons': {},
+    'last_folder': None,
+    'filter_platform': None,
+    'filter_favorites': False,
+    'sort_mode': 'name_asc',
+    'virtualized_view': False,
+    'search_fuzzy': False,
+    'image_cache_mb': 64,
+    'low_power_mode': False,
+    'animation_max_games': 300,
+}
+
+
+# Subsistemas que puede invalidar un cambio de configuración
+INVALIDATE_BACKGROUND = 'background'  # recargar/decodificar imagen, GIF o video de fondo
+INVALIDATE_REPAINT = 'repaint'        # solo repintar (p. ej. opacidad del fondo)
+INVALIDATE_STYLESHEET = 'stylesheet'  # regenerar hojas de estilo de la ventana
+INVALIDATE_CARDS = 'cards'            # reconstruir tarjetas (estilo/tipografía de las cards)
+INVALIDATE_FILTER = 'filter'          # recalcular filtro/orden y re-renderizar la lista
+INVALIDATE_SIDEBAR = 'sidebar'        # reconstruir botones de carpetas
+
+SETTING_INVALIDATES: Dict[str, Set[str]] = {
+    'background_image': {INVALIDATE_BACKGROUND},
+    'background_type': {INVALIDATE_BACKGROUND},
+    'background_opacity': {INVALIDATE_REPAINT},
+    'color_scheme': {INVALIDATE_STYLESHEET, INVALIDATE_CARDS},
+    'theme': {INVALIDATE_STYLESHEET, INVALIDATE_CARDS},
+    'custom_folders': {INVALIDATE_SIDEBAR},
+    'folder_icons': {INVALIDATE_SIDEBAR},
+    'last_folder': {INVALIDATE_FILTER},
+    'filter_platform': {INVALIDATE_FILTER},
+    'filter_favorites': {INVALIDATE_FILTER},
+    'sort_mode': {INVALIDATE_FILTER},
+    'virtualized_view': {INVALIDATE_CARDS},
+    'search_fuzzy': {INVALIDATE_FILTER},
+}
+
+# Claves del tema que afectan a las tarjetas (el resto solo cambia hojas de estilo)
+CARD_THEME_KEYS = {
+    'card_bg', 'card_border', 'card_hover_border', 'card_hover_bg',
+    'text_primary', 'text_secondary', 'accent_start', 'accent_end',
+    'card_radius', 'card_padding', 'button_radius', 'border_width',
+    'font_family', 'card_title_size', 'secondary_size',
+}
+
+
+def invalidations_for(keys: Iterable[str]) -> Set[str]:
+    """Conjunto de subsistemas invalidados por las claves modificadas"""
+    result: Set[str] = set()
+    for key in keys:
+        result |= SETTING_INVALIDATES.get(key, set())
+    return result
+
+
+def theme_invalidations(old_theme: Dict[str, Any], new_theme: Dict[str, Any]) -> Set[str]:
+    """Subsistemas invalidados por un cambio de tema, según qué claves cambiaron"""
+    changed = {k for k in set(old_theme) | set(new_theme) if old_theme.get(k) != new_theme.get(k)}
+    if not changed:
+        return set()
+    result = {INVALIDATE_STYLESHEET}
+    if changed & CARD_THEME_KEYS:
+        result.add(INVALIDATE_CARDS)
+    return result
+
+
+class SettingsStore:
+    """Almacén único de configuración con accesores tipados y guardado diferido"""
+
+    def __init__(self, path: Path, schedule_save: Optional[Callable[[], None]] = None):
+        """
+        Args:
+            path: Ruta a theme.json
+            schedule_save: Callback que programa un flush() diferido (p. ej. QTimer.start).
+                Si es None, cada cambio se guarda inmediatamente.
+        """
+        self.path = Path(path)
+        self.schedule_save = schedule_save
+        self._data: Dict[str, Any] = {}
+        self._dirty: Set[str] = set()
+        self._listeners: List[Callable[[str, Any], None]] = []
+        self.exists = False
+        self.load()
+
+    def load(self) -> None:
+        """Lee theme.json (solo se llama al construir el almacén)"""
+        self._data = {}
+        self._dirty = set()
+        self.exists = self.path.exists()
+        if not self.exists:
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                self._data = data
+        except Exception as e:
+            print(f'Error cargando configuración: {e}')
+
+    # Accesores ---------------------------------------------------------
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Valor crudo de una clave (copia para listas/diccionarios)"""
+        if default is None:
+            default = SETTINGS_DEFAULTS.get(key)
+        value = self._data.get(key, default)
+        if isinstance(value, (list, dict)):
+            return copy.deepcopy(value)
+        return value
+
+    def get_bool(self, key: str, default: Optional[bool] = None) -> bool:
+        return bool(self.get(key, default))
+
+    def get_float(self, key: str, default: Optional[float] = None) -> float:
+        fallback = default if default is not None else SETTINGS_DEFAULTS.get(key, 0.0)
+        try:
+            return float(self.get(key, fallback))
+        except (TypeError, ValueError):
+            return float(fallback)
+
+    def get_str(self, key: str, default: Optional[str] = None) -> str:
+        value = self.get(key, default)
+        return value if isinstance(value, str) else (default or '')
+
+    def get_list(self, key: str) -> list:
+        value = self.get(key)
+        return list(value) if isinstance(value, list) else []
+
+    def get_dict(self, key: str) -> dict:
+        value = self.get(key)
+        return dict(value) if isinstance(value, dict) else {}
+
+    # Cambios -----------------------------------------------------------
+
+    def set(self, key: str, value: Any, notify: bool = True) -> bool:
+        """Cambia una clave. Retorna True si el valor cambió"""
+        return bool(self.update({key: value}, notify=notify))
+
+    def update(self, values: Dict[str, Any], notify: bool = True) -> Set[str]:
+        """
+        Cambia varias claves a la vez
+
+        Returns:
+            Conjunto de claves cuyo valor cambió realmente
+        """
+        changed = set()
+        for key, value in values.items():
+            if key in self._data and self._data[key] == value:
+                continue
+            self._data[key] = copy.deepcopy(value) if isinstance(value, (list, dict)) else value
+            changed.add(key)
+        if not changed:
+            return changed
+        self._dirty |= changed
+        if notify:
+            for key in changed:
+                self._notify(key, self._data[key])
+        if self.schedule_save:
+            self.schedule_save()
+        else:
+            self.flush()
+        return changed
+
+    def add_listener(self, callback: Callable[[str, Any], None]) -> None:
+        """Registra callback(key, value) que se llama por cada clave modificada"""
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[str, Any], None]) -> None:
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify(self, key: str, value: Any) -> None:
+        for callback in list(self._listeners):
+            try:
+                callback(key, value)
+            except Exception as e:
+                print(f'Error notificando cambio de {key}: {e}')
+
+    # Persistencia ------------------------------------------------------
+
+    @property
+    def dirty_keys(self) -> Set[str]:
+        return set(self._dirty)
+
+    def is_dirty(self, keys: Optional[Iterable[str]] = None) -> bool:
+        if keys is None:
+            return bool(self._dirty)
+        return any(k in self._dirty for k in keys)
+
+    def flush(self) -> None:
+        """Guarda theme.json si hay cambios pendientes"""
+        if not self._dirty:
+            return
+        try:
+            write_json_atomic(self.path, self._data, indent=2)
+            self._dirty = set()
+            self.exists = True
+        except Exception as e:
+            print(f'Error guardando configuración: {e}')
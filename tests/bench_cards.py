@@ -0,0 +1,79 @@
+"""
+Benchmark: costo de construir y pulir GameCards
+
+Crea N tarjetas dentro de un contenedor como el del grid y mide, por
+tarjeta, la construcción (GameCard.__init__) y el pulido + primer pintado.
+"compartida" es la hoja de estilo del tema aplicada una vez al contenedor
+(CardTheme); "por tarjeta" aplica la misma hoja a cada GameCard, que es lo que
+Qt tenía que parsear y pulir antes por cada tarjeta.
+
+Uso:
+    python tests\\bench_cards.py [num_tarjetas]
+"""
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from PyQt5.QtWidgets import QApplication, QGridLayout, QWidget
+
+
+def make_games(count):
+    return [{
+        'id': str(i),
+        'name': f'Synthetic Game {i:05d}',
+        'path': f'C:\\Games\\game_{i}\\game.exe',
+        'image': '',
+        'icon': '',
+        'is_steam_game': i % 3 == 0,
+        'is_epic_game': i % 3 == 1,
+        'total_play_time': (i * 37) % 50000,
+    } for i in range(count)]
+
+
+def bench(app, games, list_mode, per_card):
+    from card_style import CardTheme
+    from game_library import GameCard
+    theme = CardTheme.for_colors(GameCard._custom_colors)
+    container = QWidget()
+    container.setObjectName('gamesContainer')
+    if not per_card:
+        container.setStyleSheet(theme.stylesheet)
+    layout = QGridLayout(container)
+    columns = 1 if list_mode else 3
+    start = time.perf_counter()
+    for i, game in enumerate(games):
+        card = GameCard(game, None, list_mode=list_mode)
+        if per_card:
+            card.setStyleSheet(theme.stylesheet)
+        layout.addWidget(card, i // columns, i % columns)
+    built = time.perf_counter()
+    container.adjustSize()
+    container.grab()
+    app.processEvents()
+    painted = time.perf_counter()
+    container.deleteLater()
+    app.processEvents()
+    n = len(games)
+    return (built - start) * 1000 / n, (painted - built) * 1000 / n
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 120
+    os.environ['HOME'] = os.environ['USERPROFILE'] = tempfile.mkdtemp()
+    app = QApplication(sys.argv)
+    games = make_games(count)
+    print(f'{count} tarjetas (mejor de 3, ms por tarjeta)')
+    for list_mode in (False, True):
+        for per_card in (True, False):
+            best = min((bench(app, games, list_mode, per_card) for _ in range(3)), key=sum)
+            mode = 'lista' if list_mode else 'grid'
+            sheet = 'por tarjeta' if per_card else 'compartida'
+            print(f'  {mode:<5} {sheet:<12} construcción {best[0]:6.2f}   pulido+pintado {best[1]:6.2f}   total {sum(best):6.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""
+Benchmark: filtro y orden con índice columnar (NumPy) frente a Python puro
+
+Genera bibliotecas sintéticas y mide LibraryQuery.run con y sin
+ColumnarIndex para varias combinaciones de filtros. "frío" es la primera
+consulta tras cargar (incluye ordenar la biblioteca); "caliente" es la misma
+consulta después de un cambio en un juego (caché de resultados invalidada,
+órdenes ya calculados).
+
+Uso:
+    python tests\\bench_columns.py [tamaños separados por coma]
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from library_columns import HAVE_NUMPY
+from library_query import LibraryQuery
+from search_index import SearchIndex
+
+
+QUERIES = [
+    ('todos, nombre', dict(sort_mode='name_asc')),
+    ('favoritos+Steam, tiempo', dict(favorites=True, platform='Steam', sort_mode='playtime_desc')),
+    ('carpeta, última vez', dict(folder='RPG', sort_mode='last_played_desc')),
+    ('Manual, agregado', dict(platform='Manual', sort_mode='date_added_asc')),
+    ('búsqueda+carpeta, agregado', dict(query='souls', folder='Indie', sort_mode='date_added_desc')),
+]
+
+WORDS = ['Dark', 'Souls', 'Hollow', 'Knight', 'Elden', 'Ring', 'Stardew', 'Valley', 'Portal', 'Half',
+         'Life', 'Witcher', 'Hadès', 'Celeste', 'Factorio', 'Terraria', 'Noita', 'Outer', 'Wilds']
+FOLDERS = ['RPG', 'Indie', 'Co-op', 'Favoritas', 'Pendientes']
+
+
+def make_games(count):
+    rng = random.Random(7)
+    dates = [f'2024-{m:02d}-{d:02d}T{h:02d}:00:00' for m in range(1, 13) for d in range(1, 29) for h in (9, 21)]
+    games = []
+    for i in range(count):
+        platform = i % 3
+        games.append({
+            'id': str(i),
+            'name': f'{rng.choice(WORDS)} {rng.choice(WORDS)} {i}',
+            'is_steam_game': platform == 0,
+            'is_epic_game': platform == 1,
+            'is_favorite': rng.random() < 0.1,
+            'folders': rng.sample(FOLDERS, rng.randint(0, 2)),
+            'total_play_time': rng.randint(0, 500000),
+            'last_played': rng.choice(dates) if rng.random() < 0.6 else None,
+            'date_added': rng.choice(dates),
+        })
+    return games
+
+
+def ms(fn):
+    start = time.perf_counter()
+    result = fn()
+    return (time.perf_counter() - start) * 1000, result
+
+
+def bench(count):
+    games = make_games(count)
+    print(f'\n== {count} juegos ==')
+    index_ms, search_index = ms(lambda: SearchIndex(games))
+    print(f'índice de búsqueda (compartido) en {index_ms:.0f} ms')
+    queries = {}
+    for label, use_columns in (('python', False), ('numpy', True)):
+        if use_columns and not HAVE_NUMPY:
+            print('NumPy no está instalado: se omite el índice columnar')
+            continue
+        q = LibraryQuery(search_index)
+        q.use_columns = use_columns
+        build_ms, _ = ms(lambda: q.rebuild(games))
+        cols_ms = 0.0
+        if use_columns:
+            cols_ms, _ = ms(q._column_index)
+        print(f'[{label}] claves precalculadas en {build_ms:.0f} ms' + (f', columnas en {cols_ms:.0f} ms' if use_columns else ''))
+        queries[label] = q
+        for name, kwargs in QUERIES:
+            cold, result = ms(lambda: q.run(**kwargs))
+            games[0]['total_play_time'] += 1
+            q.update(games[0])
+            warm, result2 = ms(lambda: q.run(**kwargs))
+            print(f'  {name:<28} frío {cold:>9.1f} ms   caliente {warm:>9.1f} ms   ({len(result2)} resultados)')
+    if len(queries) == 2:
+        for name, kwargs in QUERIES:
+            a = [g['id'] for g in queries['python'].run(**kwargs)]
+            b = [g['id'] for g in queries['numpy'].run(**kwargs)]
+            assert a == b, name
+
+
+def main():
+    sizes = [int(s) for s in sys.argv[1].split(',')] if len(sys.argv) > 1 else [10000, 100000, 1000000]
+    for count in sizes:
+        bench(count)
+
+
+if __name__ == '__main__':
+    main()
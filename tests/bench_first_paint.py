@@ -0,0 +1,93 @@
+"""
+Benchmark: tiempo hasta la primera tarjeta (time-to-first-card)
+
+Genera una biblioteca sintética en un HOME temporal y mide cuánto tarda
+GameLibrary en mostrar las primeras tarjetas (GameCard o, por encima de
+VIRTUAL_VIEW_THRESHOLD juegos, filas de la vista virtualizada), primero sin
+cabecera (games.json completo en el hilo de UI) y luego con games.head.json
+(primera pantalla inmediata y resto en segundo plano).
+
+Uso:
+    python tests\\bench_first_paint.py [num_juegos]
+"""
+import os
+import sys
+import json
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from PyQt5.QtWidgets import QApplication, QMessageBox
+
+
+def make_fixture(home: Path, count: int):
+    from library_store import LibraryStore
+    base = home / '.game_library'
+    base.mkdir(parents=True, exist_ok=True)
+    games = []
+    for i in range(count):
+        games.append({
+            'id': str(i),
+            'name': f'Synthetic Game {i:05d}',
+            'path': f'C:\\Games\\game_{i}\\game.exe',
+            'image': '',
+            'icon': '',
+            'is_steam_game': i % 3 == 0,
+            'is_epic_game': i % 3 == 1,
+            'steam_appid': str(i) if i % 3 == 0 else None,
+            'is_favorite': i % 17 == 0,
+            'total_play_time': (i * 37) % 50000,
+            'last_played': None,
+            'date_added': f'2024-01-01T00:00:{i % 60:02d}',
+            'folders': ['Steam'] if i % 3 == 0 else (['Epic'] if i % 3 == 1 else []),
+        })
+    LibraryStore(base / 'games.json').save(games)
+    with open(base / 'theme.json', 'w', encoding='utf-8') as f:
+        json.dump({'startup_on_boot_decided': True, 'language': 'en'}, f)
+
+
+def has_first_card(window, game_library):
+    """Hay tarjetas en pantalla: filas en la vista virtualizada o GameCard en el grid"""
+    if window.games_stack.currentWidget() is window.games_view:
+        return window.games_model.rowCount() > 0
+    return bool(window.games_widget.findChildren(game_library.GameCard))
+
+
+def time_to_first_card(app):
+    import game_library
+    start = time.perf_counter()
+    window = game_library.GameLibrary()
+    while not (window.isVisible() and has_first_card(window, game_library)):
+        app.processEvents()
+        time.sleep(0.001)
+    # Incluir el pintado de esas tarjetas
+    app.processEvents()
+    elapsed = time.perf_counter() - start
+    if window._library_loader:
+        window._library_loader.wait()
+    window.close()
+    window.deleteLater()
+    return elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    home = Path(tempfile.mkdtemp(prefix='ludexhub_bench_'))
+    os.environ['HOME'] = str(home)
+    os.environ['USERPROFILE'] = str(home)
+    make_fixture(home, count)
+
+    app = QApplication(sys.argv)
+    # Evitar diálogos modales de primera ejecución durante la medición
+    QMessageBox.information = staticmethod(lambda *a, **k: QMessageBox.Ok)
+
+    cold = time_to_first_card(app)
+    print(f'{count} juegos, sin cabecera: primera tarjeta en {cold * 1000:.0f} ms')
+    warm = time_to_first_card(app)
+    print(f'{count} juegos, con cabecera: primera tarjeta en {warm * 1000:.0f} ms')
+
+
+if __name__ == '__main__':
+    main()
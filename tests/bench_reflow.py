@@ -0,0 +1,88 @@
+"""
+Benchmark: re-acomodar el grid de tarjetas al cambiar el ancho de la ventana
+
+Crea N tarjetas (como contenedores de 320x300 del grid) y simula un arrastre
+de resize sobre un rango de anchos. "QGridLayout" es lo que haría el grid
+anterior para cambiar de columnas: quitar y volver a agregar cada tarjeta en
+su nueva fila/columna. "CardFlowLayout" solo recalcula la geometría de los
+slots y, mientras no cambie el número de columnas, no mueve ningún widget.
+Se mide solo el layout (sin pintar), en ms por paso del arrastre.
+
+Uso:
+    python tests\\bench_reflow.py [num_tarjetas]
+"""
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from PyQt5.QtCore import QSize
+from PyQt5.QtWidgets import QApplication, QGridLayout, QWidget
+
+
+WIDTHS = list(range(900, 2500, 8))
+
+
+def make_cards(parent, count):
+    cards = []
+    for _ in range(count):
+        card = QWidget(parent)
+        card.setFixedSize(320, 300)
+        cards.append(card)
+    return cards
+
+
+def bench_grid(app, count):
+    container = QWidget()
+    layout = QGridLayout(container)
+    layout.setSpacing(25)
+    cards = make_cards(container, count)
+    columns = 0
+    start = time.perf_counter()
+    for width in WIDTHS:
+        wanted = max(1, (width + 25) // 345)
+        if wanted != columns:
+            columns = wanted
+            for i, card in enumerate(cards):
+                layout.removeWidget(card)
+                layout.addWidget(card, i // columns, i % columns)
+        container.resize(width, container.heightForWidth(width) if container.hasHeightForWidth() else 300)
+        layout.activate()
+    elapsed = time.perf_counter() - start
+    container.deleteLater()
+    app.processEvents()
+    return elapsed * 1000 / len(WIDTHS)
+
+
+def bench_flow(app, count):
+    from card_layout import CardFlowLayout
+    container = QWidget()
+    layout = CardFlowLayout(container, QSize(320, 300))
+    layout.setSpacing(25)
+    for i, card in enumerate(make_cards(container, count)):
+        layout.add_widget(card, i)
+    start = time.perf_counter()
+    for width in WIDTHS:
+        container.resize(width, layout.heightForWidth(width))
+        layout.activate()
+    elapsed = time.perf_counter() - start
+    container.deleteLater()
+    app.processEvents()
+    return elapsed * 1000 / len(WIDTHS)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    os.environ['HOME'] = os.environ['USERPROFILE'] = tempfile.mkdtemp()
+    app = QApplication(sys.argv)
+    print(f'{count} tarjetas, {len(WIDTHS)} pasos de {WIDTHS[0]} a {WIDTHS[-1]} px (mejor de 3, ms por paso)')
+    for name, bench in (('QGridLayout', bench_grid), ('CardFlowLayout', bench_flow)):
+        best = min(bench(app, count) for _ in range(3))
+        print(f'  {name:<15} {best:8.2f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark: latencia tecla-a-resultados de la búsqueda
+
+Genera una biblioteca sintética y mide, para cada prefijo de la consulta
+(como si se escribiera letra por letra), cuánto tarda en obtenerse la lista
+de coincidencias con el recorrido lineal anterior y con SearchIndex
+(exacto y con fuzzy). También mide el costo de construir el índice.
+
+Uso:
+    python tests\\bench_search.py [num_juegos] [consulta]
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from search_index import SearchIndex
+
+
+WORDS = ['The', 'Witcher', 'Wild', 'Hunt', 'Dark', 'Souls', 'Pokémon', 'Légende', 'Zelda', 'Half',
+         'Life', 'Portal', 'Elden', 'Ring', 'Cyberpunk', 'Stardew', 'Valley', 'Hollow', 'Knight',
+         'Celeste', 'Hadès', 'Dead', 'Cells', 'Civilization', 'Age', 'Empires', 'Noita', 'Factorio',
+         'Terraria', 'Outer', 'Wilds', 'Disco', 'Elysium', 'Return', 'Obra', 'Dinn', 'Édition']
+
+
+def make_games(count):
+    rng = random.Random(42)
+    return [{'id': str(i), 'name': ' '.join(rng.choice(WORDS) for _ in range(rng.randint(2, 4))) + f' {i}'}
+            for i in range(count)]
+
+
+def linear_search(games, query):
+    """Implementación anterior: lower() de cada nombre en cada tecla"""
+    return [g for g in games if query in g['name'].lower()]
+
+
+def timed(fn, repeat=5):
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, result
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    query = sys.argv[2] if len(sys.argv) > 2 else 'witcher'
+    games = make_games(count)
+
+    build_ms, index = timed(lambda: SearchIndex(games), repeat=1)
+    print(f'{count} juegos: índice construido en {build_ms:.1f} ms')
+    print(f'{"consulta":<10} {"lineal":>10} {"índice":>10} {"fuzzy":>10} {"exactos":>8} {"aprox.":>8}')
+    totals = [0.0, 0.0, 0.0]
+    for n in range(1, len(query) + 1):
+        prefix = query[:n]
+        lin_ms, lin = timed(lambda: linear_search(games, prefix))
+        idx_ms, found = timed(lambda: index.search(prefix))
+        fz_ms, ranked = timed(lambda: index.search(prefix, fuzzy=True))
+        assert {g['id'] for g in lin} <= set(found)
+        totals[0] += lin_ms
+        totals[1] += idx_ms
+        totals[2] += fz_ms
+        print(f'{prefix:<10} {lin_ms:>8.2f}ms {idx_ms:>8.2f}ms {fz_ms:>8.2f}ms {len(found):>8} {len(ranked):>8}')
+    keys = len(query)
+    print(f'{"media":<10} {totals[0] / keys:>8.2f}ms {totals[1] / keys:>8.2f}ms {totals[2] / keys:>8.2f}ms')
+    print(f'Con debounce, escribir "{query}" dispara 1 render en lugar de {keys}')
+
+
+if __name__ == '__main__':
+    main()
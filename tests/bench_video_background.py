@@ -0,0 +1,121 @@
+"""
+Benchmark: costo en el hilo de la UI de un fondo de video
+
+Genera con OpenCV un video sintético (barra que se desplaza) en un directorio
+temporal y lo reproduce como fondo de una ventana de 1400x700 durante unos
+segundos. "timer en la UI" es lo que hacía el fondo anterior en cada tick:
+leer, convertir a RGB, copiar a QImage y escalar al componer. Con
+"VideoBackgroundDecoder" todo eso ocurre en su hilo y la UI solo toma el frame
+listo y lo compone ya al tamaño de la ventana. Se informa el tiempo de UI por
+frame mostrado y los frames mostrados, descartados y saltados.
+
+Uso:
+    python tests\\bench_video_background.py [ancho alto] [segundos]
+"""
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import cv2
+import numpy as np
+from PyQt5.QtCore import QEventLoop, QSize, QTimer
+from PyQt5.QtGui import QImage
+from PyQt5.QtWidgets import QApplication
+
+
+WINDOW = QSize(1400, 700)
+FPS = 30
+
+
+def make_video(path, width, height, frames=FPS * 2):
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*'MJPG'), FPS, (width, height))
+    bar = max(8, width // 40)
+    for i in range(frames):
+        frame = np.full((height, width, 3), (40, 20, i * 4 % 256), np.uint8)
+        x = i * (width - bar) // frames
+        frame[:, x:x + bar] = 255
+        writer.write(frame)
+    writer.release()
+
+
+def run_for(seconds):
+    loop = QEventLoop()
+    QTimer.singleShot(int(seconds * 1000), loop.quit)
+    loop.exec_()
+
+
+def bench_timer(path, seconds):
+    from background_compositor import BackgroundCompositor
+    compositor = BackgroundCompositor()
+    cap = cv2.VideoCapture(path)
+    ui, shown = [0.0], [0]
+
+    def tick():
+        start = time.perf_counter()
+        ret, frame = cap.read()
+        if not ret:
+            cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            ret, frame = cap.read()
+        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        h, w, _ = frame.shape
+        compositor.set_source(QImage(frame.data, w, h, 3 * w, QImage.Format_RGB888).copy())
+        compositor.pixmap(WINDOW, 1.0, 0.15)
+        ui[0] += time.perf_counter() - start
+        shown[0] += 1
+
+    timer = QTimer()
+    timer.timeout.connect(tick)
+    timer.start(1000 // FPS)
+    run_for(seconds)
+    timer.stop()
+    cap.release()
+    return ui[0] * 1000 / max(1, shown[0]), shown[0], 0, 0
+
+
+def bench_thread(path, seconds):
+    from background_compositor import BackgroundCompositor
+    from video_background import VideoBackgroundDecoder
+    compositor = BackgroundCompositor()
+    decoder = VideoBackgroundDecoder(path, WINDOW)
+    ui, shown, held = [0.0], [0], [None]
+
+    def on_frame():
+        start = time.perf_counter()
+        frame = decoder.take_frame()
+        if frame is None:
+            return
+        held[0] = frame
+        compositor.set_source(frame.image)
+        compositor.pixmap(WINDOW, 1.0, 0.15)
+        ui[0] += time.perf_counter() - start
+        shown[0] += 1
+
+    decoder.frame_ready.connect(on_frame)
+    decoder.start()
+    run_for(seconds)
+    decoder.stop()
+    stats = decoder.stats()
+    return ui[0] * 1000 / max(1, shown[0]), shown[0], stats['dropped'], stats['skipped']
+
+
+def main():
+    args = [int(a) for a in sys.argv[1:]]
+    width, height = (args[0], args[1]) if len(args) >= 2 else (1920, 1080)
+    seconds = args[2] if len(args) >= 3 else 3
+    os.environ['HOME'] = os.environ['USERPROFILE'] = tempfile.mkdtemp()
+    app = QApplication(sys.argv)  # noqa: F841 (sin referencia se destruye y el benchmark no termina)
+    path = os.path.join(os.environ['HOME'], 'fondo.avi')
+    make_video(path, width, height)
+    print(f'Video {width}x{height} a {FPS} fps, ventana {WINDOW.width()}x{WINDOW.height()}, {seconds} s')
+    print(f'  {"":<22} {"ms UI/frame":>11} {"mostrados":>10} {"descartados":>12} {"saltados":>9}')
+    for name, bench in (('timer en la UI', bench_timer), ('VideoBackgroundDecoder', bench_thread)):
+        ms, shown, dropped, skipped = bench(path, seconds)
+        print(f'  {name:<22} {ms:11.2f} {shown:10d} {dropped:12d} {skipped:9d}')
+
+
+if __name__ == '__main__':
+    main()
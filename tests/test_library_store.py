@@ -0,0 +1,61 @@
+"""
+Tests de LibraryStore: migración de games.json y eliminación de duplicados
+
+Se ejecutan con pytest; cada test usa su propio games.json en tmp_path.
+"""
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from library_store import SCHEMA_VERSION, LibraryStore, dedupe_games
+
+
+def write_games(path, payload):
+    path.write_text(json.dumps(payload), encoding='utf-8')
+
+
+def test_migration_drops_duplicate_ids(tmp_path):
+    data_file = tmp_path / 'games.json'
+    write_games(data_file, [
+        {'id': '1', 'name': 'Primero'},
+        {'id': '2', 'name': 'Steam', 'is_steam_game': True, 'steam_appid': '440'},
+        {'id': '1', 'name': 'Copia del primero'},
+        {'id': '3', 'name': 'Mismo appid', 'is_steam_game': True, 'steam_appid': '440'},
+        {'id': '4', 'name': 'Otro'},
+    ])
+
+    games = LibraryStore(data_file).load()
+
+    assert [g['id'] for g in games] == ['1', '2', '4']
+    assert games[0]['name'] == 'Primero'
+    assert games[1]['folders'] == ['Steam']
+    saved = json.loads(data_file.read_text(encoding='utf-8'))
+    assert saved['schema_version'] == SCHEMA_VERSION
+    assert [g['id'] for g in saved['games']] == ['1', '2', '4']
+
+
+def test_current_schema_is_loaded_as_is(tmp_path):
+    data_file = tmp_path / 'games.json'
+    games = [{'id': '1', 'name': 'A'}, {'id': '1', 'name': 'B'}]
+    write_games(data_file, {'schema_version': SCHEMA_VERSION, 'games': games})
+    mtime = data_file.stat().st_mtime_ns
+
+    # Sin migraciones pendientes no se toca el archivo; el llamador hace dedupe_games
+    assert LibraryStore(data_file).load() == games
+    assert data_file.stat().st_mtime_ns == mtime
+
+
+def test_dedupe_games_keeps_first_of_each_key():
+    games = [
+        {'id': 'a', 'epic_app_name': 'Fortnite'},
+        {'id': 'b', 'steam_appid': '10'},
+        {'id': 'c', 'epic_app_name': 'Fortnite'},
+        {'id': 'b', 'name': 'mismo id'},
+        {'id': 'd', 'steam_appid': '10'},
+        {'id': 'e'},
+    ]
+    assert dedupe_games(games)
+    assert [g['id'] for g in games] == ['a', 'b', 'e']
+    assert not dedupe_games(games)
@@ -0,0 +1,97 @@
+"""
+Tests de GameCardDelegate: portadas asíncronas de la vista virtualizada
+
+Se ejecutan con pytest (QT_QPA_PLATFORM=offscreen si no hay pantalla).
+Las portadas remotas se sirven desde un servidor HTTP local.
+"""
+import functools
+import http.server
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtCore import QCoreApplication
+from PyQt5.QtGui import QColor, QImage
+from PyQt5.QtWidgets import QApplication
+
+import image_service
+from image_service import ImageCache, ImageDecoder, ImageFetcher
+from library_view import GameCardDelegate
+
+
+@pytest.fixture(scope='module')
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+@pytest.fixture
+def services(app, tmp_path):
+    """ImageCache, ImageDecoder e ImageFetcher propios del test (caché en tmp_path)"""
+    saved = ImageCache._instance, ImageDecoder._instance, ImageFetcher._instance
+    ImageCache._instance = ImageCache()
+    ImageDecoder._instance = ImageDecoder(cache=ImageCache._instance)
+    ImageFetcher._instance = ImageFetcher(cache_dir=tmp_path / 'remote')
+    yield
+    ImageCache._instance, ImageDecoder._instance, ImageFetcher._instance = saved
+
+
+@pytest.fixture
+def cover_url(tmp_path):
+    """URL http de una portada chica servida localmente"""
+    root = tmp_path / 'www'
+    root.mkdir()
+    image = QImage(64, 48, QImage.Format_RGB32)
+    image.fill(QColor('red'))
+    image.save(str(root / 'cover.png'))
+
+    class Handler(http.server.SimpleHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(
+        ('127.0.0.1', 0), functools.partial(Handler, directory=str(root)))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f'http://127.0.0.1:{server.server_port}/cover.png'
+    server.shutdown()
+    server.server_close()
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        QCoreApplication.processEvents()
+        time.sleep(0.01)
+    return condition()
+
+
+def test_remote_cover_is_drawn_after_fetch(services, cover_url):
+    delegate = GameCardDelegate()
+    ready = []
+    delegate.image_ready.connect(ready.append)
+
+    # Primer pintado: todavía no está, se pide en segundo plano
+    assert delegate._pixmap('g1', cover_url, 32, 24, 1.0) is None
+    assert wait_for(lambda: ready == ['g1'])
+
+    # Segundo pintado: sale de ImageCache sin volver a pedirla
+    pixmap = delegate._pixmap('g1', cover_url, 32, 24, 1.0)
+    assert pixmap is not None and not pixmap.isNull()
+    QCoreApplication.processEvents()
+    assert ready == ['g1']
+    assert image_service.ImageFetcher.instance().pending() == 0
+
+
+def test_failed_remote_cover_is_not_requested_every_paint(services, cover_url):
+    delegate = GameCardDelegate()
+    missing = cover_url.replace('cover.png', 'missing.png')
+    delegate._pixmap('g1', missing, 32, 24, 1.0)
+    assert wait_for(lambda: delegate._failed)
+    assert delegate._pixmap('g1', missing, 32, 24, 1.0) is None
+    assert ImageFetcher.instance().pending() == 0
@@ -0,0 +1,203 @@
+"""
+Fondo de video decodificado fuera del hilo de la UI
+
+VideoBackgroundDecoder lee el video con OpenCV en su propio hilo, escala cada
+frame al tamaño físico de la ventana (cubriéndola, anclado arriba a la
+izquierda como el resto de fondos) y lo escribe directamente en uno de tres
+buffers NumPy fijos. Cada buffer tiene su QImage apuntando a esa misma
+memoria, así que publicar un frame no copia nada: la UI solo recibe
+`frame_ready`, toma el último frame listo y lo pasa al compositor.
+
+Los tres buffers funcionan como triple buffer: uno lo muestra la UI, otro es
+el último frame listo y en el tercero escribe el decodificador. Si la UI no
+alcanzó a tomar un frame, el siguiente lo reemplaza (se descarta, no se
+encola); si el decodificador se atrasa respecto de los fps del video, salta
+frames con grab() sin decodificarlos.
+"""
+import threading
+import time
+from typing import Dict, List, Optional
+
+from PyQt5.QtCore import QSize, QThread, pyqtSignal
+from PyQt5.QtGui import QImage
+
+try:
+    import cv2
+    import numpy as np
+    HAVE_CV2 = True
+except ImportError:
+    cv2 = None
+    np = None
+    HAVE_CV2 = False
+
+
+RING_SIZE = 3
+DEFAULT_FPS = 30
+MAX_FPS = 120
+# Sin formato BGR (Qt < 5.14) se convierte a RGB en el mismo buffer
+_FORMAT = getattr(QImage, 'Format_BGR888', None)
+
+
+class VideoFrame:
+    """Buffer del anillo y la QImage que lo envuelve (sin copia)"""
+    __slots__ = ('buffer', 'image', 'index')
+
+    def __init__(self, height: int, width: int, size: QSize):
+        self.buffer = np.empty((height, width, 3), np.uint8)
+        fmt = _FORMAT if _FORMAT is not None else QImage.Format_RGB888
+        # El buffer puede ser más grande que la ventana: la QImage toma solo la esquina superior izquierda
+        self.image = QImage(self.buffer.data, size.width(), size.height(), self.buffer.strides[0], fmt)
+        self.index = -1
+
+
+class VideoBackgroundDecoder(QThread):
+    """Hilo que decodifica un video en bucle al tamaño de la ventana"""
+    frame_ready = pyqtSignal()
+
+    def __init__(self, path: str, size: QSize, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._running = True
+        self._paused = False
+        self._target = QSize(max(1, size.width()), max(1, size.height()))
+        self._frames: List[VideoFrame] = []
+        self._shown: Optional[VideoFrame] = None  # En pantalla: no se escribe
+        self._ready: Optional[VideoFrame] = None  # Último frame listo sin tomar
+        self.decoded = 0
+        self.dropped = 0  # Listos que la UI no llegó a tomar
+        self.skipped = 0  # Saltados con grab() por ir atrasado
+
+    # --- Control desde la UI ---
+
+    def set_target_size(self, size: QSize) -> None:
+        """Tamaño físico (px) de la ventana; se aplica desde el próximo frame"""
+        with self._lock:
+            self._target = QSize(max(1, size.width()), max(1, size.height()))
+
+    def set_paused(self, paused: bool) -> None:
+        self._paused = paused
+        if not paused:
+            self._wake.set()
+
+    def is_paused(self) -> bool:
+        return self._paused
+
+    def stop(self) -> None:
+        """Detiene el hilo y espera a que libere el video"""
+        self._running = False
+        self._wake.set()
+        self.wait()
+
+    def take_frame(self) -> Optional[VideoFrame]:
+        """
+        Último frame listo (None si no hay uno nuevo)
+
+        El frame queda reservado para la UI hasta la siguiente llamada; hay que
+        conservar la referencia mientras su `image` se esté mostrando.
+        """
+        with self._lock:
+            frame, self._ready = self._ready, None
+            if frame is not None:
+                self._shown = frame
+            return frame
+
+    def stats(self) -> Dict[str, int]:
+        return {'decoded': self.decoded, 'dropped': self.dropped, 'skipped': self.skipped}
+
+    # --- Hilo ---
+
+    def run(self):
+        if cv2 is None:
+            print('OpenCV no está instalado; fondo de video no disponible')
+            return
+        cap = cv2.VideoCapture(self.path)
+        try:
+            if not cap.isOpened():
+                print(f'No se pudo abrir el video: {self.path}')
+                return
+            fps = cap.get(cv2.CAP_PROP_FPS) or 0
+            if fps <= 1 or fps > MAX_FPS:
+                fps = DEFAULT_FPS
+            self._play(cap, 1.0 / fps)
+        except Exception as e:
+            print(f'Error decodificando video {self.path}: {e}')
+        finally:
+            cap.release()
+
+    def _play(self, cap, period: float) -> None:
+        due = time.perf_counter()
+        while self._running:
+            if self._paused:
+                self._wake.clear()
+                if self._paused:
+                    self._wake.wait()
+                # Al reanudar se sigue desde el mismo frame, sin intentar recuperar lo pausado
+                due = time.perf_counter()
+                continue
+            late = time.perf_counter() - due
+            if late > period:
+                # Atrasado: saltar frames sin decodificarlos en vez de acumular retraso
+                behind = int(late / period)
+                for _ in range(behind):
+                    if not self._grab(cap):
+                        return
+                self.skipped += behind
+                due += behind * period
+            if not self._grab(cap):
+                return
+            ok, source = cap.retrieve()
+            if not ok:
+                return
+            self._publish(source)
+            due += period
+            wait = due - time.perf_counter()
+            if wait > 0:
+                self._wake.clear()
+                self._wake.wait(wait)
+
+    @staticmethod
+    def _grab(cap) -> bool:
+        """Avanza un frame; al final del video vuelve al principio"""
+        if cap.grab():
+            return True
+        cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+        return cap.grab()
+
+    def _publish(self, source) -> None:
+        frame = self._writable(source)
+        height, width = frame.buffer.shape[:2]
+        scale = max(width / source.shape[1], height / source.shape[0])
+        interpolation = cv2.INTER_AREA if scale < 1 else cv2.INTER_LINEAR
+        cv2.resize(source, (width, height), dst=frame.buffer, interpolation=interpolation)
+        if _FORMAT is None:
+            cv2.cvtColor(frame.buffer, cv2.COLOR_BGR2RGB, dst=frame.buffer)
+        self.decoded += 1
+        frame.index = self.decoded
+        with self._lock:
+            pending = self._ready is not None
+            if pending:
+                self.dropped += 1
+            self._ready = frame
+        if not pending:
+            # Si ya había uno sin tomar, la señal anterior todavía no se atendió
+            self.frame_ready.emit()
+
+    def _writable(self, source) -> VideoFrame:
+        """Buffer del anillo que no está en pantalla ni pendiente, del tamaño actual"""
+        with self._lock:
+            target = QSize(self._target)
+            source_h, source_w = source.shape[:2]
+            # Cubrir la ventana conservando la proporción (como KeepAspectRatioByExpanding)
+            scale = max(target.width() / source_w, target.height() / source_h)
+            width = max(target.width(), round(source_w * scale))
+            height = max(target.height(), round(source_h * scale))
+            first = self._frames[0] if self._frames else None
+            if first is None or first.buffer.shape[:2] != (height, width) or first.image.size() != target:
+                # Tamaño nuevo: buffers nuevos; la UI conserva el que está mostrando
+                self._frames = [VideoFrame(height, width, target) for _ in range(RING_SIZE)]
+            for frame in self._frames:
+                if frame is not self._shown and frame is not self._ready:
+                    return frame
+            return self._frames[-1]